@@ -0,0 +1,149 @@
+"""
+bench_agent_api.py
+────────────────────────────────────────────────────────────────────────────
+p50 / p99 latency of POST /agent/run against a local stub of the OpenAI
+chat-completions API: the old handler (a new agent and HTTP client on every
+request) versus the control plane app (agent and connection pool built once
+at startup by its lifespan, runs offloaded to the agent thread pool).
+Requests go through the ASGI app in-process with `--concurrency` in flight.
+
+The agent is a stand-in that makes one chat-completions call per run over
+the HTTP client it was built with, so only the client / pool reuse and the
+offloading are measured (not LangChain itself, nor agent construction).
+
+Usage:
+    python -m benchmarks.bench_agent_api [--requests 200] [--concurrency 8] [--llm-latency-ms 20]
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, List
+
+import httpx
+from fastapi import FastAPI
+
+from src.src import api
+
+_COMPLETION = {
+    "id": "chatcmpl-stub",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "gpt-4",
+    "choices": [
+        {"index": 0, "message": {"role": "assistant", "content": "Done."}, "finish_reason": "stop"}
+    ],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+}
+
+
+def _stub_llm(latency_s: float) -> ThreadingHTTPServer:
+    """A chat-completions endpoint that answers "Done." (no tool call) after `latency_s`."""
+    body = json.dumps(_COMPLETION).encode()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, so a connection pool pays off
+
+        def do_POST(self) -> None:
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            time.sleep(latency_s)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class StubAgent:
+    """One chat-completions round-trip per run, like an agent that answers directly."""
+
+    def __init__(self, base_url: str, http_client: httpx.Client):
+        self.url = f"{base_url}/chat/completions"
+        self.http_client = http_client
+
+    def run(self, task: str) -> str:
+        response = self.http_client.post(
+            self.url, json={"model": "gpt-4", "messages": [{"role": "user", "content": task}]}
+        )
+        response.raise_for_status()
+        return response.json()["choices"][0]["message"]["content"]
+
+
+def _cold_app(base_url: str) -> FastAPI:
+    """The previous /agent/run: a sync handler that builds a client and agent per request."""
+    cold = FastAPI()
+
+    @cold.post("/agent/run")
+    def run_mcp_agent(request: api.AgentRequest):
+        with httpx.Client() as http_client:
+            result = StubAgent(base_url, http_client).run(request.task)
+        return {"status": "success", "agent_output": result}
+
+    return cold
+
+
+async def _drive(app: FastAPI, requests: int, concurrency: int) -> List[float]:
+    latencies: List[float] = []
+    slots = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+
+        async def one(i: int) -> None:
+            async with slots:
+                start = time.perf_counter()
+                response = await client.post("/agent/run", json={"task": f"Summarize run {i}."})
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - start)
+
+        await asyncio.gather(*(one(i) for i in range(requests)))
+    return latencies
+
+
+async def _run(app: FastAPI, requests: int, concurrency: int, lifespan: bool) -> List[float]:
+    if not lifespan:
+        return await _drive(app, requests, concurrency)
+    async with api.lifespan(app):  # ASGITransport does not send lifespan events
+        return await _drive(app, requests, concurrency)
+
+
+def _report(label: str, latencies: List[float], wall_s: float) -> None:
+    ordered = sorted(latencies)
+    p50 = ordered[len(ordered) // 2] * 1000
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000
+    print(f"{label:<28} {p50:>9.1f} {p99:>9.1f} {len(ordered) / wall_s:>10.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[3])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--llm-latency-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    server = _stub_llm(args.llm_latency_ms / 1000)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    api.build_agent = lambda http_client: StubAgent(base_url, http_client)
+
+    print(f"{'app':<28} {'p50 ms':>9} {'p99 ms':>9} {'req/s':>10}")
+    for label, app, lifespan in (
+        ("build per request (old)", _cold_app(base_url), False),
+        ("warm shared agent", api.app, True),
+    ):
+        start = time.perf_counter()
+        latencies = asyncio.run(_run(app, args.requests, args.concurrency, lifespan))
+        _report(label, latencies, time.perf_counter() - start)
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
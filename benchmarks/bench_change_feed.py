@@ -0,0 +1,77 @@
+"""
+bench_change_feed.py
+────────────────────────────────────────────────────────────────────────────
+Cost of one dashboard poll after 100 objects changed, for growing registry
+sizes: re-serializing every object versus `ObjectRegistry.changes(cursor)`
+plus serializing only what it returns. Also reports the per-call cost the
+change tracking adds to a state-changing method (`VendingMachine.restock`).
+
+Usage:
+    python -m benchmarks.bench_change_feed [--sizes 10000 100000 300000] [--dirty 100]
+"""
+
+import argparse
+import time
+from typing import Callable
+
+from loguru import logger
+
+from src.core import telemetry
+from src.core.base_model import BaseModel
+from src.core.object_registry import ObjectRegistry
+from src.core.serialization import serialize
+from src.oop_labs.vending_machine import VendingMachine
+
+
+def _ms(fn: Callable[[], object], repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[3])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 300_000])
+    parser.add_argument("--dirty", type=int, default=100)
+    args = parser.parse_args()
+    logger.disable("src")
+    telemetry.configure(enabled=False)
+
+    print(f"{'objects':>10} {'full re-serialize ms':>22} {'changes() + serialize ms':>26}")
+    for size in args.sizes:
+        ObjectRegistry.clear()
+        machines = [VendingMachine(f"vm{i}", initial_inventory=10) for i in range(size)]
+        step = size // args.dirty
+
+        cursor = [ObjectRegistry.changes().cursor]
+
+        def poll() -> None:
+            for vm in machines[::step]:
+                vm.restock(1)
+            feed = ObjectRegistry.changes(cursor[0])
+            assert len(feed.changed) == len(machines[::step])
+            [serialize(o) for o in feed.changed]
+            cursor[0] = feed.cursor
+
+        full = _ms(lambda: [serialize(o) for o in ObjectRegistry.snapshot()])
+        print(f"{size:>10,} {full:>22.1f} {_ms(poll):>26.2f}")
+
+    vm = machines[0]
+    n = 200_000
+    tracked = _ms(lambda: [vm.restock(1) for _ in range(n)], repeat=1)
+    hook, BaseModel._on_changed = BaseModel._on_changed, None
+    untracked = _ms(lambda: [vm.restock(1) for _ in range(n)], repeat=1)
+    BaseModel._on_changed = hook
+    print(
+        f"restock(): {untracked * 1e6 / n / 1000:.2f} us without the feed hook, "
+        f"{tracked * 1e6 / n / 1000:.2f} us with it"
+    )
+    ObjectRegistry.clear()
+    telemetry.configure(enabled=True)
+
+
+if __name__ == "__main__":
+    main()
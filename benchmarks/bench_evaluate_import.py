@@ -0,0 +1,60 @@
+"""
+bench_evaluate_import.py
+────────────────────────────────────────────────────────────────────────────
+Import time of `pipelines.evaluate` in a fresh interpreter, median of
+`--runs` subprocesses (interpreter start-up excluded). Exits non-zero when
+the median exceeds `--budget-ms` or when nltk / openai / rouge_score were
+imported eagerly, so `make bench` fails if heavy work creeps back into
+module import.
+
+Usage:
+    python -m benchmarks.bench_evaluate_import [--runs 5] [--budget-ms 500]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+HEAVY = ("nltk", "openai", "rouge_score")
+
+_PROBE = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "import pipelines.evaluate\n"
+    "elapsed = time.perf_counter() - start\n"
+    f"heavy = [m for m in {HEAVY!r} if m in sys.modules]\n"
+    "print(elapsed, *heavy)\n"
+)
+
+
+def _import_once() -> tuple:
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE], capture_output=True, text=True, check=True
+    ).stdout.split()
+    return float(out[0]) * 1000, out[1:]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[3])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=500.0)
+    args = parser.parse_args()
+
+    timings, heavy = [], set()
+    for _ in range(args.runs):
+        ms, loaded = _import_once()
+        timings.append(ms)
+        heavy.update(loaded)
+
+    median = statistics.median(timings)
+    print(f"import pipelines.evaluate: median {median:.1f} ms over {args.runs} runs "
+          f"(min {min(timings):.1f}, max {max(timings):.1f}; budget {args.budget_ms:.0f} ms)")
+    if heavy:
+        print(f"eagerly imported: {', '.join(sorted(heavy))}")
+    if median > args.budget_ms or heavy:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
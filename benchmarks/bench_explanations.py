@@ -0,0 +1,79 @@
+"""
+bench_explanations.py
+────────────────────────────────────────────────────────────────────────────
+Wall time to explain every object of a registry against a fake LLM backend
+with a fixed per-request latency: one request per object awaited in turn
+(the old `explain()` path), the batched ExplanationService on a cold cache,
+and again with nothing changed (all cache hits).
+
+Usage:
+    python -m benchmarks.bench_explanations [--objects 1000] [--latency-ms 10]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Dict, List
+
+from loguru import logger
+
+from src.core import telemetry
+from src.core.explanations import ExplanationService
+from src.core.object_registry import ObjectRegistry
+from benchmarks.bench_model_memory import FACTORIES
+
+
+class FakeLLM:
+    """Sleeps `latency_s` per request plus a little per item, like a remote model."""
+
+    def __init__(self, latency_s: float):
+        self.latency_s = latency_s
+        self.requests = 0
+
+    async def __call__(self, kind: str, items: List[Dict[str, Any]]) -> List[str]:
+        self.requests += 1
+        await asyncio.sleep(self.latency_s + 0.0001 * len(items))
+        return [f"{item['type']} {item['name']}" for item in items]
+
+
+async def _sequential(backend: FakeLLM, objects: List[Any]) -> None:
+    for obj in objects:
+        await backend("explain", [obj.to_dict()])
+
+
+def _timed(label: str, n: int, backend: FakeLLM, coro: Any) -> None:
+    before = backend.requests
+    start = time.perf_counter()
+    asyncio.run(coro)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<26} {elapsed:>9.2f} {n / elapsed:>14,.0f} {backend.requests - before:>10,}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[3])
+    parser.add_argument("--objects", type=int, default=1000)
+    parser.add_argument("--latency-ms", type=float, default=10.0)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--max-concurrency", type=int, default=4)
+    args = parser.parse_args()
+    logger.disable("src")
+    telemetry.configure(enabled=False)
+
+    factories = list(FACTORIES.values())
+    objects = [factories[i % len(factories)](i) for i in range(args.objects)]
+    n = len(objects)
+    backend = FakeLLM(args.latency_ms / 1000)
+    service = ExplanationService(
+        backend=backend, batch_size=args.batch_size, max_concurrency=args.max_concurrency
+    )
+
+    print(f"{'path':<26} {'seconds':>9} {'objects/sec':>14} {'requests':>10}")
+    _timed("one request per object", n, backend, _sequential(backend, objects))
+    _timed("service (cold cache)", n, backend, service.explain_many(objects))
+    _timed("service (warm cache)", n, backend, service.explain_many(objects))
+    ObjectRegistry.clear()
+    telemetry.configure(enabled=True)
+
+
+if __name__ == "__main__":
+    main()
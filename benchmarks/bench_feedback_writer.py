@@ -0,0 +1,58 @@
+"""
+bench_feedback_writer.py
+────────────────────────────────────────────────────────────────────────────
+Records/sec of `save_feedback` (open/append/close + print per record) versus
+the buffered `FeedbackWriter`, writing into a throw-away directory.
+
+Usage:
+    python -m benchmarks.bench_feedback_writer [--records 20000]
+"""
+
+import argparse
+import contextlib
+import io
+import tempfile
+import time
+from pathlib import Path
+
+from pipelines import collect_feedback
+
+
+def _bench(label: str, n: int, fn) -> float:
+    start = time.perf_counter()
+    fn(n)
+    elapsed = time.perf_counter() - start
+    rate = n / elapsed
+    print(f"{label:<36} {rate:>12,.0f} records/sec")
+    return rate
+
+
+def _save_feedback(n: int) -> None:
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(n):
+            collect_feedback.save_feedback(f"prompt {i}", "response", 4, "ok")
+
+
+def _writer(fsync: str):
+    def run(n: int) -> None:
+        with collect_feedback.FeedbackWriter(max_buffer=512, fsync=fsync) as writer:
+            for i in range(n):
+                writer.write(f"prompt {i}", "response", 4, "ok")
+    return run
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[3])
+    parser.add_argument("--records", type=int, default=20_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        collect_feedback.DATA_DIR = Path(tmp)
+        base = _bench("save_feedback (per-record)", args.records, _save_feedback)
+        fast = _bench("FeedbackWriter (fsync=never)", args.records, _writer("never"))
+        _bench("FeedbackWriter (fsync=flush)", args.records, _writer("flush"))
+    print(f"speed-up (fsync=never): {fast / base:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
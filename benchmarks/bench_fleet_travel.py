@@ -0,0 +1,69 @@
+"""
+bench_fleet_travel.py
+────────────────────────────────────────────────────────────────────────────
+Vehicle-trips/sec for a mixed gas / EV fleet: per-object `travel()` loops
+versus one vectorized `Fleet.travel()` call per step, with logging off.
+
+Usage:
+    python -m benchmarks.bench_fleet_travel [--vehicles 10000] [--steps 20]
+"""
+
+import argparse
+import time
+
+import numpy as np
+from loguru import logger
+
+from src.core.object_registry import ObjectRegistry
+from src.oop_labs import MotorVehicle
+from src.oop_labs.fleet import Fleet
+
+
+def _vehicles(n: int):
+    vehicles = []
+    for i in range(n):
+        v = MotorVehicle(f"v{i}", max_speed=120, horsepower=150)
+        if i % 2:
+            v.configure_ev_system(battery_kwh=75, efficiency_mi_per_kwh=3.5)
+            v.charge(75)
+        else:
+            v.configure_fuel_system(mpg=30, fuel_capacity=15)
+            v.add_fuel(15)
+        vehicles.append(v)
+    return vehicles
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[3])
+    parser.add_argument("--vehicles", type=int, default=10_000)
+    parser.add_argument("--steps", type=int, default=20)
+    args = parser.parse_args()
+    logger.disable("src")
+
+    rng = np.random.default_rng(0)
+    distances = rng.uniform(1, 40, size=(args.steps, args.vehicles))
+    trips = args.steps * args.vehicles
+
+    vehicles = _vehicles(args.vehicles)
+    start = time.perf_counter()
+    for row in distances.tolist():
+        for v, d in zip(vehicles, row):
+            v.travel(d)
+    per_object = trips / (time.perf_counter() - start)
+
+    fleet = Fleet.from_vehicles(_vehicles(args.vehicles))
+    start = time.perf_counter()
+    for row in distances:
+        fleet.travel(row)
+    vectorized = trips / (time.perf_counter() - start)
+
+    state = np.where(np.isnan(fleet.current_fuel), fleet.current_charge_kwh, fleet.current_fuel)
+    same = state.tolist() == [v.current_fuel if v.mpg else v.current_charge_kwh for v in vehicles]
+    print(f"{'engine':<12} {'trips/sec':>14}")
+    print(f"{'per-object':<12} {per_object:>14,.0f}")
+    print(f"{'Fleet':<12} {vectorized:>14,.0f}   ({vectorized / per_object:.0f}x, identical={same})")
+    ObjectRegistry.clear()
+
+
+if __name__ == "__main__":
+    main()
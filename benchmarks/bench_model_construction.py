@@ -0,0 +1,90 @@
+"""
+bench_model_construction.py
+────────────────────────────────────────────────────────────────────────────
+Objects/sec for constructing each model class (registration included), and
+how many `ObjectRegistry.add` calls one construction makes. Runs twice:
+with logging disabled, and with loguru emitting DEBUG into a null sink.
+
+Usage:
+    python -m benchmarks.bench_model_construction [--objects 20000]
+"""
+
+import argparse
+import time
+from typing import Callable, Dict
+
+from loguru import logger
+
+from src.core.base_model import BaseModel
+from src.core.object_registry import ObjectRegistry
+from src.oop_labs import Airplane, JetPlane, MotorVehicle, Motorcycle, TransportMode
+from src.oop_labs.pet import Pet
+from src.oop_labs.team import Team
+from src.oop_labs.vending_machine import VendingMachine
+
+FACTORIES: Dict[str, Callable[[int], object]] = {
+    "TransportMode": lambda i: TransportMode(f"t{i}", max_speed=60),
+    "MotorVehicle": lambda i: MotorVehicle(f"v{i}", max_speed=120, horsepower=150),
+    "Motorcycle": lambda i: Motorcycle(f"m{i}", 110, horsepower=53, weight_lbs=514),
+    "Airplane": lambda i: Airplane(f"a{i}", max_speed=588, wingspan=112),
+    "JetPlane": lambda i: JetPlane(f"j{i}", 1500, wingspan=32, max_altitude=50_000),
+    "Pet": lambda i: Pet(f"p{i}", age=3),
+    "Team": lambda i: Team(f"team{i}"),
+    "VendingMachine": lambda i: VendingMachine(f"vm{i}", initial_inventory=10),
+}
+
+
+def _adds_per_object(factory: Callable[[int], object]) -> int:
+    """Registrations per construction, whether via the hook or direct calls."""
+    calls = 0
+    real_add = ObjectRegistry.add.__func__
+    real_hook = BaseModel._on_created
+
+    def counting_add(cls, obj):
+        nonlocal calls
+        calls += 1
+        real_add(cls, obj)
+
+    ObjectRegistry.add = classmethod(counting_add)
+    BaseModel._on_created = ObjectRegistry.add
+    try:
+        factory(0)
+    finally:
+        ObjectRegistry.add = classmethod(real_add)
+        BaseModel._on_created = real_hook
+    return calls
+
+
+def _objects_per_sec(factory: Callable[[int], object], n: int) -> float:
+    ObjectRegistry.clear()
+    start = time.perf_counter()
+    for i in range(n):
+        factory(i)
+    elapsed = time.perf_counter() - start
+    ObjectRegistry.clear()
+    return n / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[3])
+    parser.add_argument("--objects", type=int, default=20_000)
+    args = parser.parse_args()
+
+    logger.remove()
+    handler = None
+    for label in ("logging off", "DEBUG → null sink"):
+        if handler is None:
+            logger.disable("src")
+        else:
+            logger.enable("src")
+        print(f"── {label}")
+        print(f"{'class':<16} {'adds/obj':>8} {'objects/sec':>14}")
+        for name, factory in FACTORIES.items():
+            adds = _adds_per_object(factory)
+            rate = _objects_per_sec(factory, args.objects)
+            print(f"{name:<16} {adds:>8} {rate:>14,.0f}")
+        handler = logger.add(lambda message: None, level="DEBUG")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+bench_model_memory.py
+────────────────────────────────────────────────────────────────────────────
+Bytes per object for each model class, measured with tracemalloc over many
+live instances: the object alone (registration switched off) and with the
+registry entry it costs in the default strong mode, for each id format.
+
+Usage:
+    python -m benchmarks.bench_model_memory [--objects 50000]
+"""
+
+import argparse
+import gc
+import tracemalloc
+from typing import Callable, Dict, List
+
+from loguru import logger
+
+from src.core.base_model import BaseModel
+from src.core.object_registry import ObjectRegistry
+from src.oop_labs import Airplane, JetPlane, MotorVehicle, Motorcycle, TransportMode
+from src.oop_labs.pet import Pet
+from src.oop_labs.team import Team
+from src.oop_labs.vending_machine import VendingMachine
+
+FACTORIES: Dict[str, Callable[[int], object]] = {
+    "TransportMode": lambda i: TransportMode("t", max_speed=60),
+    "MotorVehicle": lambda i: MotorVehicle("v", max_speed=120, horsepower=150),
+    "Motorcycle": lambda i: Motorcycle("m", 110, horsepower=53, weight_lbs=514),
+    "Airplane": lambda i: Airplane("a", max_speed=588, wingspan=112),
+    "JetPlane": lambda i: JetPlane("j", 1500, wingspan=32, max_altitude=50_000),
+    "Pet": lambda i: Pet("p", age=3),
+    "Team": lambda i: Team("team"),
+    "VendingMachine": lambda i: VendingMachine("vm", initial_inventory=10),
+}
+
+
+def _bytes_per_object(factory: Callable[[int], object], n: int) -> float:
+    ObjectRegistry.clear()
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    keep: List[object] = [factory(i) for i in range(n)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # The list holding the objects is not part of their footprint.
+    size = (after - before - keep.__sizeof__()) / n
+    del keep
+    ObjectRegistry.clear()
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[3])
+    parser.add_argument("--objects", type=int, default=50_000)
+    args = parser.parse_args()
+    logger.disable("src")
+
+    register = BaseModel._on_created
+    for fmt in ("uuid", "short"):
+        BaseModel.set_id_format(fmt)
+        print(f"── id format: {fmt}")
+        print(f"{'class':<16} {'object B':>10} {'+ registry B':>13}")
+        for name, factory in FACTORIES.items():
+            BaseModel._on_created = lambda obj: None
+            alone = _bytes_per_object(factory, args.objects)
+            BaseModel._on_created = register
+            registered = _bytes_per_object(factory, args.objects)
+            print(f"{name:<16} {alone:>10,.0f} {registered:>13,.0f}")
+
+
+if __name__ == "__main__":
+    main()
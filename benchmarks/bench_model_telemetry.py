@@ -0,0 +1,77 @@
+"""
+bench_model_telemetry.py
+────────────────────────────────────────────────────────────────────────────
+Per-call cost of hot model methods (`MotorVehicle.travel` on gas and EV,
+`JetPlane.travel`) under each telemetry setting: telemetry off, the class
+disabled, loguru disabled for `src`, sampled 1-in-100 into a DEBUG null
+sink, and fully on into a DEBUG null sink.
+
+Usage:
+    python -m benchmarks.bench_model_telemetry [--calls 200000]
+"""
+
+import argparse
+import time
+from typing import Callable, Dict
+
+from loguru import logger
+
+from src.core import telemetry
+from src.core.object_registry import ObjectRegistry
+from src.oop_labs import JetPlane, MotorVehicle, TransportMode
+
+
+def _subjects() -> Dict[str, Callable[[], bool]]:
+    car = MotorVehicle("car", max_speed=100, horsepower=150)
+    car.configure_fuel_system(mpg=30, fuel_capacity=1e12)
+    car.add_fuel(1e12)
+    ev = MotorVehicle("ev", max_speed=100, horsepower=300)
+    ev.configure_ev_system(battery_kwh=1e12, efficiency_mi_per_kwh=4)
+    ev.charge(1e12)
+    jet = JetPlane("jet", 1500, wingspan=44, max_altitude=65_000)
+    jet.configure_fuel_system(mpg=2, fuel_capacity=1e12)
+    jet.add_fuel(1e12)
+    return {
+        "car.travel": lambda: car.travel(0.1),
+        "ev.travel": lambda: ev.travel(0.1),
+        "jet.travel": lambda: jet.travel(0.1),
+    }
+
+
+def _ns_per_call(fn: Callable[[], bool], calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[3])
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args()
+
+    logger.remove()
+    subjects = _subjects()
+    sink = None
+    modes = [
+        ("telemetry off", lambda: telemetry.configure(enabled=False)),
+        ("class disabled", lambda: telemetry.disable(TransportMode, MotorVehicle, JetPlane, "Airplane")),
+        ("loguru disabled", lambda: logger.disable("src")),
+        ("sampled 1/100", lambda: telemetry.configure(sample_every=100)),
+        ("on (null sink)", lambda: None),
+    ]
+    print(f"{'mode':<16} " + " ".join(f"{name:>12}" for name in subjects) + "   (ns/call)")
+    for label, apply in modes:
+        telemetry.configure(enabled=True, level="DEBUG", sample_every=1)
+        telemetry.enable(*telemetry.settings()["disabled"])
+        logger.enable("src")
+        if sink is None:
+            sink = logger.add(lambda message: None, level="DEBUG")
+        apply()
+        costs = [_ns_per_call(fn, args.calls) for fn in subjects.values()]
+        print(f"{label:<16} " + " ".join(f"{ns:>12,.0f}" for ns in costs))
+    ObjectRegistry.clear()
+
+
+if __name__ == "__main__":
+    main()
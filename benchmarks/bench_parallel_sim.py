@@ -0,0 +1,65 @@
+"""
+bench_parallel_sim.py
+────────────────────────────────────────────────────────────────────────────
+Wall time of the sharded multi-process fleet runner (`run_sharded`) with 1
+to N worker processes on a synthetic mixed gas / EV fleet. Reports wall
+time, vehicle-steps/sec and the ratio to the in-process run; every run must
+reduce to the same totals. Any speedup depends on the cores available, so
+run it on the target machine.
+
+Usage:
+    python -m benchmarks.bench_parallel_sim [--vehicles 2000000] [--hours 12] [--max-workers N]
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+from loguru import logger
+
+from src.oop_labs.fleet import Fleet
+from src.oop_labs.parallel import run_sharded
+
+STEP_H = 0.25
+
+
+def _fleet(n: int) -> Fleet:
+    rng = np.random.default_rng(0)
+    ev = rng.random(n) < 0.3
+    return Fleet(
+        n,
+        max_speed=rng.uniform(40, 90, n),
+        mpg=np.where(ev, np.nan, rng.uniform(15, 45, n)),
+        fuel_capacity=15.0,
+        current_fuel=np.where(ev, np.nan, rng.uniform(5, 15, n)),
+        battery_kwh=np.where(ev, 75.0, np.nan),
+        current_charge_kwh=np.where(ev, rng.uniform(20, 75, n), np.nan),
+        efficiency_mi_per_kwh=np.where(ev, 3.5, np.nan),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[3])
+    parser.add_argument("--vehicles", type=int, default=2_000_000)
+    parser.add_argument("--hours", type=float, default=12)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+    logger.disable("src")
+
+    counts = [w for w in (1, 2, 4, 8, 16, 32, 64) if w < args.max_workers] + [args.max_workers]
+    print(f"cpus={os.cpu_count()}  vehicles={args.vehicles:,}  hours={args.hours}  step_h={STEP_H}")
+    print(f"{'workers':>7} {'wall s':>8} {'veh-steps/s':>14} {'speedup':>8} {'distance mi':>16}")
+    baseline = None
+    for workers in dict.fromkeys(counts):
+        fleet = _fleet(args.vehicles)
+        start = time.perf_counter()
+        stats = run_sharded(fleet, hours=args.hours, step_h=STEP_H, workers=workers)
+        wall = time.perf_counter() - start
+        baseline = baseline or wall
+        rate = stats.vehicles * stats.steps / wall
+        print(f"{workers:>7} {wall:>8.2f} {rate:>14,.0f} {baseline / wall:>7.2f}x {stats.distance_mi:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
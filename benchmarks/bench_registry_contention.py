@@ -0,0 +1,78 @@
+"""
+bench_registry_contention.py
+────────────────────────────────────────────────────────────────────────────
+ObjectRegistry throughput and lock contention with 1–32 writer threads,
+single lock (1 shard) versus lock-striped (16 shards). Each thread
+registers its own pre-built objects, reads each one back and removes every
+fourth; object construction is kept out of the timing.
+
+Usage:
+    python -m benchmarks.bench_registry_contention [--ops 200000]
+"""
+
+import argparse
+import threading
+import time
+from typing import List
+
+from loguru import logger
+
+from src.core.base_model import BaseModel
+from src.core.object_registry import ObjectRegistry
+
+THREADS = (1, 2, 4, 8, 16, 32)
+SHARDS = (1, ObjectRegistry.DEFAULT_SHARDS)
+
+
+class _Probe(BaseModel):
+    def to_dict(self):
+        return super().to_dict()
+
+
+def _run(threads: int, objects: List[List[_Probe]]) -> float:
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(batch: List[_Probe]) -> None:
+        barrier.wait()
+        for i, obj in enumerate(batch):
+            ObjectRegistry.add(obj)
+            ObjectRegistry.get(obj.id)
+            if i % 4 == 0:
+                ObjectRegistry.remove(obj.id)
+
+    pool = [threading.Thread(target=worker, args=(objects[t],)) for t in range(threads)]
+    for t in pool:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in pool:
+        t.join()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[3])
+    parser.add_argument("--ops", type=int, default=200_000, help="objects per run")
+    args = parser.parse_args()
+    logger.disable("src.core")
+
+    print(f"{'threads':>7} {'shards':>6} {'ops/sec':>14} {'contended':>10} {'wait ms':>9}")
+    for shards in SHARDS:
+        ObjectRegistry.configure(shards=shards, stats=True)
+        for threads in THREADS:
+            per_thread = args.ops // threads
+            objects = [[_Probe(f"t{t}") for _ in range(per_thread)] for t in range(threads)]
+            ObjectRegistry.clear()
+            ObjectRegistry.reset_stats()
+
+            elapsed = _run(threads, objects)
+            stats = ObjectRegistry.shard_stats()
+            ops = threads * per_thread * 2.25  # add + get + remove every 4th
+            contended = sum(s["contended"] for s in stats)
+            wait_ms = sum(s["wait_s"] for s in stats) * 1e3
+            print(f"{threads:>7} {shards:>6} {ops / elapsed:>14,.0f} {contended:>10,} {wait_ms:>9.1f}")
+        ObjectRegistry.clear()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+bench_registry_persistence.py
+────────────────────────────────────────────────────────────────────────────
+Objects/sec for rebuilding a registry of every model class by re-running the
+constructors versus `ObjectRegistry.restore()` from a full snapshot, plus
+the snapshot size and the size / time of an incremental snapshot after 1%
+of the objects change.
+
+Usage:
+    python -m benchmarks.bench_registry_persistence [--objects 200000]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from loguru import logger
+
+from src.core import telemetry
+from src.core.object_registry import ObjectRegistry
+from benchmarks.bench_model_memory import FACTORIES
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[3])
+    parser.add_argument("--objects", type=int, default=200_000)
+    args = parser.parse_args()
+    logger.disable("src")
+    telemetry.configure(enabled=False)
+
+    factories = list(FACTORIES.values())
+    n = args.objects
+    ObjectRegistry.clear()
+    start = time.perf_counter()
+    objects = [factories[i % len(factories)](i) for i in range(n)]
+    construct_s = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as tmp:
+        full = ObjectRegistry.save(Path(tmp) / "full.snap")
+        for obj in objects[:: 100]:
+            obj.name = obj.name + "*"
+        delta = ObjectRegistry.save(Path(tmp) / "delta.snap", incremental=True)
+        del objects
+        ObjectRegistry.clear()
+
+        start = time.perf_counter()
+        restored = ObjectRegistry.restore(full.path)
+        restore_s = time.perf_counter() - start
+        assert len(restored) == n
+
+    print(f"{'path':<32} {'objects/sec':>14}")
+    print(f"{'constructors':<32} {n / construct_s:>14,.0f}")
+    print(f"{'restore (full snapshot)':<32} {n / restore_s:>14,.0f}   ({construct_s / restore_s:.1f}x)")
+    print(f"{'save (full snapshot)':<32} {n / full.seconds:>14,.0f}")
+    print(f"full snapshot:        {full.bytes:>12,} bytes ({full.bytes / n:.0f} B/object)")
+    print(
+        f"incremental (1% dirty): {delta.bytes:>10,} bytes, {delta.objects:,} objects, "
+        f"{delta.seconds * 1000:.0f} ms"
+    )
+    ObjectRegistry.clear()
+    telemetry.configure(enabled=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+bench_registry_query.py
+────────────────────────────────────────────────────────────────────────────
+Latency of `ObjectRegistry.query()` at growing registry sizes: lookups the
+secondary indexes answer (name, ordered `level` range, `level` equality)
+versus the same conditions as a `where=` predicate, which scans every
+object.
+
+Usage:
+    python -m benchmarks.bench_registry_query [--sizes 10000 100000 200000]
+"""
+
+import argparse
+import time
+from typing import Callable
+
+from loguru import logger
+
+from src.core import telemetry
+from src.core.base_model import BaseModel
+from src.core.object_registry import ObjectRegistry
+
+
+class Widget(BaseModel):
+    def __init__(self, name: str, level: float = 0.0):
+        super().__init__(name=name)
+        self.level = level
+
+    def to_dict(self):
+        return {**super().to_dict(), "level": self.level}
+
+
+def _us(fn: Callable[[], object], repeat: int = 20) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[3])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 200_000])
+    args = parser.parse_args()
+    logger.disable("src")
+    telemetry.configure(enabled=False)
+
+    ObjectRegistry.create_index("level", ordered=True)
+    print(f"{'objects':>10} {'indexed us':>12} {'scan us':>12}")
+    for size in args.sizes:
+        ObjectRegistry.clear()
+        for i in range(size):
+            obj = object.__new__(Widget)
+            object.__setattr__(obj, "id", str(i))
+            object.__setattr__(obj, "name", f"w{i}")
+            object.__setattr__(obj, "level", i)
+            ObjectRegistry.add(obj)
+        last, probe = size - 1, f"w{size // 2}"
+
+        def indexed() -> None:
+            assert ObjectRegistry.query(Widget, name=probe, level__lt=10) == []
+            assert len(ObjectRegistry.query(level=last)) == 1
+
+        def scan() -> None:
+            assert ObjectRegistry.query(where=lambda o: o.name == probe and o.level < 10) == []
+            assert len(ObjectRegistry.query(where=lambda o: o.level == last)) == 1
+
+        print(f"{size:>10,} {_us(indexed):>12.1f} {_us(scan, repeat=3):>12.1f}")
+
+    ObjectRegistry.drop_index("level")
+    ObjectRegistry.clear()
+    telemetry.configure(enabled=True)
+
+
+if __name__ == "__main__":
+    main()
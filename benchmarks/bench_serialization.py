@@ -0,0 +1,62 @@
+"""
+bench_serialization.py
+────────────────────────────────────────────────────────────────────────────
+Objects/sec for exporting a mixed population of every model class: the
+`to_dict()` chain versus the generated per-class serializers, pretty
+`safe_json_dumps` versus compact JSON, and `dump_many` NDJSON with orjson
+and with the stdlib encoder.
+
+Usage:
+    python -m benchmarks.bench_serialization [--objects 100000]
+"""
+
+import argparse
+import io
+import json
+import time
+from typing import Callable, List
+
+from loguru import logger
+
+from src.core import serialization
+from src.core.object_registry import ObjectRegistry
+from src.core.serialization import dump_many, serialize
+from src.core.utils import safe_json_dumps
+from benchmarks.bench_model_memory import FACTORIES
+
+
+def _rate(label: str, n: int, fn: Callable[[], None]) -> None:
+    start = time.perf_counter()
+    fn()
+    print(f"{label:<38} {n / (time.perf_counter() - start):>14,.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[3])
+    parser.add_argument("--objects", type=int, default=100_000)
+    args = parser.parse_args()
+    logger.disable("src")
+
+    factories = list(FACTORIES.values())
+    objects: List[object] = [factories[i % len(factories)](i) for i in range(args.objects)]
+    n = len(objects)
+    orjson = serialization.orjson
+
+    print(f"{'path':<38} {'objects/sec':>14}   (orjson={'yes' if orjson else 'no'})")
+    _rate("to_dict()", n, lambda: [o.to_dict() for o in objects])
+    _rate("serialize() (generated)", n, lambda: [serialize(o) for o in objects])
+    _rate("to_dict + safe_json_dumps (pretty)", n, lambda: [safe_json_dumps(o.to_dict()) for o in objects])
+    _rate(
+        "to_dict + json.dumps compact",
+        n,
+        lambda: [json.dumps(o.to_dict(), separators=(",", ":")) for o in objects],
+    )
+    _rate("dump_many NDJSON", n, lambda: dump_many(objects, io.BytesIO()))
+    serialization.orjson = None
+    _rate("dump_many NDJSON (stdlib json)", n, lambda: dump_many(objects, io.BytesIO()))
+    serialization.orjson = orjson
+    ObjectRegistry.clear()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+bench_simulation.py
+────────────────────────────────────────────────────────────────────────────
+Events/sec for the discrete-event Simulator over a large mixed population:
+cars and EVs on multi-step trips, airplanes flying takeoff → climb → cruise
+→ descend → land, and jets toggling afterburners. Model telemetry is off;
+entity construction is kept out of the timing.
+
+Usage:
+    python -m benchmarks.bench_simulation [--entities 100000] [--step-h 0.25]
+"""
+
+import argparse
+import random
+import time
+
+from loguru import logger
+
+from src.core import telemetry
+from src.core.object_registry import ObjectRegistry
+from src.oop_labs import Airplane, JetPlane, MotorVehicle
+from src.oop_labs.simulation import Simulator
+
+
+def _population(n: int, rng: random.Random):
+    """Build `n` entities and their initial events (time, kind, vehicle, arg)."""
+    events = []
+    for i in range(n):
+        start = rng.uniform(0, 2)
+        kind = i % 4
+        if kind == 0:
+            v = MotorVehicle(f"car{i}", max_speed=rng.uniform(50, 80), horsepower=150)
+            v.configure_fuel_system(mpg=30, fuel_capacity=12)
+            v.add_fuel(rng.uniform(2, 12))
+            events.append((start, "travel", v, rng.uniform(50, 250)))
+        elif kind == 1:
+            v = MotorVehicle(f"ev{i}", max_speed=rng.uniform(50, 80), horsepower=300)
+            v.configure_ev_system(battery_kwh=75, efficiency_mi_per_kwh=3.5)
+            v.charge(rng.uniform(10, 75))
+            events.append((start, "travel", v, rng.uniform(50, 250)))
+        else:
+            if kind == 2:
+                v = Airplane(f"plane{i}", max_speed=140, wingspan=36, max_altitude=13_000)
+            else:
+                v = JetPlane(f"jet{i}", 1200, wingspan=44, max_altitude=65_000)
+            v.configure_fuel_system(mpg=12 if kind == 2 else 2, fuel_capacity=500)
+            v.add_fuel(500)
+            events += [
+                (start, "takeoff", v, None),
+                (start + 0.1, "climb", v, 8000),
+                (start + 0.2, "travel", v, rng.uniform(100, 600)),
+                (start + 3.0, "descend", v, 9000),
+            ]
+            if kind == 3:
+                events += [(start + 0.3, "afterburner_on", v, None), (start + 0.6, "afterburner_off", v, None)]
+    return events
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[3])
+    parser.add_argument("--entities", type=int, default=100_000)
+    parser.add_argument("--step-h", type=float, default=0.25)
+    args = parser.parse_args()
+    logger.disable("src")
+    telemetry.configure(enabled=False)
+
+    events = _population(args.entities, random.Random(0))
+    sim = Simulator(step_h=args.step_h)
+    start = time.perf_counter()
+    sim.schedule_many(events)
+    load_s = time.perf_counter() - start
+    stats = sim.run()
+
+    print(f"entities          {args.entities:>14,}")
+    print(f"initial events    {len(events):>14,}   (loaded in {load_s * 1e3:,.0f} ms)")
+    print(f"events processed  {stats.events:>14,}")
+    print(f"events/sec        {stats.events_per_sec:>14,.0f}")
+    print(f"simulated hours   {stats.clock_h:>14,.2f}")
+    print(f"trips done/abort  {stats.trips_completed:>7,} / {stats.trips_aborted:,}")
+    print(f"distance (mi)     {stats.distance_mi:>14,.0f}")
+    print(f"fuel (gal) / kWh  {stats.fuel_used_gal:>14,.0f} / {stats.charge_used_kwh:,.0f}")
+    ObjectRegistry.clear()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+code_exec.py
+────────────────────────────────────────────────────────────────────────────
+Sandboxed execution of model-generated code for the Pass@k metric in
+`pipelines/evaluate.py`.
+
+Each sample runs as `<completion>\n\n<tests>` in its own Python subprocess
+(isolated mode, empty working directory, minimal environment) with CPU,
+address-space and file-size limits and a wall-clock timeout; a non-zero
+exit status counts as a failure. Samples are executed on a thread pool —
+each worker just supervises one child process. A caller scoring many items
+creates one pool for the whole run and hands every sample to it with
+`submit_samples`, so the samples of different items run side by side.
+
+Pass@k uses the unbiased estimator from Chen et al. (2021):
+
+    pass@k = 1 - C(n - c, k) / C(n, k)
+
+for n samples of which c passed.
+
+Usage:
+    from pipelines.code_exec import execute_samples, estimate_pass_at_k
+    results = execute_samples(completions, tests="assert add(1, 2) == 3")
+    score = estimate_pass_at_k(len(results), sum(r.passed for r in results), k=3)
+
+    with ThreadPoolExecutor(MAX_WORKERS) as pool:   # one pool per run
+        futures = submit_samples(pool, completions, tests)
+"""
+
+import os
+import re
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence, Union
+
+TIMEOUT_S = float(os.getenv("EVAL_EXEC_TIMEOUT_S", "10"))
+MEMORY_MB = int(os.getenv("EVAL_EXEC_MEMORY_MB", "512"))
+MAX_WORKERS = int(os.getenv("EVAL_EXEC_WORKERS", str(os.cpu_count() or 4)))
+MAX_FILE_BYTES = 10 << 20
+
+# Runs inside the child: apply rlimits, then execute the program file. Doing
+# this in the child (rather than via preexec_fn) is safe with threads.
+_BOOTSTRAP = """
+import resource, runpy, sys
+cpu, mem, fsize, path = int(sys.argv[1]), int(sys.argv[2]), int(sys.argv[3]), sys.argv[4]
+resource.setrlimit(resource.RLIMIT_CPU, (cpu, cpu))
+resource.setrlimit(resource.RLIMIT_AS, (mem, mem))
+resource.setrlimit(resource.RLIMIT_FSIZE, (fsize, fsize))
+sys.argv = [path]
+runpy.run_path(path, run_name="__main__")
+"""
+
+_FENCE = re.compile(r"```(?:python|py)?\s*\n(.*?)```", re.DOTALL)
+
+Tests = Union[str, Sequence[str]]
+
+
+@dataclass
+class SampleResult:
+    passed: bool
+    timed_out: bool
+    duration_s: float
+
+
+def extract_code(completion: str) -> str:
+    """Return the first fenced code block of a completion, or the whole text."""
+    match = _FENCE.search(completion)
+    return match.group(1) if match else completion
+
+
+def _test_source(tests: Tests) -> str:
+    return tests if isinstance(tests, str) else "\n".join(tests)
+
+
+def run_sample(
+    code: str,
+    tests: Tests,
+    timeout_s: float = TIMEOUT_S,
+    memory_mb: int = MEMORY_MB,
+) -> SampleResult:
+    """Execute one completion against its tests in a resource-limited child."""
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix="eval-exec-") as workdir:
+        program = Path(workdir) / "program.py"
+        program.write_text(f"{code}\n\n{_test_source(tests)}\n", encoding="utf-8")
+
+        cmd = [
+            sys.executable,
+            "-I",
+            "-c",
+            _BOOTSTRAP,
+            str(int(timeout_s) + 1),
+            str(memory_mb << 20),
+            str(MAX_FILE_BYTES),
+            str(program),
+        ]
+        proc = subprocess.Popen(
+            cmd,
+            cwd=workdir,
+            env={"PATH": os.environ.get("PATH", ""), "PYTHONHASHSEED": "0"},
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,  # own process group → kill strays too
+        )
+        try:
+            returncode = proc.wait(timeout=timeout_s)
+            timed_out = False
+        except subprocess.TimeoutExpired:
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass  # exited (and its group emptied) right after the timeout
+            proc.wait()
+            returncode, timed_out = -1, True
+
+    return SampleResult(
+        passed=returncode == 0,
+        timed_out=timed_out,
+        duration_s=time.perf_counter() - start,
+    )
+
+
+def submit_samples(
+    pool: Executor,
+    completions: Sequence[str],
+    tests: Tests,
+    timeout_s: float = TIMEOUT_S,
+    memory_mb: int = MEMORY_MB,
+) -> List["Future[SampleResult]"]:
+    """Queue every completion on a caller-owned pool; one future per completion, in order."""
+    return [
+        pool.submit(run_sample, extract_code(c), tests, timeout_s, memory_mb)
+        for c in completions
+    ]
+
+
+def execute_samples(
+    completions: Sequence[str],
+    tests: Tests,
+    workers: Optional[int] = None,
+    timeout_s: float = TIMEOUT_S,
+    memory_mb: int = MEMORY_MB,
+) -> List[SampleResult]:
+    """Run every completion against `tests` in parallel; results keep order."""
+    with ThreadPoolExecutor(max_workers=workers or MAX_WORKERS) as pool:
+        futures = submit_samples(pool, completions, tests, timeout_s, memory_mb)
+        return [f.result() for f in futures]
+
+
+def estimate_pass_at_k(n: int, c: int, k: int) -> float:
+    """Unbiased pass@k for n samples with c correct (numerically stable form)."""
+    if n <= 0:
+        return 0.0
+    if k > n:
+        raise ValueError(f"need at least k={k} samples, got n={n}")
+    if n - c < k:
+        return 1.0
+    prob_all_fail = 1.0
+    for i in range(n - c + 1, n + 1):
+        prob_all_fail *= 1.0 - k / i
+    return 1.0 - prob_all_fail
+
+
+def num_tests(tests: Tests) -> int:
+    """Number of test cases: list entries, or `assert` lines in a test script."""
+    if isinstance(tests, str):
+        return max(1, sum(line.lstrip().startswith("assert") for line in tests.splitlines()))
+    return len(tests)
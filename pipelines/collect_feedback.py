@@ -11,14 +11,32 @@ Usage (import):
     from pipelines.collect_feedback import save_feedback
     save_feedback(prompt="...", response="...", rating=4, comments="Good")
 
+Usage (high-throughput, e.g. inside the API):
+    from pipelines.collect_feedback import FeedbackWriter
+    writer = FeedbackWriter(max_buffer=256, flush_interval_s=1.0)
+    writer.write(prompt="...", response="...", rating=4)
+    ...
+    writer.close()   # also flushed automatically at interpreter exit
+
+Every append takes an exclusive `fcntl.flock` on the day file (where
+available), so several uvicorn workers can write the same file safely.
+
 Output:
     data/feedback/2025-MM-DD.jsonl   # one JSON object per line
 """
 
+import atexit
 import json
+import os
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Dict, List, Literal, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, single-writer only
+    fcntl = None
 
 # --------------------------------------------------------------------- #
 # Configuration
@@ -28,6 +46,7 @@ DATA_DIR = Path("data/feedback")
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 RATING = Literal[1, 2, 3, 4, 5]  # type alias
+FSYNC_POLICY = Literal["never", "flush"]
 
 
 def _output_path() -> Path:
@@ -36,6 +55,37 @@ def _output_path() -> Path:
     return DATA_DIR / f"{date_str}.jsonl"
 
 
+def _make_record(
+    prompt: str, response: str, rating: RATING, comments: Optional[str]
+) -> Dict:
+    return {
+        "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "prompt": prompt.strip(),
+        "response": response.strip(),
+        "rating": rating,
+        "comments": comments or "",
+    }
+
+
+def _append_lines(path: Path, lines: List[str], fsync: bool = False) -> None:
+    """
+    Append complete lines with a single write under an exclusive file lock,
+    so concurrent writers (threads or processes) never interleave records.
+    """
+    data = "".join(lines).encode("utf-8")
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        if fsync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)  # releases the lock
+
+
 # --------------------------------------------------------------------- #
 # Core Function
 # --------------------------------------------------------------------- #
@@ -57,21 +107,116 @@ def save_feedback(
       "comments": "optional"
     }
     """
-    record = {
-        "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
-        "prompt": prompt.strip(),
-        "response": response.strip(),
-        "rating": rating,
-        "comments": comments or "",
-    }
-
-    with _output_path().open("a", encoding="utf-8") as f:
-        json.dump(record, f)
-        f.write("\n")
+    record = _make_record(prompt, response, rating, comments)
+    _append_lines(_output_path(), [json.dumps(record) + "\n"])
 
     print(f"✅ Saved feedback ({rating}/5)")
 
 
+# --------------------------------------------------------------------- #
+# Buffered writer
+# --------------------------------------------------------------------- #
+class FeedbackWriter:
+    """
+    Thread-safe buffered feedback writer.
+
+    Records are kept in memory and appended to their day file when
+    `max_buffer` records are pending, every `flush_interval_s` seconds (from
+    a daemon thread; 0 disables it), on `flush()` / `close()`, and at exit.
+
+    fsync policy:
+      "never" – rely on the OS page cache (fastest)
+      "flush" – fsync the day file after every flush
+    """
+
+    def __init__(
+        self,
+        max_buffer: int = 256,
+        flush_interval_s: float = 1.0,
+        fsync: FSYNC_POLICY = "never",
+    ):
+        if max_buffer < 1:
+            raise ValueError("max_buffer must be >= 1")
+        if fsync not in ("never", "flush"):
+            raise ValueError(f"unknown fsync policy: {fsync!r}")
+
+        self.max_buffer = max_buffer
+        self.fsync = fsync
+        self.records_written = 0
+        self.flushes = 0
+
+        self._lock = threading.Lock()
+        self._buffer: Dict[str, List[str]] = {}  # day → pending lines
+        self._pending = 0
+        self._closed = False
+
+        self._stop = threading.Event()
+        self._timer: Optional[threading.Thread] = None
+        if flush_interval_s > 0:
+            self._timer = threading.Thread(
+                target=self._flush_periodically,
+                args=(flush_interval_s,),
+                name="feedback-writer",
+                daemon=True,
+            )
+            self._timer.start()
+        atexit.register(self.close)
+
+    def write(
+        self,
+        prompt: str,
+        response: str,
+        rating: RATING,
+        comments: Optional[str] = None,
+    ) -> None:
+        record = _make_record(prompt, response, rating, comments)
+        line = json.dumps(record) + "\n"
+        day = record["timestamp"][:10]  # YYYY-MM-DD, matches _output_path()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("FeedbackWriter is closed")
+            self._buffer.setdefault(day, []).append(line)
+            self._pending += 1
+            if self._pending >= self.max_buffer:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._pending:
+            return
+        for day, lines in self._buffer.items():
+            _append_lines(DATA_DIR / f"{day}.jsonl", lines, fsync=self.fsync == "flush")
+        self.records_written += self._pending
+        self.flushes += 1
+        self._buffer.clear()
+        self._pending = 0
+
+    def _flush_periodically(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            self.flush()
+
+    def close(self) -> None:
+        if self._timer is not None:
+            self._stop.set()
+            self._timer.join()
+            self._timer = None
+        with self._lock:
+            if self._closed:
+                return
+            self._flush_locked()
+            self._closed = True
+        atexit.unregister(self.close)
+
+    def __enter__(self) -> "FeedbackWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
 # --------------------------------------------------------------------- #
 # Interactive CLI
 # --------------------------------------------------------------------- #
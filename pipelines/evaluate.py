@@ -7,8 +7,9 @@ registered in `pipelines/registry.json`.
 Metrics computed
 ----------------
 • Rouge-L  (summarization / free-form)
-• BLEU-4   (translation-style n-gram match)
-• Pass@k   (code-generation success rate) – simple heuristic
+• BLEU-4   (translation-style n-gram match; mean sentence-BLEU + corpus-BLEU)
+• Pass@k   (code-generation success rate) – unbiased estimator over sandboxed
+            executions when the item has "tests", else a substring heuristic
 
 Input data
 ----------
@@ -16,29 +17,92 @@ Input data
 {
   "prompt": "...",
   "expected": "...",      # ground-truth or reference
-  "type": "text" | "code" # determines which metric bucket
+  "type": "text" | "code", # determines which metric bucket
+  "id": "...",            # optional; defaults to "line-<n>" for checkpoints
+  "tests": "assert ..."   # optional (code); str or list of test statements
 }
 
 Environment
 -----------
 OPENAI_API_KEY           (for calling the fine-tuned model)
+EVAL_MAX_IN_FLIGHT       (optional, concurrent model calls; default 8)
+EVAL_MAX_RETRIES         (optional, retries per prompt on rate limits; default 5)
+EVAL_CACHE_MAX_MB        (optional, response cache size bound; default 256)
+EVAL_PASS_K_SAMPLES      (optional, completions sampled per code item; default 3)
+EVAL_EXEC_TIMEOUT_S / EVAL_EXEC_MEMORY_MB / EVAL_EXEC_WORKERS
+                         (optional, sandbox limits; see pipelines/code_exec.py)
+
+Usage
+-----
+    python -m pipelines.evaluate --max-in-flight 16
+    python -m pipelines.evaluate --no-cache     # always query the model
+    python -m pipelines.evaluate --resume       # continue an interrupted run
+
+Responses are cached in `data/eval/cache.sqlite`, keyed by a hash of
+(model, messages, params), so re-scoring after a metric change costs no
+API calls. Cache hit/miss counts are written to the results JSON.
+
+Every scored item is appended to `data/eval/checkpoints/eval-<model>.jsonl`.
+With `--resume`, items already in the checkpoint are skipped and their
+scores merged back in, so an interrupted run never re-queries the model.
 """
 
+import argparse
+import asyncio
+import functools
+import inspect
 import json
 import os
+import random
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
 from pathlib import Path
-from typing import List, Dict
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+    Union,
+)
 
-import nltk
-from rouge_score import rouge_scorer
-import openai
+from pipelines import code_exec
+from pipelines import metrics as batch_metrics
+from pipelines.response_cache import ResponseCache
 
 REGISTRY_PATH = Path("pipelines/registry.json")
 BENCHMARK_PATH = Path("data/eval/benchmark.jsonl")
 RESULTS_DIR = Path("data/eval/results")
-RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+CACHE_PATH = Path("data/eval/cache.sqlite")
+CHECKPOINT_DIR = Path("data/eval/checkpoints")
+
+MAX_IN_FLIGHT = int(os.getenv("EVAL_MAX_IN_FLIGHT", "8"))
+MAX_RETRIES = int(os.getenv("EVAL_MAX_RETRIES", "5"))
+BACKOFF_BASE_S = 1.0   # first retry waits up to 1 s, the cap doubling per attempt
+BACKOFF_MAX_S = 60.0
+CACHE_MAX_BYTES = int(os.getenv("EVAL_CACHE_MAX_MB", "256")) << 20
+PARTIAL_RESULTS_EVERY = 100  # rewrite the results JSON every N scored items
+
+PASS_K = 3
+PASS_K_SAMPLES = max(PASS_K, int(os.getenv("EVAL_PASS_K_SAMPLES", str(PASS_K))))
+PASS_K_TEMPERATURE = 0.8
 
-nltk.download("punkt", quiet=True)  # for BLEU tokenizer
+# Sampling parameters sent with every request (part of the cache key).
+REQUEST_PARAMS: Dict = {"temperature": 0.0}
+
+# A model call is either a blocking `(model, prompt, **params) -> str`
+# function such as `_call_model`, or an `async def` with the same signature.
+# `params` override REQUEST_PARAMS and are only passed when non-empty (Pass@k
+# sampling), so `(model, prompt)` fakes work for text-only benchmarks.
+ModelCall = Callable[..., Union[str, Awaitable[str]]]
 
 # ---------------------------------------------------------------------------- #
 # Helper functions
@@ -51,34 +115,216 @@ def _latest_model() -> str:
     return latest
 
 
-def _load_benchmark() -> List[Dict]:
-    with BENCHMARK_PATH.open(encoding="utf-8") as f:
-        return [json.loads(line) for line in f]
+def _iter_benchmark(path: Optional[Path] = None) -> Iterator[Dict]:
+    """
+    Yield benchmark items one line at a time (blank lines are skipped).
+    Items without an "id" get a stable "line-<n>" id for checkpointing.
+    """
+    with (path or BENCHMARK_PATH).open(encoding="utf-8") as f:
+        for lineno, line in enumerate(f, start=1):
+            if line.strip():
+                item = json.loads(line)
+                item.setdefault("id", f"line-{lineno}")
+                yield item
+
+
+def _messages(prompt: str) -> List[Dict[str, str]]:
+    return [{"role": "user", "content": prompt}]
 
 
-def _call_model(model: str, prompt: str) -> str:
+def _call_model(model: str, prompt: str, **params) -> str:
+    import openai  # deferred: keeps `import pipelines.evaluate` cheap
+
     response = openai.ChatCompletion.create(
         model=model,
-        messages=[{"role": "user", "content": prompt}],
-        temperature=0.0,
+        messages=_messages(prompt),
+        **{**REQUEST_PARAMS, **params},
     )
     return response.choices[0].message.content.strip()
 
 
 # ---------------------------------------------------------------------------- #
-# Metric calculators
+# Concurrent dispatch
 # ---------------------------------------------------------------------------- #
-scorer = rouge_scorer.RougeScorer(["rougeL"], use_stemmer=True)
+def _is_rate_limit(exc: BaseException) -> bool:
+    """True for OpenAI rate-limit errors (any client version) or HTTP 429s."""
+    if type(exc).__name__ == "RateLimitError":
+        return True
+    status = getattr(exc, "http_status", None) or getattr(exc, "status_code", None)
+    return status == 429
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter, capped at BACKOFF_MAX_S."""
+    return random.uniform(0, min(BACKOFF_MAX_S, BACKOFF_BASE_S * 2 ** attempt))
+
+
+async def _call_with_retry(
+    call: ModelCall,
+    model: str,
+    prompt: str,
+    sem: asyncio.Semaphore,
+    executor: ThreadPoolExecutor,
+    max_retries: int,
+    cache: Optional[ResponseCache] = None,
+    params: Optional[Dict] = None,
+    sample: Optional[int] = None,
+) -> str:
+    """
+    Run one model call under the in-flight limit, retrying on rate limits.
+    Cached responses are returned without taking an in-flight slot.
+
+    `sample` distinguishes repeated draws of the same sampled request in
+    the cache key; it is not sent to the model.
+    """
+    params = params or {}
+    key = None
+    if cache is not None:
+        key_params = {**REQUEST_PARAMS, **params}
+        if sample is not None:
+            key_params["sample"] = sample
+        key = ResponseCache.key(model, _messages(prompt), key_params)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    loop = asyncio.get_running_loop()
+    invoke = functools.partial(call, model, prompt, **params)
+    async with sem:
+        attempt = 0
+        while True:
+            try:
+                if inspect.iscoroutinefunction(call):
+                    pred = await invoke()
+                else:
+                    pred = await loop.run_in_executor(executor, invoke)
+                break
+            except Exception as exc:
+                if not _is_rate_limit(exc) or attempt >= max_retries:
+                    raise
+                await asyncio.sleep(_backoff_delay(attempt))
+                attempt += 1
+
+    if cache is not None:
+        cache.put(key, pred)
+    return pred
+
+
+def _wants_samples(item: Dict) -> bool:
+    """Code items with executable tests are scored from PASS_K_SAMPLES draws."""
+    return item.get("type") == "code" and bool(item.get("tests"))
+
 
+async def _predict_item(
+    call: ModelCall,
+    model: str,
+    item: Dict,
+    sem: asyncio.Semaphore,
+    executor: ThreadPoolExecutor,
+    max_retries: int,
+    cache: Optional[ResponseCache],
+) -> Union[str, List[str]]:
+    """One greedy prediction, or PASS_K_SAMPLES sampled completions."""
+    if not _wants_samples(item):
+        return await _call_with_retry(
+            call, model, item["prompt"], sem, executor, max_retries, cache
+        )
+    draws = [
+        _call_with_retry(
+            call,
+            model,
+            item["prompt"],
+            sem,
+            executor,
+            max_retries,
+            cache,
+            params={"temperature": PASS_K_TEMPERATURE},
+            sample=i,
+        )
+        for i in range(PASS_K_SAMPLES)
+    ]
+    return list(await asyncio.gather(*draws))
 
+
+async def _stream_predictions(
+    model: str,
+    items: Iterable[Dict],
+    call: ModelCall = _call_model,
+    max_in_flight: int = MAX_IN_FLIGHT,
+    max_retries: int = MAX_RETRIES,
+    cache: Optional[ResponseCache] = None,
+) -> AsyncIterator[Tuple[Dict, Union[str, List[str]]]]:
+    """
+    Yield `(item, prediction)` pairs in input order while keeping at most
+    `max_in_flight` requests outstanding. The prediction is a list of
+    completions for items scored by sampled Pass@k.
+
+    `items` is consumed lazily: only a window of 2 * max_in_flight items is
+    held at once, so memory stays flat however large the benchmark is.
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be >= 1")
+
+    sem = asyncio.Semaphore(max_in_flight)
+    window: deque = deque()
+    source = iter(items)
+
+    with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+        try:
+            while True:
+                while len(window) < 2 * max_in_flight:
+                    item = next(source, None)
+                    if item is None:
+                        break
+                    task = asyncio.ensure_future(
+                        _predict_item(
+                            call, model, item, sem, executor, max_retries, cache
+                        )
+                    )
+                    window.append((item, task))
+                if not window:
+                    return
+                item, task = window.popleft()
+                yield item, await task
+        finally:
+            for _, task in window:
+                task.cancel()
+
+
+async def _predict_all(
+    model: str,
+    prompts: Iterable[str],
+    call: ModelCall = _call_model,
+    max_in_flight: int = MAX_IN_FLIGHT,
+    max_retries: int = MAX_RETRIES,
+    cache: Optional[ResponseCache] = None,
+) -> List[str]:
+    """
+    Query `model` for every prompt with at most `max_in_flight` requests
+    outstanding. Predictions are returned in the same order as `prompts`.
+    """
+    stream = _stream_predictions(
+        model,
+        ({"prompt": prompt} for prompt in prompts),
+        call=call,
+        max_in_flight=max_in_flight,
+        max_retries=max_retries,
+        cache=cache,
+    )
+    return [pred async for _, pred in stream]
+
+
+# ---------------------------------------------------------------------------- #
+# Metric calculators
+# ---------------------------------------------------------------------------- #
+# Rouge-L / BLEU-4 come from the batch engine in `pipelines/metrics.py`, which
+# matches rouge_score / nltk exactly but caches tokenizations across items.
 def rouge_l(ref: str, hyp: str) -> float:
-    return scorer.score(ref, hyp)["rougeL"].fmeasure
+    return batch_metrics.rouge_l(ref, hyp)
 
 
 def bleu4(ref: str, hyp: str) -> float:
-    ref_tokens = [nltk.word_tokenize(ref.lower())]
-    hyp_tokens = nltk.word_tokenize(hyp.lower())
-    return nltk.translate.bleu_score.sentence_bleu(ref_tokens, hyp_tokens)
+    return batch_metrics.bleu4(ref, hyp)
 
 
 def pass_at_k(pred: str, exp: str, k: int = 3) -> int:
@@ -86,40 +332,285 @@ def pass_at_k(pred: str, exp: str, k: int = 3) -> int:
     return int(exp.strip() in pred.strip())
 
 
+def _exec_score(
+    results: List[code_exec.SampleResult], tests, k: int, wall_s: float
+) -> Tuple[float, Dict]:
+    """Unbiased pass@k and execution stats for one item's sandboxed samples."""
+    passed = sum(r.passed for r in results)
+    stats = {
+        "samples": len(results),
+        "passed": passed,
+        "timeouts": sum(r.timed_out for r in results),
+        "tests": code_exec.num_tests(tests) * len(results),
+        "exec_s": sum(r.duration_s for r in results),
+        "wall_s": wall_s,
+    }
+    return code_exec.estimate_pass_at_k(len(results), passed, k), stats
+
+
+# ---------------------------------------------------------------------------- #
+# Running aggregates
+# ---------------------------------------------------------------------------- #
+class _Aggregates:
+    """Constant-memory running means for every metric bucket."""
+
+    def __init__(self, model: str):
+        self.model = model
+        self.num_samples = 0
+        self._sums = {"rougeL": 0.0, "bleu4": 0.0, "pass@3": 0.0}
+        self._counts = {"rougeL": 0, "bleu4": 0, "pass@3": 0}
+        self._bleu_corpus = batch_metrics.BleuStats()
+        self._exec = {"samples": 0, "passed": 0, "timeouts": 0, "tests": 0,
+                      "exec_s": 0.0, "wall_s": 0.0}
+
+    def add(self, record: Dict) -> None:
+        """Fold one per-item score record (see `_score_item`) into the totals."""
+        self.num_samples += 1
+        for metric in self._sums:
+            if metric in record:
+                self._sums[metric] += record[metric]
+                self._counts[metric] += 1
+        if "bleu_stats" in record:
+            self._bleu_corpus += batch_metrics.BleuStats(**record["bleu_stats"])
+        for key, value in record.get("exec", {}).items():
+            self._exec[key] += value
+
+    def _exec_metrics(self) -> Dict:
+        ex = self._exec
+        return {
+            **ex,
+            "tests_per_sec": ex["tests"] / ex["wall_s"] if ex["wall_s"] else 0.0,
+            "timeout_rate": ex["timeouts"] / max(1, ex["samples"]),
+            "mean_sample_s": ex["exec_s"] / max(1, ex["samples"]),
+        }
+
+    def metrics(self) -> Dict:
+        means = {m: self._sums[m] / max(1, self._counts[m]) for m in self._sums}
+        return {
+            "model": self.model,
+            **means,
+            "bleu4_corpus": self._bleu_corpus.score(),
+            "num_samples": self.num_samples,
+            "code_exec": self._exec_metrics(),
+        }
+
+
+def _score_item(item: Dict, pred: str) -> Dict:
+    """
+    Per-item scores; also the unit persisted in the checkpoint file.
+    Sampled code items are scored in the sandbox by `_evaluate` instead.
+    """
+    record = {"id": item["id"], "type": item["type"]}
+    if item["type"] == "text":
+        stats = batch_metrics.bleu_stats(item["expected"], pred)
+        record["rougeL"] = rouge_l(item["expected"], pred)
+        record["bleu4"] = stats.score()
+        record["bleu_stats"] = asdict(stats)
+    else:  # code
+        record["pass@3"] = pass_at_k(pred, item["expected"], k=3)
+    return record
+
+
+def _write_results(path: Path, metrics: Dict) -> None:
+    """Atomically replace the results JSON so readers never see half a file."""
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(metrics, indent=2))
+    os.replace(tmp, path)
+
+
+# ---------------------------------------------------------------------------- #
+# Checkpointing
+# ---------------------------------------------------------------------------- #
+def _checkpoint_path(model: str) -> Path:
+    return CHECKPOINT_DIR / f"eval-{model.replace(':', '_')}.jsonl"
+
+
+def _replay_checkpoint(path: Path, agg: _Aggregates) -> Set[str]:
+    """
+    Fold records from a previous run into `agg` and return their item ids.
+
+    A torn final line (process killed mid-write) is truncated away so new
+    records append cleanly; that item is simply evaluated again.
+    """
+    done: Set[str] = set()
+    if not path.exists():
+        return done
+
+    valid_bytes = 0
+    with path.open("rb") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                break
+            if not line.endswith(b"\n"):
+                break
+            valid_bytes += len(line)
+            if record["id"] not in done:
+                done.add(record["id"])
+                agg.add(record)
+
+    os.truncate(path, valid_bytes)
+    return done
+
+
 # ---------------------------------------------------------------------------- #
 # Main evaluation loop
 # ---------------------------------------------------------------------------- #
-def run_eval():
-    if not os.getenv("OPENAI_API_KEY"):
-        raise EnvironmentError("OPENAI_API_KEY missing")
+async def _evaluate(
+    agg: _Aggregates,
+    items: Iterable[Dict],
+    out_path: Path,
+    checkpoint: TextIO,
+    call: ModelCall,
+    max_in_flight: int,
+    cache: Optional[ResponseCache],
+) -> _Aggregates:
+    """
+    read → dispatch → score → aggregate, appending each record to the open
+    `checkpoint` file and flushing partial results as it goes.
+
+    Sampled code items are not awaited in turn: every sample goes to one
+    sandbox pool shared by the whole run, and an item's record is written
+    once its last sample finishes (checkpoint order is completion order).
+    At most 2 × code_exec.MAX_WORKERS items are being executed at a time;
+    past that the stream waits, so memory stays flat when the model
+    answers faster than the sandbox runs.
+    """
+    def add(record: Dict) -> None:
+        checkpoint.write(json.dumps(record) + "\n")
+        checkpoint.flush()
+        agg.add(record)
+        if agg.num_samples % PARTIAL_RESULTS_EVERY == 0:
+            _write_results(out_path, {**agg.metrics(), "partial": True})
+
+    exec_pool = ThreadPoolExecutor(
+        max_workers=code_exec.MAX_WORKERS, thread_name_prefix="eval-exec"
+    )
+
+    async def score_samples(item: Dict, completions: List[str]) -> None:
+        start = time.perf_counter()
+        futures = code_exec.submit_samples(exec_pool, completions, item["tests"])
+        results = await asyncio.gather(*(asyncio.wrap_future(f) for f in futures))
+        record = {"id": item["id"], "type": item["type"]}
+        record["pass@3"], record["exec"] = _exec_score(
+            results, item["tests"], PASS_K, wall_s=time.perf_counter() - start
+        )
+        add(record)
+
+    slots = asyncio.Semaphore(code_exec.MAX_WORKERS * 2)
+    scoring: Set[asyncio.Task] = set()
+    errors: List[BaseException] = []
+
+    def done(task: asyncio.Task) -> None:
+        scoring.discard(task)
+        slots.release()
+        if not task.cancelled() and task.exception() is not None:
+            errors.append(task.exception())
+
+    stream = _stream_predictions(
+        agg.model, items, call=call, max_in_flight=max_in_flight, cache=cache
+    )
+    try:
+        async for item, pred in stream:
+            if isinstance(pred, list):
+                await slots.acquire()
+                if errors:
+                    raise errors[0]
+                task = asyncio.create_task(score_samples(item, pred))
+                scoring.add(task)
+                task.add_done_callback(done)
+            else:
+                add(_score_item(item, pred))
+        await asyncio.gather(*scoring)
+        if errors:
+            raise errors[0]
+    finally:
+        for task in scoring:
+            task.cancel()
+        exec_pool.shutdown(wait=True, cancel_futures=True)
+    return agg
+
+
+def run_eval(
+    max_in_flight: int = MAX_IN_FLIGHT,
+    call_model: Optional[ModelCall] = None,
+    use_cache: bool = True,
+    resume: bool = False,
+) -> Dict:
+    """
+    Evaluate the latest registered model on the benchmark.
+
+    `call_model` replaces `_call_model` (e.g. a fake or a local stub server
+    client); the OPENAI_API_KEY check only applies to the default client.
+    With `use_cache`, responses are read from / written to CACHE_PATH.
+    With `resume`, items recorded in this model's checkpoint are skipped
+    and their stored scores merged into the totals.
+    """
+    if call_model is None:
+        if not os.getenv("OPENAI_API_KEY"):
+            raise EnvironmentError("OPENAI_API_KEY missing")
+        call_model = _call_model
 
     model = _latest_model()
-    dataset = _load_benchmark()
-
-    rouge_scores, bleu_scores, pass_scores = [], [], []
-    for item in dataset:
-        pred = _call_model(model, item["prompt"])
-
-        if item["type"] == "text":
-            rouge_scores.append(rouge_l(item["expected"], pred))
-            bleu_scores.append(bleu4(item["expected"], pred))
-        else:  # code
-            pass_scores.append(pass_at_k(pred, item["expected"], k=3))
-
-    metrics = {
-        "model": model,
-        "rougeL": sum(rouge_scores) / max(1, len(rouge_scores)),
-        "bleu4": sum(bleu_scores) / max(1, len(bleu_scores)),
-        "pass@3": sum(pass_scores) / max(1, len(pass_scores)),
-        "num_samples": len(dataset),
-    }
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    out_path = RESULTS_DIR / f"eval-{model.replace(':', '_')}.json"
+    ckpt_path = _checkpoint_path(model)
+    ckpt_path.parent.mkdir(parents=True, exist_ok=True)
+
+    agg = _Aggregates(model)
+    done: Set[str] = set()
+    if resume:
+        done = _replay_checkpoint(ckpt_path, agg)
+        print(f"↩️  Resuming: {len(done)} items already scored")
+    items = (item for item in _iter_benchmark() if item["id"] not in done)
+
+    cache = ResponseCache(CACHE_PATH, max_bytes=CACHE_MAX_BYTES) if use_cache else None
+    try:
+        with ckpt_path.open("a" if resume else "w", encoding="utf-8") as checkpoint:
+            asyncio.run(
+                _evaluate(agg, items, out_path, checkpoint, call_model, max_in_flight, cache)
+            )
+        metrics = agg.metrics()
+        metrics["resumed_items"] = len(done)
+        if cache is not None:
+            metrics["cache"] = cache.stats()
+    finally:
+        if cache is not None:
+            cache.close()
 
     # Save results JSON
-    out_path = RESULTS_DIR / f"eval-{model.replace(':', '_')}.json"
-    out_path.write_text(json.dumps(metrics, indent=2))
+    _write_results(out_path, metrics)
     print(f"✅ Eval complete → {out_path}")
     print(json.dumps(metrics, indent=2))
+    return metrics
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Evaluate the latest fine-tuned model.")
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=MAX_IN_FLIGHT,
+        help="maximum concurrent model requests (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"bypass the response cache at {CACHE_PATH}",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=f"skip items already recorded in the checkpoint under {CHECKPOINT_DIR}",
+    )
+    return parser.parse_args()
 
 
 if __name__ == "__main__":
-    run_eval()
+    args = _parse_args()
+    run_eval(
+        max_in_flight=args.max_in_flight,
+        use_cache=not args.no_cache,
+        resume=args.resume,
+    )
@@ -0,0 +1,343 @@
+"""
+feedback_archive.py
+────────────────────────────────────────────────────────────────────────────
+Compact closed feedback days into a compressed, columnar archive and read
+live (`.jsonl`) and archived days through one interface.
+
+Archive formats
+---------------
+• Parquet (`.parquet`, zstd)   – when `pyarrow` is installed and every
+                                 column holds one scalar type
+• Column blocks (`.fcol`)      – stdlib fallback:
+
+      b"FBCOL\\x01" | u32 header length | header JSON | column blocks
+
+  The header holds the row count, codec and each column's (offset, length)
+  in the block area. Every column is a JSON array compressed on its own
+  (zstd when `zstandard` is installed, else zlib), so scanning `rating` or
+  `timestamp` never decompresses prompts or responses.
+
+Both formats also record which rows lacked which keys (so records read
+back exactly as written, with no `None` filled in) and the SHA-256 of the
+`.jsonl` file last merged in. Records that arrive for a day after it was
+archived are merged into the existing archive, appended after its rows;
+a leftover `.jsonl` whose digest matches the archive's is one that was
+archived but not yet unlinked, and is ignored.
+
+Usage:
+    python -m pipelines.feedback_archive            # archive closed days
+
+    from pipelines.feedback_archive import iter_feedback, scan_column
+    ratings = scan_column("rating")                 # every day, any format
+    for record in iter_feedback(): ...
+"""
+
+import hashlib
+import json
+import os
+import struct
+import time
+import zlib
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from pipelines.collect_feedback import DATA_DIR
+
+ARCHIVE_GRACE_S = 3600  # leave a day file alone until writers have moved on
+
+MAGIC = b"FBCOL\x01"
+_HEADER_LEN = struct.Struct("<I")
+ARCHIVE_SUFFIXES = (".parquet", ".fcol")
+_PARQUET_META_KEY = b"feedback_archive"
+
+
+# --------------------------------------------------------------------- #
+# Optional backends
+# --------------------------------------------------------------------- #
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        return None
+    return pyarrow
+
+
+def _parquet(path: Path):
+    pa = _pyarrow()
+    if pa is None:
+        raise RuntimeError(f"{path} is a Parquet archive; install `pyarrow` to read it")
+    return pa.parquet
+
+
+def _zstd():
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+def _compress(data: bytes) -> Tuple[str, bytes]:
+    zstd = _zstd()
+    if zstd is not None:
+        return "zstd", zstd.ZstdCompressor(level=10).compress(data)
+    return "zlib", zlib.compress(data, 9)
+
+
+def _decompress(codec: str, data: bytes) -> bytes:
+    if codec == "zstd":
+        zstd = _zstd()
+        if zstd is None:
+            raise RuntimeError("archive is zstd-compressed; install `zstandard`")
+        return zstd.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+# --------------------------------------------------------------------- #
+# .fcol writer / reader
+# --------------------------------------------------------------------- #
+def _columns_of(records: Sequence[Dict]) -> List[str]:
+    names: Dict[str, None] = {}
+    for record in records:
+        names.update(dict.fromkeys(record))
+    return list(names)
+
+
+def _absent_keys(records: Sequence[Dict], names: Sequence[str]) -> Dict[str, List[int]]:
+    """Column -> indices of the rows that do not have that key."""
+    absent = {name: [i for i, r in enumerate(records) if name not in r] for name in names}
+    return {name: rows for name, rows in absent.items() if rows}
+
+
+def write_fcol(path: Path, records: Sequence[Dict], source: Optional[str] = None) -> None:
+    blocks, layout, codec, offset = [], {}, "zlib", 0
+    names = _columns_of(records)
+    for name in names:
+        values = [r.get(name) for r in records]
+        codec, block = _compress(json.dumps(values, ensure_ascii=False).encode("utf-8"))
+        layout[name] = [offset, len(block)]
+        blocks.append(block)
+        offset += len(block)
+
+    header = json.dumps({
+        "rows": len(records),
+        "codec": codec,
+        "columns": layout,
+        "absent": _absent_keys(records, names),
+        "source": source,
+    }).encode()
+    with path.open("wb") as f:
+        f.write(MAGIC)
+        f.write(_HEADER_LEN.pack(len(header)))
+        f.write(header)
+        for block in blocks:
+            f.write(block)
+
+
+def _fcol_header(f) -> Dict:
+    if f.read(len(MAGIC)) != MAGIC:
+        raise ValueError(f"{f.name} is not a feedback column archive")
+    (length,) = _HEADER_LEN.unpack(f.read(_HEADER_LEN.size))
+    header = json.loads(f.read(length))
+    header["data_start"] = len(MAGIC) + _HEADER_LEN.size + length
+    return header
+
+
+def _read_fcol(path: Path, columns: Optional[Sequence[str]]) -> Dict[str, List]:
+    with path.open("rb") as f:
+        header = _fcol_header(f)
+        wanted = header["columns"] if columns is None else columns
+        out: Dict[str, List] = {}
+        for name in wanted:
+            if name not in header["columns"]:
+                out[name] = [None] * header["rows"]
+                continue
+            offset, length = header["columns"][name]
+            f.seek(header["data_start"] + offset)
+            raw = _decompress(header["codec"], f.read(length))
+            out[name] = json.loads(raw)
+        return out
+
+
+# --------------------------------------------------------------------- #
+# Format-independent reading
+# --------------------------------------------------------------------- #
+def archive_meta(path: Path) -> Dict:
+    """Row count, absent keys and source digest of an archive, from metadata only."""
+    if path.suffix == ".parquet":
+        metadata = _parquet(path).ParquetFile(path).metadata
+        extra = (metadata.metadata or {}).get(_PARQUET_META_KEY)
+        return {"rows": metadata.num_rows, **(json.loads(extra) if extra else {})}
+    with path.open("rb") as f:
+        return _fcol_header(f)
+
+
+def archive_rows(path: Path) -> int:
+    """Row count of an archive, read from metadata only."""
+    return archive_meta(path)["rows"]
+
+
+def read_columns(path: Path, columns: Optional[Sequence[str]] = None) -> Dict[str, List]:
+    """Column-wise contents of one day (any format); None means all columns."""
+    if path.suffix == ".fcol":
+        return _read_fcol(path, columns)
+    if path.suffix == ".parquet":
+        table = _parquet(path).read_table(path, columns=columns)
+        return table.to_pydict()
+
+    records = list(_iter_jsonl(path))
+    names = list(columns) if columns is not None else _columns_of(records)
+    return {name: [r.get(name) for r in records] for name in names}
+
+
+def _iter_jsonl(path: Path) -> Iterator[Dict]:
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def iter_records(path: Path, start: int = 0) -> Iterator[Dict]:
+    """Records of one day (any format), skipping the first `start` rows."""
+    if path.suffix == ".jsonl":
+        for i, record in enumerate(_iter_jsonl(path)):
+            if i >= start:
+                yield record
+        return
+    absent = {
+        name: set(rows) for name, rows in (archive_meta(path).get("absent") or {}).items()
+    }
+    cols = read_columns(path)
+    names = list(cols)
+    rows = islice(enumerate(zip(*(cols[n] for n in names))), start, None)
+    for i, row in rows:
+        yield {n: v for n, v in zip(names, row) if not (n in absent and i in absent[n])}
+
+
+def day_files(data_dir: Optional[Path] = None) -> List[Path]:
+    """
+    The files of every day, oldest first: a day's archive, then its `.jsonl`
+    if records arrived after it was archived. A `.jsonl` already merged into
+    the archive (archiving crashed before unlinking it) is left out.
+    """
+    data_dir = data_dir or DATA_DIR
+    days: Dict[str, List[Path]] = {}
+    for archive in sorted((data_dir / "archive").glob("*")):
+        if archive.suffix in ARCHIVE_SUFFIXES:
+            days.setdefault(archive.stem, []).append(archive)
+    for path in data_dir.glob("*.jsonl"):
+        archived = days.get(path.stem)
+        if archived and archive_meta(archived[0]).get("source") == _sha256(path):
+            continue
+        days.setdefault(path.stem, []).append(path)
+    return [path for day in sorted(days) for path in days[day]]
+
+
+def iter_feedback(data_dir: Optional[Path] = None) -> Iterator[Dict]:
+    for path in day_files(data_dir):
+        yield from iter_records(path)
+
+
+def scan_column(name: str, data_dir: Optional[Path] = None) -> List:
+    """
+    All values of one column across every day. Archived days decode just
+    that column; live `.jsonl` days are parsed in full.
+    """
+    values: List = []
+    for path in day_files(data_dir):
+        values.extend(read_columns(path, [name])[name])
+    return values
+
+
+# --------------------------------------------------------------------- #
+# Archiving
+# --------------------------------------------------------------------- #
+_PARQUET_SCALARS = (bool, int, float, str)
+
+
+def _parquet_table(pa, records: Sequence[Dict], source: str):
+    """
+    An Arrow table over the union of the records' keys, or None when a
+    column would not read back exactly: mixed types (Arrow would coerce
+    1 to 1.0, or fail on int vs str) or nested values. Such a day is
+    archived as `.fcol`, which stores the JSON values as they are.
+    """
+    names = _columns_of(records)
+    columns = {name: [r.get(name) for r in records] for name in names}
+    for values in columns.values():
+        kinds = {type(v) for v in values if v is not None}
+        if len(kinds) > 1 or not kinds <= set(_PARQUET_SCALARS):
+            return None
+    try:
+        table = pa.table(columns)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+        return None
+    extra = {"absent": _absent_keys(records, names), "source": source}
+    return table.replace_schema_metadata({_PARQUET_META_KEY: json.dumps(extra)})
+
+
+def archive_day(jsonl_path: Path, archive_dir: Optional[Path] = None) -> Path:
+    """
+    Compact one day file into the archive and remove the original. If the
+    day is already archived, its rows are kept and the new records appended
+    (so readers' row offsets stay valid); the archive is never overwritten
+    with only the new records.
+    """
+    archive_dir = archive_dir or jsonl_path.parent / "archive"
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    raw = jsonl_path.read_bytes()
+    source = hashlib.sha256(raw).hexdigest()
+
+    previous = [
+        p for p in (archive_dir / f"{jsonl_path.stem}{s}" for s in ARCHIVE_SUFFIXES) if p.exists()
+    ]
+    records: List[Dict] = []
+    for old in previous:
+        if archive_meta(old).get("source") == source:
+            jsonl_path.unlink()  # merged already; a crash kept the text file
+            return old
+        records.extend(iter_records(old))
+    records.extend(json.loads(line) for line in raw.decode("utf-8").splitlines() if line.strip())
+
+    pa = _pyarrow()
+    table = _parquet_table(pa, records, source) if pa is not None else None
+    suffix = ".parquet" if table is not None else ".fcol"
+    out_path = archive_dir / f"{jsonl_path.stem}{suffix}"
+    tmp = out_path.with_name(out_path.name + ".tmp")
+    if table is not None:
+        pa.parquet.write_table(table, tmp, compression="zstd")
+    else:
+        write_fcol(tmp, records, source=source)
+    os.replace(tmp, out_path)
+    for old in previous:
+        if old != out_path:
+            old.unlink()  # merged into the other format
+    jsonl_path.unlink()
+    return out_path
+
+
+def archive_closed_days(
+    data_dir: Optional[Path] = None, now: Optional[float] = None
+) -> List[Path]:
+    """Archive every day file before today (UTC) untouched for ARCHIVE_GRACE_S."""
+    data_dir = data_dir or DATA_DIR
+    now = time.time() if now is None else now
+    today = datetime.utcfromtimestamp(now).strftime("%Y-%m-%d")
+
+    archived = []
+    for path in sorted(data_dir.glob("*.jsonl")):
+        if path.stem < today and now - path.stat().st_mtime >= ARCHIVE_GRACE_S:
+            archived.append(archive_day(path, data_dir / "archive"))
+    return archived
+
+
+if __name__ == "__main__":
+    for out in archive_closed_days():
+        print(f"🗜️  Archived → {out}")
@@ -4,20 +4,42 @@ fine_tune.py
 Automate the end-to-end fine-tune loop.
 
   1. Discover feedback JSONL files in data/feedback/
-  2. Merge into data/fine_tune/dataset-<timestamp>.jsonl
+  2. Incrementally merge new, de-duplicated records into
+     data/fine_tune/dataset.jsonl
   3. Call OpenAI fine-tune endpoint  (alt: SageMaker LoRA placeholder)
-  4. Append new entry to pipelines/registry.json for tracking
+  4. Append new entry to pipelines/registry.json for tracking, pinning the
+     exact dataset trained on (committed byte length + SHA-256 of those bytes)
 
 Env vars required (OpenAI):
   OPENAI_API_KEY
+
+Incremental merge
+-----------------
+The manifest (`data/fine_tune/manifest.sqlite`) records, per feedback file,
+how many bytes have been consumed plus a fingerprint of the first block.
+Each run reads only bytes past that offset (complete lines only), so cost
+is O(new data). A file that shrank or whose fingerprint changed is re-read
+from the start. Records are de-duplicated by a SHA-256 of their content
+(all fields except the timestamp). Archived days
+(`data/feedback/archive/*`, see `pipelines/feedback_archive.py`) are tracked
+by rows consumed instead of bytes.
+
+Offsets, seen hashes and the committed dataset length are updated in one
+SQLite transaction after the dataset is flushed; on start-up the dataset is
+truncated back to the committed length, so an interrupted merge is simply
+redone.
 """
 
+import hashlib
 import json
 import os
+import sqlite3
 import subprocess
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+
+from pipelines import feedback_archive
 
 # --------------------------------------------------------------------- #
 # Paths
@@ -25,23 +47,183 @@ from typing import Dict, List
 FEEDBACK_DIR = Path("data/feedback")
 FINE_TUNE_DIR = Path("data/fine_tune")
 REGISTRY_PATH = Path("pipelines/registry.json")
+DATASET_PATH = FINE_TUNE_DIR / "dataset.jsonl"
+MANIFEST_PATH = FINE_TUNE_DIR / "manifest.sqlite"
 FINE_TUNE_DIR.mkdir(parents=True, exist_ok=True)
 
+FINGERPRINT_BYTES = 4096
+DEDUP_EXCLUDE = {"timestamp"}  # same feedback re-submitted later is a duplicate
+
 # --------------------------------------------------------------------- #
 # Helper functions
 # --------------------------------------------------------------------- #
-def _merge_feedback() -> Path:
-    """Combine all feedback JSONL files into one dataset; return path."""
-    ts = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
-    out_path = FINE_TUNE_DIR / f"dataset-{ts}.jsonl"
+def _fingerprint(path: Path, length: int) -> str:
+    """SHA-256 of the first `length` bytes (capped) — detects rewritten files."""
+    with path.open("rb") as f:
+        return hashlib.sha256(f.read(min(length, FINGERPRINT_BYTES))).hexdigest()
+
+
+def _dataset_digest(path: Path, length: int) -> str:
+    """SHA-256 of the first `length` bytes: the dataset as of that commit (it only grows)."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        while length > 0:
+            chunk = f.read(min(length, 1 << 20))
+            if not chunk:
+                raise ValueError(f"{path} is shorter than its committed length")
+            digest.update(chunk)
+            length -= len(chunk)
+    return digest.hexdigest()
+
+
+def _content_hash(record: Dict) -> str:
+    content = {k: v for k, v in record.items() if k not in DEDUP_EXCLUDE}
+    canonical = json.dumps(content, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+_MANIFEST_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    name        TEXT PRIMARY KEY,
+    offset      INTEGER NOT NULL,
+    fingerprint TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS seen (hash TEXT PRIMARY KEY);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL);
+"""
+
+
+def _open_manifest() -> sqlite3.Connection:
+    db = sqlite3.connect(str(MANIFEST_PATH))
+    db.executescript(_MANIFEST_SCHEMA)
+    return db
+
+
+def _meta(db: sqlite3.Connection, key: str) -> int:
+    row = db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else 0
+
+
+def _file_state(db: sqlite3.Connection, name: str) -> Tuple[int, Optional[str]]:
+    row = db.execute(
+        "SELECT offset, fingerprint FROM files WHERE name = ?", (name,)
+    ).fetchone()
+    return (row[0], row[1]) if row else (0, None)
+
+
+def _is_new(db: sqlite3.Connection, record: Dict, stats: Dict) -> bool:
+    """Record the content hash; False (and count a duplicate) if seen before."""
+    stats["records_read"] += 1
+    cur = db.execute(
+        "INSERT OR IGNORE INTO seen (hash) VALUES (?)", (_content_hash(record),)
+    )
+    if cur.rowcount == 0:
+        stats["duplicates"] += 1
+        return False
+    stats["records_added"] += 1
+    return True
+
+
+def _merge_feedback() -> Tuple[Path, Dict]:
+    """
+    Append feedback records not yet merged to DATASET_PATH.
+    Returns the dataset path and merge statistics for this run.
+    """
+    stats = {
+        "files_scanned": 0,
+        "files_changed": 0,
+        "files_reset": 0,
+        "bytes_read": 0,
+        "records_read": 0,
+        "records_added": 0,
+        "duplicates": 0,
+        "malformed": 0,
+    }
+
+    db = _open_manifest()
+    try:
+        # Drop rows written by a merge that never committed.
+        committed_bytes = _meta(db, "dataset_bytes")
+        if DATASET_PATH.exists() and DATASET_PATH.stat().st_size > committed_bytes:
+            os.truncate(DATASET_PATH, committed_bytes)
+
+        with DATASET_PATH.open("ab") as out_file:
+            for file in sorted(FEEDBACK_DIR.glob("*.jsonl")):
+                stats["files_scanned"] += 1
+                offset, fingerprint = _file_state(db, file.name)
+                size = file.stat().st_size
+
+                if offset and (size < offset or _fingerprint(file, offset) != fingerprint):
+                    stats["files_reset"] += 1  # truncated or rewritten
+                    offset = 0
+                if size == offset:
+                    continue
+
+                stats["files_changed"] += 1
+                with file.open("rb") as f:
+                    f.seek(offset)
+                    for raw in f:
+                        if not raw.endswith(b"\n"):
+                            break  # writer mid-append; pick it up next run
+                        offset += len(raw)
+                        stats["bytes_read"] += len(raw)
+                        if not raw.strip():
+                            continue
+                        try:
+                            record = json.loads(raw)
+                        except json.JSONDecodeError:
+                            stats["malformed"] += 1
+                            continue
+
+                        if _is_new(db, record, stats):
+                            out_file.write(raw)
+
+                db.execute(
+                    "INSERT OR REPLACE INTO files (name, offset, fingerprint) VALUES (?, ?, ?)",
+                    (file.name, offset, _fingerprint(file, offset)),
+                )
+
+            # Archives only grow (appended rows): offset counts rows already consumed.
+            for file in sorted((FEEDBACK_DIR / "archive").glob("*")):
+                if file.suffix not in (".fcol", ".parquet"):
+                    continue
+                stats["files_scanned"] += 1
+                offset, _ = _file_state(db, file.name)
+                rows = feedback_archive.archive_rows(file)
+                if rows == offset:
+                    continue
+
+                stats["files_changed"] += 1
+                for record in feedback_archive.iter_records(file, start=offset):
+                    if _is_new(db, record, stats):
+                        line = json.dumps(record, ensure_ascii=False) + "\n"
+                        out_file.write(line.encode("utf-8"))
+                db.execute(
+                    "INSERT OR REPLACE INTO files (name, offset, fingerprint) VALUES (?, ?, ?)",
+                    (file.name, rows, "archive"),
+                )
+
+            out_file.flush()
+            os.fsync(out_file.fileno())
+            dataset_bytes = out_file.tell()
+
+        total = _meta(db, "total_records") + stats["records_added"]
+        db.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            [("dataset_bytes", dataset_bytes), ("total_records", total)],
+        )
+        db.commit()
+    finally:
+        db.close()
 
-    with out_path.open("w", encoding="utf-8") as out_file:
-        for file in FEEDBACK_DIR.glob("*.jsonl"):
-            with file.open(encoding="utf-8") as f:
-                for line in f:
-                    out_file.write(line)
-    print(f"📚 Merged dataset saved → {out_path.relative_to(Path.cwd())}")
-    return out_path
+    stats["total_records"] = total
+    stats["dataset_bytes"] = dataset_bytes
+    print(
+        f"📚 Merged {stats['records_added']} new records "
+        f"({stats['duplicates']} duplicates, {stats['bytes_read']} bytes read) "
+        f"→ {DATASET_PATH} [{total} total]"
+    )
+    return DATASET_PATH, stats
 
 
 def _openai_fine_tune(dataset_path: Path) -> Dict:
@@ -79,14 +261,20 @@ def _update_registry(entry: Dict) -> None:
 # Main pipeline
 # --------------------------------------------------------------------- #
 def run_fine_tune():
-    dataset = _merge_feedback()
+    dataset, merge_stats = _merge_feedback()
+    dataset_bytes = merge_stats["dataset_bytes"]
+    dataset_sha256 = _dataset_digest(dataset, dataset_bytes)
     job = _openai_fine_tune(dataset)
 
     registry_entry = {
         "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
         "job_id": job["id"],
         "base_model": "gpt-3.5-turbo",
-        "dataset": dataset.name,
+        "dataset": str(dataset),
+        "dataset_bytes": dataset_bytes,
+        "dataset_sha256": dataset_sha256,
+        "dataset_records": merge_stats["total_records"],
+        "merge_stats": merge_stats,
         "status": job["status"],
         "result_model": job.get("fine_tuned_model", "pending"),
     }
@@ -0,0 +1,237 @@
+"""
+metrics.py
+────────────────────────────────────────────────────────────────────────────
+Batch / corpus-level scoring engine for Rouge-L and BLEU-4.
+
+Scores are identical to `rouge_score.RougeScorer(["rougeL"], use_stemmer=True)`
+and `nltk.translate.bleu_score.sentence_bleu` (uniform weights, no smoothing),
+but computed much faster when the same references are scored repeatedly:
+
+• Every distinct text is tokenized once; reference tokenizations, LCS match
+  masks and n-gram counts are cached.
+• LCS length uses the bit-parallel algorithm (Allison–Dix / Hyyrö): the
+  reference is encoded as per-token bit vectors and each hypothesis token
+  updates the whole DP row with a handful of big-int operations, i.e.
+  O(|hyp| · |ref| / wordsize) instead of the O(|hyp| · |ref|) Python loop.
+• BLEU is computed from clipped n-gram match counts (`BleuStats`), which sum
+  across sentences, so corpus-BLEU falls out of the same pass as the mean of
+  sentence-BLEU.
+• `score_corpus(..., workers=N)` fans chunks out across a process pool.
+• nltk / rouge_score are imported (and punkt fetched) on first use only, so
+  importing this module is cheap and never touches the network.
+
+Usage:
+    from pipelines.metrics import score_corpus
+    scores = score_corpus(references, hypotheses, workers=4)
+    scores.mean_rouge_l, scores.mean_bleu4, scores.corpus_bleu4
+"""
+
+import math
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence, Tuple
+
+MAX_ORDER = 4
+TOKEN_CACHE_SIZE = 65_536
+
+Tokens = Tuple[str, ...]
+
+
+# ---------------------------------------------------------------------------- #
+# Lazy third-party initialisation
+# ---------------------------------------------------------------------------- #
+@lru_cache(maxsize=None)
+def _nltk() -> Any:
+    """Import nltk and fetch the punkt tokenizer models, once per process."""
+    import nltk
+
+    nltk.download("punkt", quiet=True)
+    return nltk
+
+
+@lru_cache(maxsize=None)
+def _rouge_tokenizer() -> Any:
+    from rouge_score import tokenizers
+
+    return tokenizers.DefaultTokenizer(use_stemmer=True)
+
+
+# ---------------------------------------------------------------------------- #
+# Tokenization (cached per distinct text)
+# ---------------------------------------------------------------------------- #
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def rouge_tokens(text: str) -> Tokens:
+    """Lower-cased, stemmed tokens exactly as `rouge_score` produces them."""
+    return tuple(_rouge_tokenizer().tokenize(text))
+
+
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def bleu_tokens(text: str) -> Tokens:
+    """Lower-cased `nltk.word_tokenize` tokens (as used for BLEU-4)."""
+    return tuple(_nltk().word_tokenize(text.lower()))
+
+
+# ---------------------------------------------------------------------------- #
+# Rouge-L
+# ---------------------------------------------------------------------------- #
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def _lcs_masks(ref: Tokens) -> Dict[str, int]:
+    """Bit i of masks[t] is set iff ref[i] == t."""
+    masks: Dict[str, int] = {}
+    for i, tok in enumerate(ref):
+        masks[tok] = masks.get(tok, 0) | (1 << i)
+    return masks
+
+
+def lcs_length(ref: Tokens, hyp: Tokens) -> int:
+    """Length of the longest common subsequence of two token sequences."""
+    if not ref or not hyp:
+        return 0
+    masks = _lcs_masks(ref)
+    full = (1 << len(ref)) - 1
+    v = full
+    for tok in hyp:
+        u = v & masks.get(tok, 0)
+        v = ((v + u) | (v - u)) & full
+    return len(ref) - bin(v).count("1")
+
+
+def rouge_l_tokens(ref: Tokens, hyp: Tokens) -> float:
+    """Rouge-L F-measure for pre-tokenized inputs."""
+    lcs = lcs_length(ref, hyp)
+    if lcs == 0:
+        return 0.0
+    precision = lcs / len(hyp)
+    recall = lcs / len(ref)
+    return 2 * precision * recall / (precision + recall)
+
+
+def rouge_l(ref: str, hyp: str) -> float:
+    return rouge_l_tokens(rouge_tokens(ref), rouge_tokens(hyp))
+
+
+# ---------------------------------------------------------------------------- #
+# BLEU-4
+# ---------------------------------------------------------------------------- #
+@dataclass
+class BleuStats:
+    """Sufficient statistics for BLEU; add them up for corpus-level BLEU."""
+
+    matches: List[int] = field(default_factory=lambda: [0] * MAX_ORDER)
+    totals: List[int] = field(default_factory=lambda: [0] * MAX_ORDER)
+    hyp_len: int = 0
+    ref_len: int = 0
+
+    def __iadd__(self, other: "BleuStats") -> "BleuStats":
+        for n in range(MAX_ORDER):
+            self.matches[n] += other.matches[n]
+            self.totals[n] += other.totals[n]
+        self.hyp_len += other.hyp_len
+        self.ref_len += other.ref_len
+        return self
+
+    def score(self) -> float:
+        """BLEU-4 with nltk's unsmoothed semantics (zero-match orders → tiny)."""
+        if self.matches[0] == 0:
+            return 0.0
+        log_p = 0.0
+        for m, t in zip(self.matches, self.totals):
+            p = m / t if m else sys.float_info.min
+            log_p += math.log(p) / MAX_ORDER
+        return _brevity_penalty(self.ref_len, self.hyp_len) * math.exp(log_p)
+
+
+def _brevity_penalty(ref_len: int, hyp_len: int) -> float:
+    if hyp_len > ref_len:
+        return 1.0
+    if hyp_len == 0:
+        return 0.0
+    return math.exp(1 - ref_len / hyp_len)
+
+
+def _ngrams(tokens: Tokens, n: int) -> Counter:
+    return Counter(tokens[i : i + n] for i in range(len(tokens) - n + 1))
+
+
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def _ref_ngrams(ref: Tokens) -> Tuple[Counter, ...]:
+    return tuple(_ngrams(ref, n) for n in range(1, MAX_ORDER + 1))
+
+
+def bleu_stats_tokens(ref: Tokens, hyp: Tokens) -> BleuStats:
+    stats = BleuStats(hyp_len=len(hyp), ref_len=len(ref))
+    for n, ref_counts in enumerate(_ref_ngrams(ref)):
+        hyp_counts = _ngrams(hyp, n + 1)
+        stats.matches[n] = sum(min(c, ref_counts[g]) for g, c in hyp_counts.items())
+        stats.totals[n] = max(1, len(hyp) - n)  # nltk floors denominators at 1
+    return stats
+
+
+def bleu_stats(ref: str, hyp: str) -> BleuStats:
+    return bleu_stats_tokens(bleu_tokens(ref), bleu_tokens(hyp))
+
+
+def bleu4(ref: str, hyp: str) -> float:
+    return bleu_stats(ref, hyp).score()
+
+
+# ---------------------------------------------------------------------------- #
+# Batch API
+# ---------------------------------------------------------------------------- #
+@dataclass
+class CorpusScores:
+    rouge_l: List[float]
+    bleu4: List[float]
+    corpus_bleu4: float
+
+    @property
+    def mean_rouge_l(self) -> float:
+        return sum(self.rouge_l) / max(1, len(self.rouge_l))
+
+    @property
+    def mean_bleu4(self) -> float:
+        return sum(self.bleu4) / max(1, len(self.bleu4))
+
+
+def _score_chunk(pairs: Sequence[Tuple[str, str]]) -> Tuple[List[float], List[float], BleuStats]:
+    rouge, bleu, total = [], [], BleuStats()
+    for ref, hyp in pairs:
+        rouge.append(rouge_l(ref, hyp))
+        stats = bleu_stats(ref, hyp)
+        bleu.append(stats.score())
+        total += stats
+    return rouge, bleu, total
+
+
+def score_corpus(
+    refs: Sequence[str],
+    hyps: Sequence[str],
+    workers: int = 1,
+    chunk_size: int = 512,
+) -> CorpusScores:
+    """
+    Score aligned reference/hypothesis lists.
+
+    With `workers > 1` the pairs are split into `chunk_size` chunks and
+    scored in a process pool; results keep the input order.
+    """
+    if len(refs) != len(hyps):
+        raise ValueError("refs and hyps must have the same length")
+
+    pairs = list(zip(refs, hyps))
+    if workers > 1 and len(pairs) > chunk_size:
+        chunks = [pairs[i : i + chunk_size] for i in range(0, len(pairs), chunk_size)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_score_chunk, chunks))
+    else:
+        results = [_score_chunk(pairs)]
+
+    rouge, bleu, total = [], [], BleuStats()
+    for r, b, stats in results:
+        rouge.extend(r)
+        bleu.extend(b)
+        total += stats
+    return CorpusScores(rouge_l=rouge, bleu4=bleu, corpus_bleu4=total.score())
@@ -0,0 +1,138 @@
+"""
+response_cache.py
+────────────────────────────────────────────────────────────────────────────
+Persistent, content-addressed cache of model responses used by
+`pipelines/evaluate.py`.
+
+Entries are keyed by SHA-256 of the canonical JSON of
+(model, messages, params), so a rerun with the same model id, prompt and
+sampling parameters is answered from disk instead of the API. The cache is
+a single SQLite file bounded by total payload size; the least recently
+used entries are evicted first.
+
+Usage:
+    from pipelines.response_cache import ResponseCache
+    cache = ResponseCache(Path("data/eval/cache.sqlite"), max_bytes=256 << 20)
+    key = ResponseCache.key(model, messages, {"temperature": 0.0})
+    if (hit := cache.get(key)) is None:
+        cache.put(key, call_model(...))
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key         TEXT PRIMARY KEY,
+    response    TEXT NOT NULL,
+    size        INTEGER NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_lru ON responses (last_access);
+"""
+
+
+class ResponseCache:
+    """Size-bounded LRU response cache backed by SQLite."""
+
+    def __init__(self, path: Path, max_bytes: int = 256 << 20):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._db = sqlite3.connect(str(path), isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+        row = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        self._total_bytes: int = row[0]
+
+    # ------------------------------------------------------------------ #
+    # Keys
+    # ------------------------------------------------------------------ #
+    @staticmethod
+    def key(model: str, messages: List[Dict[str, str]], params: Dict[str, Any]) -> str:
+        """Content hash of a chat request; identical requests share a key."""
+        canonical = json.dumps(
+            {"model": model, "messages": messages, "params": params},
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    # ------------------------------------------------------------------ #
+    # Lookup / insert
+    # ------------------------------------------------------------------ #
+    def get(self, key: str) -> Optional[str]:
+        row = self._db.execute(
+            "SELECT response FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._db.execute(
+            "UPDATE responses SET last_access = ? WHERE key = ?", (time.time(), key)
+        )
+        return row[0]
+
+    def put(self, key: str, response: str) -> None:
+        size = len(response.encode("utf-8"))
+        if size > self.max_bytes:
+            return  # would evict everything and still not fit
+
+        old = self._db.execute(
+            "SELECT size FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        self._db.execute(
+            "INSERT OR REPLACE INTO responses (key, response, size, last_access) "
+            "VALUES (?, ?, ?, ?)",
+            (key, response, size, time.time()),
+        )
+        self._total_bytes += size - (old[0] if old else 0)
+        self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until under `max_bytes`."""
+        while self._total_bytes > self.max_bytes:
+            victims = self._db.execute(
+                "SELECT key, size FROM responses ORDER BY last_access LIMIT 64"
+            ).fetchall()
+            if not victims:
+                break
+            for key, size in victims:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._total_bytes -= size
+                self.evictions += 1
+                if self._total_bytes <= self.max_bytes:
+                    break
+
+    # ------------------------------------------------------------------ #
+    # Introspection
+    # ------------------------------------------------------------------ #
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self),
+            "bytes": self._total_bytes,
+        }
+
+    def close(self) -> None:
+        self._db.close()
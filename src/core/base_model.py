@@ -1,28 +1,135 @@
 from __future__ import annotations
+import base64
+import os
 import uuid
-from abc import ABC, abstractmethod
-from typing import Dict, Any
-from loguru import logger
+from abc import ABC, ABCMeta, abstractmethod
+from typing import Any, Callable, ClassVar, Dict, FrozenSet, Optional
+from src.core import explanations, telemetry
 
+_log = telemetry.channel("BaseModel")
 
-class BaseModel(ABC):
+# Sentinel passed as `old` when a watched attribute is assigned for the first time.
+MISSING: Any = object()
+
+# "uuid": canonical 36-char UUID4 string. "short": the same 128 random bits as
+# 22-char unpadded base64url, ~14 bytes less per id and per registry key.
+ID_FORMAT = os.getenv("MODEL_ID_FORMAT", "uuid")
+
+
+def _uuid_id() -> str:
+    return str(uuid.uuid4())
+
+
+def _short_id() -> str:
+    return base64.urlsafe_b64encode(uuid.uuid4().bytes)[:22].decode("ascii")
+
+
+_ID_FACTORIES: Dict[str, Callable[[], str]] = {"uuid": _uuid_id, "short": _short_id}
+if ID_FORMAT not in _ID_FACTORIES:
+    raise ValueError(f"MODEL_ID_FORMAT must be 'uuid' or 'short', got '{ID_FORMAT}'")
+
+
+class ModelMeta(ABCMeta):
+    """
+    Metaclass for BaseModel: calls `__post_init__` exactly once, after the
+    outermost `__init__` in the constructor chain has returned.
+    """
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        obj = super().__call__(*args, **kwargs)
+        obj.__post_init__()
+        return obj
+
+
+def _watching_setattr(self: "BaseModel", name: str, value: Any) -> None:
+    """BaseModel.__setattr__ while any attribute is watched (see BaseModel._watch)."""
+    if name in BaseModel._watched_attrs:
+        old = getattr(self, name, MISSING)
+        object.__setattr__(self, name, value)
+        BaseModel._attr_listener(self, name, old, value)
+    else:
+        object.__setattr__(self, name, value)
+
+
+class BaseModel(ABC, metaclass=ModelMeta):
     """
     A professional abstract base class for all OOP entities in Software3-Lab.
 
     Features:
     ----------
-    - Auto-generated UUID for every object
+    - Auto-generated UUID for every object (see set_id_format)
     - Consistent serialization (to_dict)
     - Pretty __repr__
     - Logging hooks
-    - LLM integration stub (explain)
+    - LLM explanations (explain), batched and cached
+    - Attribute-change hook (used by ObjectRegistry's secondary indexes)
+    - Registration in ObjectRegistry exactly once, when construction completes
+    - Per-object `version`, bumped by every state-changing method via
+      `_touch()` (feeds ObjectRegistry.changes())
+    - Slotted layout: subclasses that declare `__slots__` for their own
+      attributes carry no per-instance __dict__
     """
 
+    __slots__ = ("id", "_name", "_version", "__weakref__")
+
+    # Assignments to `name` and to these attribute names are reported to
+    # `_attr_listener` as (obj, name, old, new). Both are installed by
+    # ObjectRegistry.
+    _watched_attrs: ClassVar[FrozenSet[str]] = frozenset()
+    _attr_listener: ClassVar[Optional[Callable[["BaseModel", str, Any, Any], None]]] = None
+    # Called with each fully constructed object; installed by ObjectRegistry.
+    _on_created: ClassVar[Optional[Callable[["BaseModel"], None]]] = None
+    # Called by `_touch()` after each state change; installed by ObjectRegistry.
+    _on_changed: ClassVar[Optional[Callable[["BaseModel"], None]]] = None
+    _new_id: ClassVar[Callable[[], str]] = staticmethod(_ID_FACTORIES[ID_FORMAT])
+    # to_dict keys that are computed by a method rather than read from an
+    # attribute of the same name: {key: method name}. Merged along the MRO by
+    # the generated serializers in src/core/serialization.py.
+    _dict_computed: ClassVar[Dict[str, str]] = {}
+
     def __init__(self, name: str):
-        self.id: str = str(uuid.uuid4())
+        self._version = 0
+        self.id: str = BaseModel._new_id()
         self.name: str = name
 
-        logger.debug(f"[BaseModel] Created {self.__class__.__name__} (id={self.id}, name={self.name})")
+        _log.debug(
+            "Created {type} (id={id}, name={name})",
+            type=self.__class__.__name__, id=self.id, name=self.name,
+        )
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        old = getattr(self, "_name", MISSING)
+        object.__setattr__(self, "_name", value)
+        if old is not MISSING:
+            if BaseModel._attr_listener is not None:
+                BaseModel._attr_listener(self, "name", old, value)
+            self._touch()
+
+    @property
+    def version(self) -> int:
+        """Number of state changes (renames included) since construction."""
+        return self._version
+
+    def _touch(self) -> None:
+        """Mark this object changed: call after every successful state change."""
+        self._version += 1
+        changed = BaseModel._on_changed
+        if changed is not None:
+            changed(self)
+
+    def __post_init__(self) -> None:
+        """Runs once per object after construction (see ModelMeta): registers it."""
+        register = BaseModel._on_created
+        if register is None:
+            import src.core.object_registry  # noqa: F401 — installs the hook
+
+            register = BaseModel._on_created
+        register(self)
 
     @abstractmethod
     def to_dict(self) -> Dict[str, Any]:
@@ -33,6 +140,25 @@ class BaseModel(ABC):
             "type": self.__class__.__name__,
         }
 
+    @staticmethod
+    def set_id_format(fmt: str) -> None:
+        """Switch the id format ("uuid" or "short") for objects created from now on."""
+        if fmt not in _ID_FACTORIES:
+            raise ValueError(f"Unknown id format '{fmt}' (expected 'uuid' or 'short')")
+        BaseModel._new_id = staticmethod(_ID_FACTORIES[fmt])
+
+    @staticmethod
+    def _watch(attrs: FrozenSet[str]) -> None:
+        """
+        Report assignments to `attrs`. The __setattr__ hook costs every
+        assignment on every model, so it is only installed while non-empty.
+        """
+        BaseModel._watched_attrs = frozenset(attrs)
+        if attrs:
+            BaseModel.__setattr__ = _watching_setattr
+        elif "__setattr__" in BaseModel.__dict__:
+            del BaseModel.__setattr__
+
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} id={self.id} name={self.name}>"
 
@@ -42,11 +168,11 @@ class BaseModel(ABC):
     async def explain(self) -> str:
         """
         Uses the LLM client to explain this object in natural language.
-        Overridden automatically when llama_client is available.
+        Calls are batched, capped and cached by the shared
+        ExplanationService (src/core/explanations.py).
         """
         try:
-            from src.ai.llama_client import llama_explain
-            return await llama_explain(self.to_dict())
+            return await explanations.get_service().explain(self)
         except Exception as e:
-            logger.error(f"[BaseModel] LLM explanation failed: {e}")
+            _log.error("LLM explanation failed: {error}", error=e)
             return "LLM explanation unavailable."
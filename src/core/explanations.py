@@ -0,0 +1,246 @@
+"""
+Explanations — batched, cached LLM explanations for the model classes
+────────────────────────────────────────────────────────────────────────────
+`BaseModel.explain()` and `Team.summarize()` go through one shared
+ExplanationService instead of making one LLM round-trip per call:
+
+- coalescing: concurrent requests of the same kind are queued and sent as
+  one batch once `batch_size` are waiting or `max_wait_s` has passed, and
+  identical requests already in flight share one result
+- concurrency cap: at most `max_concurrency` batches are in flight
+- memoization: results are cached (LRU) on a hash of the object's
+  `to_dict()`, so an unchanged object never reaches the model twice;
+  failures are not cached
+
+A backend is an async callable `(kind, items) -> texts` returning one text
+per item dict, in order. The default one calls src.ai.llama_client, which
+is imported once on first use: `llama_explain_batch(items)` /
+`llama_summarize_team_batch(items)` when the client has them, otherwise
+the per-item `llama_explain` / `llama_summarize_team` for each item
+concurrently.
+
+Configuration (environment defaults, or `configure()` at runtime):
+    EXPLAIN_BATCH_SIZE=32         # items per backend request
+    EXPLAIN_BATCH_WAIT_MS=10      # how long a partial batch waits for company
+    EXPLAIN_MAX_CONCURRENCY=4     # backend requests in flight
+    EXPLAIN_CACHE_SIZE=10000      # memoized results
+
+Usage:
+    texts = await asyncio.gather(*(obj.explain() for obj in objects))
+    explanations.configure(backend=fake_backend)   # e.g. in tests
+"""
+
+from __future__ import annotations
+import asyncio
+import hashlib
+import importlib
+import os
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from loguru import logger
+
+from src.core.serialization import encode, serialize
+
+Backend = Callable[[str, List[Dict[str, Any]]], Awaitable[List[str]]]
+
+BATCH_SIZE = int(os.getenv("EXPLAIN_BATCH_SIZE", "32"))
+BATCH_WAIT_MS = float(os.getenv("EXPLAIN_BATCH_WAIT_MS", "10"))
+MAX_CONCURRENCY = int(os.getenv("EXPLAIN_MAX_CONCURRENCY", "4"))
+CACHE_SIZE = int(os.getenv("EXPLAIN_CACHE_SIZE", "10000"))
+if BATCH_SIZE < 1 or MAX_CONCURRENCY < 1:
+    raise ValueError("EXPLAIN_BATCH_SIZE and EXPLAIN_MAX_CONCURRENCY must be >= 1")
+
+# Request kind -> llama_client function.
+KINDS: Dict[str, str] = {"explain": "llama_explain", "team_summary": "llama_summarize_team"}
+
+_Key = Tuple[str, bytes]
+
+
+def _digest(data: Dict[str, Any]) -> bytes:
+    try:
+        raw = encode(data)
+    except (TypeError, ValueError):  # not JSON-serializable: fall back to repr
+        raw = repr(data).encode()
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+
+# --------------------------------------------------------------------- #
+# Default backend
+# --------------------------------------------------------------------- #
+class LlamaBackend:
+    """src.ai.llama_client as a batch backend; a failed import is remembered, not retried."""
+
+    def __init__(self):
+        self._client: Any = None
+        self._error: Optional[Exception] = None
+
+    def _load(self) -> Any:
+        if self._client is None and self._error is None:
+            try:
+                self._client = importlib.import_module("src.ai.llama_client")
+            except ImportError as e:
+                self._error = e
+        if self._error is not None:
+            raise RuntimeError(f"LLM client unavailable: {self._error}")
+        return self._client
+
+    async def __call__(self, kind: str, items: List[Dict[str, Any]]) -> List[str]:
+        client = self._load()
+        name = KINDS[kind]
+        batch = getattr(client, f"{name}_batch", None)
+        if batch is not None:
+            return list(await batch(items))
+        single = getattr(client, name)
+        return list(await asyncio.gather(*(single(item) for item in items)))
+
+
+# --------------------------------------------------------------------- #
+# Service
+# --------------------------------------------------------------------- #
+@dataclass
+class ExplanationStats:
+    requests: int = 0
+    cache_hits: int = 0
+    coalesced: int = 0     # requests that joined an identical one in flight
+    batches: int = 0       # backend calls
+    items_sent: int = 0
+    failures: int = 0      # items whose batch raised
+
+
+class ExplanationService:
+    """Coalescing, concurrency-capped, memoizing front end to an explanation backend."""
+
+    def __init__(
+        self,
+        backend: Optional[Backend] = None,
+        batch_size: int = BATCH_SIZE,
+        max_wait_s: float = BATCH_WAIT_MS / 1000,
+        max_concurrency: int = MAX_CONCURRENCY,
+        cache_size: int = CACHE_SIZE,
+    ):
+        if batch_size < 1 or max_concurrency < 1:
+            raise ValueError("batch_size and max_concurrency must be >= 1")
+        self.backend: Backend = backend or LlamaBackend()
+        self.batch_size = batch_size
+        self.max_wait_s = max_wait_s
+        self.max_concurrency = max_concurrency
+        self.cache_size = cache_size
+        self.stats = ExplanationStats()
+        self._cache: "OrderedDict[_Key, str]" = OrderedDict()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _bind(self) -> asyncio.AbstractEventLoop:
+        """Queues, futures and the semaphore belong to one event loop; start fresh on a new one."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._pending: Dict[str, List[Tuple[_Key, Dict[str, Any], asyncio.Future]]] = {}
+            self._inflight: Dict[_Key, asyncio.Future] = {}
+            self._timers: Dict[str, asyncio.TimerHandle] = {}
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+            self._tasks: Set[asyncio.Task] = set()
+        return loop
+
+    async def explain(self, obj: Any) -> str:
+        return await self.submit("explain", serialize(obj))
+
+    async def summarize(self, team: Any) -> str:
+        return await self.submit("team_summary", serialize(team))
+
+    async def explain_many(self, objects: List[Any]) -> List[str]:
+        return list(await asyncio.gather(*(self.explain(obj) for obj in objects)))
+
+    async def submit(self, kind: str, data: Dict[str, Any]) -> str:
+        """The backend's text for `data`: from the cache, a request in flight, or the next batch."""
+        loop = self._bind()
+        self.stats.requests += 1
+        key = (kind, _digest(data))
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.stats.cache_hits += 1
+            return cached
+
+        future = self._inflight.get(key)
+        if future is not None:
+            self.stats.coalesced += 1
+        else:
+            future = self._inflight[key] = loop.create_future()
+            queue = self._pending.setdefault(kind, [])
+            queue.append((key, data, future))
+            if len(queue) >= self.batch_size:
+                self._flush(kind)
+            elif kind not in self._timers:
+                self._timers[kind] = loop.call_later(self.max_wait_s, self._flush, kind)
+        # shield: a cancelled caller must not cancel the result others wait for.
+        return await asyncio.shield(future)
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+    def _flush(self, kind: str) -> None:
+        timer = self._timers.pop(kind, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(kind, None)
+        if batch:
+            task = self._loop.create_task(self._send(kind, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, kind: str, batch: List[Tuple[_Key, Dict[str, Any], asyncio.Future]]) -> None:
+        async with self._slots:
+            self.stats.batches += 1
+            self.stats.items_sent += len(batch)
+            try:
+                texts = await self.backend(kind, [data for _, data, _ in batch])
+                if len(texts) != len(batch):
+                    raise ValueError(f"backend returned {len(texts)} texts for {len(batch)} items")
+            except Exception as e:
+                logger.warning(f"[explanations] {kind} batch of {len(batch)} failed: {e}")
+                self.stats.failures += len(batch)
+                for key, _, future in batch:
+                    self._inflight.pop(key, None)
+                    if not future.done():
+                        future.set_exception(e)
+                return
+
+        for (key, _, future), text in zip(batch, texts):
+            self._remember(key, text)
+            self._inflight.pop(key, None)
+            if not future.done():
+                future.set_result(text)
+
+    def _remember(self, key: _Key, text: str) -> None:
+        if self.cache_size <= 0:
+            return
+        self._cache[key] = text
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def info(self) -> Dict[str, Any]:
+        return {**asdict(self.stats), "cached": len(self._cache)}
+
+
+# --------------------------------------------------------------------- #
+# Shared instance
+# --------------------------------------------------------------------- #
+_service: Optional[ExplanationService] = None
+
+
+def get_service() -> ExplanationService:
+    """The process-wide service used by `BaseModel.explain()` and `Team.summarize()`."""
+    global _service
+    if _service is None:
+        _service = ExplanationService()
+    return _service
+
+
+def configure(**settings: Any) -> ExplanationService:
+    """Replace the shared service, e.g. `configure(backend=fake, batch_size=8)`."""
+    global _service
+    _service = ExplanationService(**settings)
+    return _service
@@ -1,7 +1,557 @@
 from __future__ import annotations
-from typing import Dict, Optional, Type
+import heapq
+import math
+import os
+import threading
+import time
+import weakref
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass
+from itertools import chain, count, islice
+from numbers import Real
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type
 from loguru import logger
-from src.core.base_model import BaseModel
+from src.core.base_model import BaseModel, MISSING
+
+_OPS = ("eq", "ne", "lt", "le", "gt", "ge", "in")
+
+# Per-process defaults; `ObjectRegistry.configure()` can change them later.
+MODE = os.getenv("OBJECT_REGISTRY_MODE", "strong")        # "strong" | "weak"
+TTL_S = float(os.getenv("OBJECT_REGISTRY_TTL_S", "0")) or None
+MAX_SIZE = int(os.getenv("OBJECT_REGISTRY_MAX_SIZE", "0")) or None
+if MODE not in ("strong", "weak"):
+    raise ValueError(f"OBJECT_REGISTRY_MODE must be 'strong' or 'weak', got '{MODE}'")
+
+# Registry-wide sequence numbers: insertion log, change feed and cursors.
+# next() is atomic, so they need no lock.
+_SEQ = count(1)
+
+
+class _SortedKeys:
+    """
+    Sorted list of distinct keys, split into blocks of at most 2 * LOAD,
+    so inserts and deletes move one short block instead of the whole list.
+    """
+
+    LOAD = 512
+
+    def __init__(self):
+        self._blocks: List[List[Any]] = []
+        self._maxes: List[Any] = []
+
+    def add(self, key: Any) -> None:
+        if not self._blocks:
+            self._blocks.append([key])
+            self._maxes.append(key)
+            return
+        i = min(bisect_left(self._maxes, key), len(self._blocks) - 1)
+        block = self._blocks[i]
+        insort(block, key)
+        self._maxes[i] = block[-1]
+        if len(block) > 2 * self.LOAD:
+            self._blocks[i : i + 1] = [block[: self.LOAD], block[self.LOAD :]]
+            self._maxes[i : i + 1] = [block[self.LOAD - 1], block[-1]]
+
+    def discard(self, key: Any) -> None:
+        i = bisect_left(self._maxes, key)
+        if i == len(self._blocks):
+            return
+        block = self._blocks[i]
+        j = bisect_left(block, key)
+        if j == len(block) or block[j] != key:
+            return
+        del block[j]
+        if block:
+            self._maxes[i] = block[-1]
+        else:
+            del self._blocks[i]
+            del self._maxes[i]
+
+    def clear(self) -> None:
+        self._blocks.clear()
+        self._maxes.clear()
+
+    def below(self, key: Any, inclusive: bool) -> Iterable[Any]:
+        cut = bisect_right if inclusive else bisect_left
+        i = cut(self._maxes, key)
+        tail = self._blocks[i][: cut(self._blocks[i], key)] if i < len(self._blocks) else []
+        return chain(chain.from_iterable(self._blocks[:i]), tail)
+
+    def above(self, key: Any, inclusive: bool) -> Iterable[Any]:
+        cut = bisect_left if inclusive else bisect_right
+        i = cut(self._maxes, key)
+        if i == len(self._blocks):
+            return iter(())
+        head = self._blocks[i][cut(self._blocks[i], key) :]
+        return chain(head, chain.from_iterable(self._blocks[i + 1 :]))
+
+
+class _AttrIndex:
+    """
+    Secondary index over one attribute: value → {id: entry}.
+
+    With `ordered=True` the distinct numeric values are also kept sorted, so
+    range conditions (`__lt`, `__ge`, …) bisect instead of scanning.
+    Unhashable values are parked in `other` and always re-checked. The value
+    each object was filed under is remembered, so `update()` re-reads the
+    attribute and never depends on the caller's idea of the old value, and
+    `discard()` needs only the id.
+    """
+
+    def __init__(self, attr: str, ordered: bool = False):
+        self.attr = attr
+        self.ordered = ordered
+        self.buckets: Dict[Any, Dict[str, Any]] = {}
+        self.other: Dict[str, Any] = {}
+        self.values: Dict[str, Any] = {}  # id → value it is filed under
+        self.keys = _SortedKeys()  # distinct numeric values (ordered only)
+
+    @staticmethod
+    def _sortable(value: Any) -> bool:
+        return isinstance(value, Real) and value == value  # excludes NaN
+
+    def insert(self, obj: BaseModel, entry: Any) -> None:
+        value = getattr(obj, self.attr, MISSING)
+        if value is MISSING:
+            return
+        try:
+            bucket = self.buckets.get(value)
+        except TypeError:
+            self.other[obj.id] = entry
+            return
+        if bucket is None:
+            bucket = self.buckets[value] = {}
+            if self.ordered and self._sortable(value):
+                self.keys.add(value)
+        bucket[obj.id] = entry
+        self.values[obj.id] = value
+
+    def discard(self, object_id: str) -> None:
+        if self.other.pop(object_id, None) is not None:
+            return
+        value = self.values.pop(object_id, MISSING)
+        if value is MISSING:
+            return
+        bucket = self.buckets[value]
+        del bucket[object_id]
+        if not bucket:
+            del self.buckets[value]
+            if self.ordered and self._sortable(value):
+                self.keys.discard(value)
+
+    def update(self, obj: BaseModel, entry: Any) -> None:
+        if self.values.get(obj.id, MISSING) is getattr(obj, self.attr, MISSING):
+            return
+        self.discard(obj.id)
+        self.insert(obj, entry)
+
+    # ------------------------------------------------------------------
+    # Candidate sets for the query planner (None → index can't help).
+    # Buckets are disjoint, so the returned parts never share an object.
+    # ------------------------------------------------------------------
+    def lookup(
+        self, op: str, value: Any, budget: Optional[int] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        if op == "eq":
+            try:
+                bucket = self.buckets.get(value)
+            except TypeError:
+                return None
+            return [bucket or {}, self.other]
+        if op == "in":
+            try:
+                return [self.buckets.get(v) or {} for v in dict.fromkeys(value)] + [self.other]
+            except TypeError:
+                return None
+        if op in ("lt", "le", "gt", "ge") and self.ordered and self._sortable(value):
+            if op in ("lt", "le"):
+                keys = self.keys.below(value, inclusive=op == "le")
+            else:
+                keys = self.keys.above(value, inclusive=op == "ge")
+            parts, size = [], len(self.other)
+            for key in keys:
+                parts.append(self.buckets[key])
+                size += len(parts[-1])
+                if budget is not None and size > budget:
+                    return None  # a cheaper plan already exists
+            return parts + [self.other]
+        return None
+
+
+def _matches(actual: Any, op: str, expected: Any) -> bool:
+    if actual is MISSING:
+        return False
+    try:
+        if op == "eq":
+            return actual == expected
+        if op == "ne":
+            return actual != expected
+        if op == "lt":
+            return actual < expected
+        if op == "le":
+            return actual <= expected
+        if op == "gt":
+            return actual > expected
+        if op == "ge":
+            return actual >= expected
+        return actual in expected
+    except TypeError:
+        return False
+
+
+@dataclass
+class ShardStats:
+    """Per-shard counters, collected only when `configure(stats=True)`."""
+
+    adds: int = 0
+    removes: int = 0
+    hits: int = 0       # lock-free reads: approximate under heavy concurrency
+    misses: int = 0
+    contended: int = 0  # lock acquisitions that had to wait
+    wait_s: float = 0.0
+
+
+class _CountingLock:
+    """Shard lock wrapper that records contended acquisitions and wait time."""
+
+    __slots__ = ("_lock", "_stats")
+
+    def __init__(self, lock: threading.RLock, stats: ShardStats):
+        self._lock = lock
+        self._stats = stats
+
+    def __enter__(self) -> "_CountingLock":
+        if not self._lock.acquire(blocking=False):
+            start = time.perf_counter()
+            self._lock.acquire()
+            self._stats.contended += 1
+            self._stats.wait_s += time.perf_counter() - start
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._lock.release()
+
+
+class _Ref(weakref.ref):
+    """Weak registry entry that remembers what is needed to unfile it."""
+
+    __slots__ = ("id", "types")
+
+    def __new__(cls, obj: BaseModel, callback: Callable, types: Tuple[type, ...]):
+        self = super().__new__(cls, obj, callback)
+        self.id = obj.id
+        self.types = types
+        return self
+
+    def __init__(self, obj: BaseModel, callback: Callable, types: Tuple[type, ...]):
+        super().__init__(obj, callback)
+
+
+class _Shard:
+    """
+    One lock stripe: a slice of the registry plus its own type, name and
+    attribute indexes and insertion log. Writers hold `guard`; point reads
+    of `objects` go without it.
+
+    Every structure maps ids to an *entry*: the object itself, or in weak
+    mode a `_Ref` to it. The GC callback of a `_Ref` only queues it on
+    `pending` (it may run on any thread, holding any lock); the shard
+    unfiles collected objects under its own lock in `prune()`.
+
+    Insertion log: log[i] holds the entry with sequence number log_seq[i]
+    registered at log_time[i], or None once it is removed. Lists are only
+    appended to or tombstoned in place; compaction builds new ones, so a
+    snapshot holding the old lists is unaffected.
+
+    Change feed: BaseModel._touch only appends the id to `touched` (a
+    deque: no lock). `drain()` folds that queue into `changed_at`, which
+    maps each touched id to the sequence number it was drained at, and
+    `removed_at` maps removed ids to their removal; both are kept in
+    ascending order (re-inserted at the end), so "since seq N" reads only
+    their tails. Registrations come from the insertion log. Removals beyond
+    `ObjectRegistry.CHANGE_FEED_MAX_REMOVED` are trimmed, oldest first;
+    `trimmed` is the newest sequence number a poll may have missed.
+    """
+
+    def __init__(self, specs: Dict[str, bool], stats: bool = False, weak: bool = False):
+        self.lock = threading.RLock()
+        self.stats = ShardStats()
+        self.guard: Any = _CountingLock(self.lock, self.stats) if stats else self.lock
+        self.weak = weak
+        self.version = 0
+        self.collected = 0
+        self.evicted = 0
+        self.reset(specs)
+
+    def reset(self, specs: Dict[str, bool]) -> None:
+        self.objects: Dict[str, Any] = {}
+        self.by_type: Dict[type, Dict[str, Any]] = {}
+        self.indexes: Dict[str, _AttrIndex] = {"name": _AttrIndex("name")}
+        for attr, ordered in specs.items():
+            self.indexes[attr] = _AttrIndex(attr, ordered=ordered)
+        self.log: List[Any] = []
+        self.log_seq: List[int] = []
+        self.log_time: List[float] = []
+        self.log_pos: Dict[str, int] = {}
+        self.head = 0  # log entries before head are all tombstones
+        self.tombstones = 0
+        self.pending: List[_Ref] = []
+        self.touched: deque = deque()
+        self.changed_at: Dict[str, int] = {}
+        self.removed_at: Dict[str, int] = {}
+        self.trimmed = next(_SEQ)
+        self.version += 1
+
+    def lookup(self, object_id: Any) -> Optional[BaseModel]:
+        """Lock-free point read."""
+        entry = self.objects.get(object_id)
+        if self.weak and entry is not None:
+            return entry()
+        return entry
+
+    def entry_for(self, obj: BaseModel, types: Tuple[type, ...]) -> Any:
+        return _Ref(obj, self.pending.append, types) if self.weak else obj
+
+    def types_of(self, entry: Any) -> Tuple[type, ...]:
+        return entry.types if self.weak else ObjectRegistry._types_of(type(entry))
+
+    # Callers hold `guard` for everything below.
+    def prune(self) -> None:
+        """Unfile objects the garbage collector has reclaimed (weak mode)."""
+        while self.pending:
+            ref = self.pending.pop()
+            if self.objects.get(ref.id) is ref:
+                self.delete(ref.id, ref.types)
+                self.collected += 1
+
+    def insert(
+        self, obj: BaseModel, entry: Any, seq: int, types: Tuple[type, ...], now: float
+    ) -> None:
+        self.objects[obj.id] = entry
+        for klass in types:
+            self.by_type.setdefault(klass, {})[obj.id] = entry
+        for index in self.indexes.values():
+            index.insert(obj, entry)
+        self.removed_at.pop(obj.id, None)
+        self.log_pos[obj.id] = len(self.log)
+        self.log.append(entry)
+        self.log_seq.append(seq)
+        self.log_time.append(now)
+        self.version += 1
+
+    def delete(self, object_id: str, types: Tuple[type, ...]) -> None:
+        del self.objects[object_id]
+        for klass in types:
+            self.by_type[klass].pop(object_id, None)
+        for index in self.indexes.values():
+            index.discard(object_id)
+        self.log[self.log_pos.pop(object_id)] = None
+        self.changed_at.pop(object_id, None)
+        self.removed_at[object_id] = next(_SEQ)
+        if len(self.removed_at) > ObjectRegistry.CHANGE_FEED_MAX_REMOVED:
+            for gone in list(islice(self.removed_at, len(self.removed_at) // 2)):
+                self.trimmed = self.removed_at.pop(gone)
+        self.tombstones += 1
+        if self.tombstones > max(ObjectRegistry.COMPACT_MIN_TOMBSTONES, len(self.log) // 2):
+            keep = [i for i, e in enumerate(self.log) if e is not None]
+            self.log = [self.log[i] for i in keep]
+            self.log_seq = [self.log_seq[i] for i in keep]
+            self.log_time = [self.log_time[i] for i in keep]
+            self.log_pos = {e.id: i for i, e in enumerate(self.log)}
+            self.head = 0
+            self.tombstones = 0
+        self.version += 1
+
+    def evict(self, now: float, ttl_s: Optional[float], cap: Optional[int]) -> int:
+        """Drop the oldest entries while they are expired or the shard is over cap."""
+        evicted = 0
+        while self.head < len(self.log):
+            entry = self.log[self.head]
+            if entry is None:
+                self.head += 1
+                continue
+            expired = ttl_s is not None and now - self.log_time[self.head] > ttl_s
+            if not expired and (cap is None or len(self.objects) <= cap):
+                break
+            self.delete(entry.id, self.types_of(entry))
+            evicted += 1
+        self.evicted += evicted
+        return evicted
+
+    def drain(self) -> None:
+        touched, changed_at, objects = self.touched, self.changed_at, self.objects
+        while touched:
+            object_id = touched.popleft()
+            if object_id in objects:
+                changed_at.pop(object_id, None)
+                changed_at[object_id] = next(_SEQ)
+
+    def changes(
+        self, after: int, bound: int
+    ) -> Tuple[List[Tuple[int, BaseModel]], List[Tuple[int, str]], bool]:
+        """
+        (seq, obj) registered or changed and (seq, id) removed with
+        after < seq < bound, plus whether anything before `after` was trimmed.
+        The caller drains every shard before taking `bound`.
+        """
+        with self.guard:
+            self.prune()
+            latest: Dict[str, int] = {}
+            log, log_seq = self.log, self.log_seq
+            for i in range(bisect_right(log_seq, after), len(log)):
+                if log_seq[i] >= bound:
+                    break
+                if log[i] is not None:
+                    latest[log[i].id] = log_seq[i]
+            for object_id in reversed(self.changed_at):
+                seq = self.changed_at[object_id]
+                if seq <= after:
+                    break
+                if seq < bound:
+                    latest[object_id] = seq
+            changed = []
+            for object_id, seq in latest.items():
+                obj = self.lookup(object_id)
+                if obj is not None:
+                    changed.append((seq, obj))
+            removed = []
+            for object_id in reversed(self.removed_at):
+                seq = self.removed_at[object_id]
+                if seq <= after:
+                    break
+                if seq < bound:
+                    removed.append((seq, object_id))
+            return changed, removed, after < self.trimmed
+
+    def entries(self, after: int = 0) -> Iterator[Tuple[int, BaseModel]]:
+        """Live (seq, obj) pairs logged so far with seq > `after`, in order."""
+        with self.guard:
+            self.prune()
+            log, log_seq, end = self.log, self.log_seq, len(self.log)
+        return self._live(log, log_seq, bisect_right(log_seq, after, 0, end), end)
+
+    def _live(self, log, log_seq, start: int, end: int) -> Iterator[Tuple[int, BaseModel]]:
+        objects, weak = self.objects, self.weak
+        for i in range(start, end):
+            entry = log[i]
+            if entry is not None and objects.get(entry.id) is entry:
+                obj = entry() if weak else entry
+                if obj is not None:
+                    yield log_seq[i], obj
+
+    def select(
+        self,
+        type_: Optional[type],
+        parsed: List[Tuple[str, str, Any]],
+        where: Optional[Callable[[BaseModel], bool]],
+        limit: Optional[int],
+    ) -> List[BaseModel]:
+        """Query planner for one shard; see `ObjectRegistry.query`."""
+        # Each plan: (candidate parts, condition it answers exactly or None).
+        # Condition -1 stands for the type filter.
+        plans: List[Tuple[List[Dict[str, Any]], Optional[int]]] = [
+            ([self.by_type.get(type_, {}), {}] if type_ is not None else [self.objects, {}], -1)
+        ]
+        size = lambda plan: sum(len(p) for p in plan[0])  # noqa: E731
+        # Point lookups first, so range scans can stop once they cost more.
+        for i, (attr, op, value) in sorted(
+            enumerate(parsed), key=lambda c: c[1][1] in ("lt", "le", "gt", "ge")
+        ):
+            if attr in self.indexes:
+                budget = min(size(plan) for plan in plans)
+                parts = self.indexes[attr].lookup(op, value, budget)
+                if parts is not None:
+                    plans.append((parts, None if parts[-1] else i))
+        parts, exact = min(plans, key=size)
+
+        check_type = type_ is not None and exact != -1
+        checks = [c for i, c in enumerate(parsed) if i != exact]
+        weak = self.weak
+        results: List[BaseModel] = []
+        for entry in chain.from_iterable(p.values() for p in parts):
+            obj = entry() if weak else entry
+            if obj is None:
+                continue
+            if check_type and not isinstance(obj, type_):
+                continue
+            if checks and not all(_matches(getattr(obj, a, MISSING), op, v) for a, op, v in checks):
+                continue
+            if where is not None and not where(obj):
+                continue
+            results.append(obj)
+            if limit is not None and len(results) >= limit:
+                break
+        return results
+
+
+@dataclass
+class RegistryPage:
+    """One page of `ObjectRegistry.page()`; pass `next_cursor` back for more."""
+
+    items: List[BaseModel]
+    next_cursor: Optional[int]
+
+
+@dataclass
+class ChangeSet:
+    """
+    One poll of `ObjectRegistry.changes()`; pass `cursor` back for the next.
+    When `resync` is set, changes before the cursor were dropped (by clear()
+    or trimming of old removals): reload everything, e.g. via snapshot().
+    """
+
+    changed: List[BaseModel]  # registered or changed since the cursor, oldest change first
+    removed: List[str]        # ids removed since the cursor
+    cursor: int
+    resync: bool = False
+
+
+class RegistrySnapshot:
+    """
+    Copy-free iteration over the registry as of one version.
+
+    Weakly consistent: objects registered after the snapshot are not seen,
+    objects removed before the iterator reaches them are skipped, and
+    concurrent mutation never raises. Objects come out in insertion order.
+    `stale` tells whether anything has changed since the snapshot was taken.
+    """
+
+    def __init__(self, shards: List[_Shard]):
+        self._entries = [shard.entries() for shard in shards]
+        self._versions = tuple(shard.version for shard in shards)
+        self._shards = shards
+        self.version = sum(self._versions)
+
+    def __iter__(self) -> Iterator[BaseModel]:
+        for _, obj in heapq.merge(*self._entries, key=lambda entry: entry[0]):
+            # merge() reads ahead one entry per shard; re-check liveness here.
+            if ObjectRegistry._shard_for(obj.id).lookup(obj.id) is obj:
+                yield obj
+
+    @property
+    def stale(self) -> bool:
+        return tuple(shard.version for shard in self._shards) != self._versions
+
+
+class RegistryView(Mapping):
+    """Read-only, copy-free id → object mapping over every shard."""
+
+    def __getitem__(self, object_id: str) -> BaseModel:
+        obj = ObjectRegistry._shard_for(object_id).lookup(object_id)
+        if obj is None:
+            raise KeyError(object_id)
+        return obj
+
+    def __contains__(self, object_id: object) -> bool:
+        return ObjectRegistry._shard_for(object_id).lookup(object_id) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return (obj.id for obj in ObjectRegistry.snapshot())
+
+    def __len__(self) -> int:
+        return ObjectRegistry.count()
 
 
 class ObjectRegistry:
@@ -14,32 +564,130 @@ class ObjectRegistry:
     - Enable lookup by ID
     - Allow MCP tools & AI systems to interact with live objects
     - Enable cross-object simulation
+
+    Concurrency:
+    ------------
+    Objects are spread over a power-of-two number of shards by id hash, each
+    with its own lock, so writers on different shards don't contend. `get()`,
+    `all()[id]` and `count()` take no lock; queries lock one shard at a time.
+
+    Indexes:
+    --------
+    - by type, including every BaseModel superclass (`query(Airplane)` finds JetPlanes)
+    - by name
+    - by any attribute declared with `create_index()`; kept current through
+      BaseModel's attribute-change hook
+
+    Iteration without copying:
+    --------------------------
+    - `all()` is a read-only live view
+    - `snapshot()` iterates safely while the registry changes
+    - `page(cursor, limit)` walks the registry in insertion order, in pages
+
+    Change feed:
+    ------------
+    - `changes(cursor)` returns only the objects registered or changed
+      (BaseModel._touch) and the ids removed since `cursor`; a poll costs
+      the number of changes, not the registry size
+
+    Memory:
+    -------
+    - mode "strong" (default) keeps every object alive until removed
+    - mode "weak" holds weak references; collected objects drop out
+    - optional TTL and max-size eviction (oldest registrations first;
+      max-size is enforced per shard as ceil(max_size / shards))
+    Set per process with OBJECT_REGISTRY_MODE / _TTL_S / _MAX_SIZE or
+    `configure()`; `memory_stats()` reports live, collected and evicted.
+
+    Persistence:
+    ------------
+    - `save(path, incremental=False)` / `restore(*paths)` write and reload
+      the registry without running constructors (src/core/registry_persistence.py)
+
+    Example:
+    --------
+        ObjectRegistry.create_index("in_air")
+        ObjectRegistry.create_index("current_fuel", ordered=True)
+        ObjectRegistry.query(JetPlane, in_air=True)
+        ObjectRegistry.query(TransportMode, current_fuel__lt=10)
     """
 
-    _registry: Dict[str, BaseModel] = {}
+    DEFAULT_SHARDS = 16
+    COMPACT_MIN_TOMBSTONES = 1024
+    CHANGE_FEED_MAX_REMOVED = 4096  # removed ids remembered per shard
+    CHANGE_FEED_BATCH = 1024        # queued touches per shard before draining
 
+    _specs: Dict[str, bool] = {}
+    _weak: bool = MODE == "weak"
+    _shards: List[_Shard] = [_Shard({}, weak=MODE == "weak") for _ in range(DEFAULT_SHARDS)]
+    _mask: int = DEFAULT_SHARDS - 1
+    _stats_enabled: bool = False
+    _ttl_s: Optional[float] = TTL_S
+    _max_size: Optional[int] = MAX_SIZE
+    _shard_cap: Optional[int] = None if MAX_SIZE is None else math.ceil(MAX_SIZE / DEFAULT_SHARDS)
+    _seq = _SEQ
+    _admin_lock = threading.Lock()
+    _type_chain: Dict[type, Tuple[type, ...]] = {}
+
+    # ------------------------------------------------------------------
+    # Core API
+    # ------------------------------------------------------------------
     @classmethod
     def add(cls, obj: BaseModel) -> None:
-        cls._registry[obj.id] = obj
-        logger.debug(f"[ObjectRegistry] Registered {obj.__class__.__name__} (id={obj.id})")
+        shard = cls._shards[hash(obj.id) & cls._mask]
+        types = cls._types_of(type(obj))
+        with shard.guard:
+            shard.prune()
+            existing = shard.objects.get(obj.id)
+            if existing is not None:
+                if shard.lookup(obj.id) is obj:
+                    return
+                shard.delete(obj.id, shard.types_of(existing))
+            now = time.monotonic()
+            shard.insert(obj, shard.entry_for(obj, types), next(cls._seq), types, now)
+            if cls._ttl_s is not None or cls._shard_cap is not None:
+                shard.evict(now, cls._ttl_s, cls._shard_cap)
+            if cls._stats_enabled:
+                shard.stats.adds += 1
 
     @classmethod
     def get(cls, object_id: str) -> Optional[BaseModel]:
-        obj = cls._registry.get(object_id)
-        if obj:
-            logger.debug(f"[ObjectRegistry] Retrieved {obj}")
-        else:
+        shard = cls._shards[hash(object_id) & cls._mask]
+        obj = shard.lookup(object_id)
+        if cls._stats_enabled:
+            if obj is None:
+                shard.stats.misses += 1
+            else:
+                shard.stats.hits += 1
+        if obj is None:
             logger.warning(f"[ObjectRegistry] Object with id={object_id} not found.")
         return obj
 
     @classmethod
-    def all(cls) -> Dict[str, BaseModel]:
-        return cls._registry.copy()
+    def all(cls) -> RegistryView:
+        """
+        Read-only live view of id → object (no copy). Iterating it walks a
+        snapshot, so it is safe while objects are being added or removed.
+
+        API change: this used to return a `dict` copy. The view is a
+        `Mapping` (`[]`, `in`, `len`, `get`, `items()` work as before), but it
+        cannot be mutated, it reflects objects added or removed later, and
+        it is not a `dict` (`isinstance(..., dict)`, `json.dumps`). Callers
+        that need a detached copy use `dict(ObjectRegistry.all())`.
+        """
+        return RegistryView()
 
     @classmethod
     def remove(cls, object_id: str) -> bool:
-        if object_id in cls._registry:
-            removed = cls._registry.pop(object_id)
+        shard = cls._shards[hash(object_id) & cls._mask]
+        with shard.guard:
+            shard.prune()
+            removed = shard.lookup(object_id)
+            if removed is not None:
+                shard.delete(object_id, shard.types_of(shard.objects[object_id]))
+                if cls._stats_enabled:
+                    shard.stats.removes += 1
+        if removed is not None:
             logger.debug(f"[ObjectRegistry] Removed {removed}")
             return True
         logger.warning(f"[ObjectRegistry] Cannot remove: id={object_id} not found.")
@@ -48,4 +696,313 @@ class ObjectRegistry:
     @classmethod
     def clear(cls) -> None:
         logger.debug("[ObjectRegistry] Cleared all objects.")
-        cls._registry.clear()
+        for shard in cls._shards:
+            with shard.guard:
+                shard.reset(cls._specs)
+
+    @classmethod
+    def count(cls) -> int:
+        total = 0
+        for shard in cls._shards:
+            if shard.pending:
+                with shard.guard:
+                    shard.prune()
+            total += len(shard.objects)
+        return total
+
+    @classmethod
+    def version(cls) -> int:
+        """Increases on every add, remove and clear."""
+        return sum(shard.version for shard in cls._shards)
+
+    # ------------------------------------------------------------------
+    # Configuration, stats and memory
+    # ------------------------------------------------------------------
+    @classmethod
+    def configure(
+        cls,
+        shards: Optional[int] = None,
+        stats: Optional[bool] = None,
+        mode: Optional[str] = None,
+        ttl_s: Any = MISSING,
+        max_size: Any = MISSING,
+    ) -> None:
+        """
+        Change registry settings. The shard count (a power of two) and mode
+        ("strong" or "weak") can only change while the registry is empty;
+        stats, `ttl_s` and `max_size` at any time (None disables a limit).
+        """
+        with cls._admin_lock:
+            weak = cls._weak if mode is None else cls._parse_mode(mode)
+            n = len(cls._shards) if shards is None else shards
+            if n < 1 or n & (n - 1):
+                raise ValueError("shards must be a power of two")
+            if (n, weak) != (len(cls._shards), cls._weak):
+                if cls.count():
+                    raise RuntimeError("cannot reshard or change mode of a non-empty registry")
+                cls._shards = [_Shard(cls._specs, cls._stats_enabled, weak) for _ in range(n)]
+                cls._mask = n - 1
+                cls._weak = weak
+            if stats is not None:
+                cls._stats_enabled = stats
+                for shard in cls._shards:
+                    shard.guard = _CountingLock(shard.lock, shard.stats) if stats else shard.lock
+            if ttl_s is not MISSING:
+                if ttl_s is not None and ttl_s <= 0:
+                    raise ValueError("ttl_s must be positive")
+                cls._ttl_s = ttl_s
+            if max_size is not MISSING:
+                if max_size is not None and max_size < 1:
+                    raise ValueError("max_size must be positive")
+                cls._max_size = max_size
+            cls._shard_cap = None if cls._max_size is None else math.ceil(cls._max_size / n)
+        logger.info(
+            f"[ObjectRegistry] {n} shards, mode={'weak' if cls._weak else 'strong'}, "
+            f"ttl_s={cls._ttl_s}, max_size={cls._max_size}, stats={cls._stats_enabled}"
+        )
+
+    @staticmethod
+    def _parse_mode(mode: str) -> bool:
+        if mode not in ("strong", "weak"):
+            raise ValueError(f"Unknown registry mode '{mode}' (expected 'strong' or 'weak')")
+        return mode == "weak"
+
+    @classmethod
+    def evict_expired(cls) -> int:
+        """Apply the TTL / max-size policy now; returns how many were evicted."""
+        now, evicted = time.monotonic(), 0
+        for shard in cls._shards:
+            with shard.guard:
+                shard.prune()
+                evicted += shard.evict(now, cls._ttl_s, cls._shard_cap)
+        return evicted
+
+    @classmethod
+    def memory_stats(cls) -> Dict[str, Any]:
+        """Live objects plus how many were garbage-collected or evicted so far."""
+        return {
+            "mode": "weak" if cls._weak else "strong",
+            "live": cls.count(),
+            "collected": sum(shard.collected for shard in cls._shards),
+            "evicted": sum(shard.evicted for shard in cls._shards),
+            "ttl_s": cls._ttl_s,
+            "max_size": cls._max_size,
+        }
+
+    @classmethod
+    def shard_stats(cls) -> List[Dict[str, Any]]:
+        """Per-shard counters plus current size, in shard order."""
+        return [
+            {"shard": i, "size": len(shard.objects), **asdict(shard.stats)}
+            for i, shard in enumerate(cls._shards)
+        ]
+
+    @classmethod
+    def reset_stats(cls) -> None:
+        for shard in cls._shards:
+            with shard.lock:
+                shard.stats.__init__()
+
+    @classmethod
+    def _shard_for(cls, object_id: Any) -> _Shard:
+        return cls._shards[hash(object_id) & cls._mask]
+
+    # ------------------------------------------------------------------
+    # Snapshots and cursors
+    # ------------------------------------------------------------------
+    @classmethod
+    def snapshot(cls) -> RegistrySnapshot:
+        return RegistrySnapshot(cls._shards)
+
+    @classmethod
+    def page(cls, cursor: Optional[int] = None, limit: int = 100) -> RegistryPage:
+        """
+        Up to `limit` objects registered after `cursor`, in insertion order.
+
+        Cursors are sequence numbers, so they stay valid across removals
+        and compaction; `next_cursor` is None once the end is reached.
+        """
+        if limit <= 0:
+            raise ValueError("limit must be positive")
+        after = cursor or 0
+        merged = heapq.merge(
+            *(shard.entries(after) for shard in cls._shards), key=lambda entry: entry[0]
+        )
+        entries = list(islice(merged, limit + 1))
+        items = [obj for _, obj in entries[:limit]]
+        if len(entries) <= limit:
+            return RegistryPage(items, None)
+        return RegistryPage(items, entries[limit - 1][0])
+
+    @classmethod
+    def changes(cls, cursor: Optional[int] = None) -> ChangeSet:
+        """
+        Objects registered or changed, and ids removed, since `cursor` (a
+        previous ChangeSet.cursor; None for everything). Each object appears
+        once, ordered by when the feed recorded its latest change.
+        """
+        after = cursor or 0
+        for shard in cls._shards:
+            with shard.guard:
+                shard.drain()
+        # Everything recorded so far is below `bound`; later changes are left
+        # for the next poll, so none can slip under the returned cursor.
+        bound = next(cls._seq)
+        changed: List[Tuple[int, BaseModel]] = []
+        removed: List[Tuple[int, str]] = []
+        resync = False
+        for shard in cls._shards:
+            c, r, trimmed = shard.changes(after, bound)
+            changed += c
+            removed += r
+            resync = resync or (cursor is not None and trimmed)
+        changed.sort(key=lambda entry: entry[0])
+        removed.sort()
+        return ChangeSet(
+            [obj for _, obj in changed], [object_id for _, object_id in removed], bound - 1, resync
+        )
+
+    @classmethod
+    def _on_changed(cls, obj: BaseModel) -> None:
+        """BaseModel._touch hook: queue the id for the change feed (lock-free)."""
+        shard = cls._shards[hash(obj.id) & cls._mask]
+        touched = shard.touched
+        touched.append(obj.id)
+        if len(touched) > cls.CHANGE_FEED_BATCH:
+            with shard.guard:
+                shard.drain()
+
+    # ------------------------------------------------------------------
+    # Persistence (src/core/registry_persistence.py)
+    # ------------------------------------------------------------------
+    @classmethod
+    def save(cls, path: Any, incremental: bool = False) -> Any:
+        """Write a full snapshot, or only the changes since the last save / restore."""
+        from src.core import registry_persistence
+
+        return registry_persistence.save(path, incremental=incremental)
+
+    @classmethod
+    def restore(cls, *paths: Any) -> List[BaseModel]:
+        """Clear the registry and rebuild it from a full snapshot plus incremental ones."""
+        from src.core import registry_persistence
+
+        return registry_persistence.restore(*paths)
+
+    # ------------------------------------------------------------------
+    # Secondary indexes
+    # ------------------------------------------------------------------
+    @classmethod
+    def create_index(cls, attr: str, ordered: bool = False) -> None:
+        """
+        Maintain an index on `attr` for every registered object.
+
+        `ordered=True` additionally supports range conditions on numeric
+        values. Re-creating an existing index rebuilds it.
+        """
+        if attr in ("id", "name"):
+            raise ValueError(f"'{attr}' is always indexed")
+        with cls._admin_lock:
+            cls._specs[attr] = ordered
+            cls._sync_watched()
+            for shard in cls._shards:
+                with shard.guard:
+                    shard.prune()
+                    index = _AttrIndex(attr, ordered=ordered)
+                    for entry in shard.objects.values():
+                        obj = entry() if shard.weak else entry
+                        if obj is not None:
+                            index.insert(obj, entry)
+                    shard.indexes[attr] = index
+        logger.debug(f"[ObjectRegistry] Indexed '{attr}' (ordered={ordered})")
+
+    @classmethod
+    def drop_index(cls, attr: str) -> bool:
+        with cls._admin_lock:
+            if cls._specs.pop(attr, None) is None:
+                return False
+            cls._sync_watched()
+            for shard in cls._shards:
+                with shard.guard:
+                    shard.indexes.pop(attr, None)
+        return True
+
+    @classmethod
+    def indexes(cls) -> Dict[str, bool]:
+        """Indexed attribute names → whether the index is ordered."""
+        return dict(cls._specs)
+
+    @classmethod
+    def _sync_watched(cls) -> None:
+        BaseModel._watch(frozenset(cls._specs))
+
+    @classmethod
+    def _types_of(cls, klass: type) -> Tuple[type, ...]:
+        types = cls._type_chain.get(klass)
+        if types is None:
+            types = tuple(t for t in klass.__mro__ if issubclass(t, BaseModel))
+            cls._type_chain[klass] = types
+        return types
+
+    @classmethod
+    def _on_attr_change(cls, obj: BaseModel, attr: str, old: Any, new: Any) -> None:
+        """BaseModel hook: refile a registered object under its new value."""
+        object_id = getattr(obj, "id", None)
+        if object_id is None or old is new:
+            return
+        shard = cls._shards[hash(object_id) & cls._mask]
+        if shard.lookup(object_id) is not obj:
+            return
+        with shard.guard:
+            index = shard.indexes.get(attr)
+            if index is not None and shard.lookup(object_id) is obj:
+                index.update(obj, shard.objects[object_id])
+
+    # ------------------------------------------------------------------
+    # Query
+    # ------------------------------------------------------------------
+    @classmethod
+    def query(
+        cls,
+        type_: Optional[Type[BaseModel]] = None,
+        *,
+        name: Optional[str] = None,
+        where: Optional[Callable[[BaseModel], bool]] = None,
+        limit: Optional[int] = None,
+        **conditions: Any,
+    ) -> List[BaseModel]:
+        """
+        Registered objects matching every condition.
+
+        Conditions are `attr=value` or `attr__op=value` with op one of
+        eq, ne, lt, le, gt, ge, in. `where` is an arbitrary predicate applied
+        last. In each shard the smallest candidate set any index can provide
+        (type, name, or an attribute index) is scanned and the remaining
+        conditions re-checked, so un-indexed conditions still work — just
+        without the speed-up. Results are grouped by shard, not ordered.
+        """
+        parsed: List[Tuple[str, str, Any]] = []
+        for key, value in conditions.items():
+            attr, _, op = key.partition("__")
+            op = op or "eq"
+            if op not in _OPS:
+                raise ValueError(f"Unknown query operator '{op}' in '{key}'")
+            parsed.append((attr, op, value))
+        if name is not None:
+            parsed.append(("name", "eq", name))
+
+        results: List[BaseModel] = []
+        for shard in cls._shards:
+            remaining = None if limit is None else limit - len(results)
+            if remaining == 0:
+                break
+            with shard.guard:
+                shard.prune()
+                results.extend(shard.select(type_, parsed, where, remaining))
+        return results
+
+
+BaseModel._attr_listener = ObjectRegistry._on_attr_change
+BaseModel._on_created = ObjectRegistry.add
+BaseModel._on_changed = ObjectRegistry._on_changed
+ObjectRegistry._sync_watched()
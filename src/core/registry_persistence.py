@@ -0,0 +1,262 @@
+"""
+Registry persistence — snapshot ObjectRegistry to disk and restore it
+────────────────────────────────────────────────────────────────────────────
+A snapshot is one pickle (protocol 5) holding, per model class, a column of
+values for every slot along the class's MRO (plus each object's __dict__
+for classes that have one). Restoring allocates objects with
+`cls.__new__`, fills the slots directly and registers them: no `__init__`,
+no constructor logging, no `__post_init__` hook.
+
+Incremental snapshots hold only the objects added or changed since the
+previous snapshot saved (or restored) in this process, plus the ids removed
+since then. Changes are detected from a per-object fingerprint of the
+saved state (a blake2b digest of its pickled row), so an incremental save
+reads every object but writes only the delta.
+
+Snapshots are pickles: only restore files you wrote yourself.
+
+Usage:
+    ObjectRegistry.save("state/full.snap")                    # full
+    ObjectRegistry.save("state/0001.snap", incremental=True)  # delta
+    ObjectRegistry.restore("state/full.snap", "state/0001.snap")
+"""
+
+from __future__ import annotations
+import hashlib
+import importlib
+import os
+import pickle
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from loguru import logger
+
+from src.core.base_model import BaseModel
+from src.core.object_registry import ObjectRegistry
+
+FORMAT = "software3-registry"
+VERSION = 1
+
+PathLike = Union[str, os.PathLike]
+
+
+class _Unset:
+    """Column marker for a slot that was never assigned (pickled by reference)."""
+
+
+@dataclass
+class SnapshotInfo:
+    path: str
+    kind: str             # "full" | "incremental"
+    objects: int          # objects written
+    removed: int          # ids recorded as removed (incremental only)
+    bytes: int
+    seconds: float
+
+
+# Fingerprints of the last saved / restored state: id -> digest of the row.
+_baseline: Optional[Dict[str, bytes]] = None
+
+
+# --------------------------------------------------------------------- #
+# Class layout
+# --------------------------------------------------------------------- #
+_FIELDS: Dict[type, Tuple[str, ...]] = {}
+
+
+def _fields(cls: type) -> Tuple[str, ...]:
+    """Every slot along the MRO, base classes first (private names mangled)."""
+    fields = _FIELDS.get(cls)
+    if fields is None:
+        names: List[str] = []
+        for klass in reversed(cls.__mro__):
+            slots = klass.__dict__.get("__slots__", ())
+            for slot in (slots,) if isinstance(slots, str) else slots:
+                if slot in ("__weakref__", "__dict__"):
+                    continue
+                if slot.startswith("__") and not slot.endswith("__"):
+                    slot = f"_{klass.__name__.lstrip('_')}{slot}"
+                names.append(slot)
+        fields = _FIELDS[cls] = tuple(names)
+    return fields
+
+
+def _row(obj: BaseModel, fields: Tuple[str, ...]) -> Tuple[Any, ...]:
+    return tuple(getattr(obj, f, _Unset) for f in fields)
+
+
+def _fingerprint(cls: type, row: Tuple[Any, ...], extra: Optional[dict]) -> bytes:
+    """
+    Digest of the exact saved state. Not hash(): it collides for distinct
+    values (hash(-1) == hash(-2)), which would drop a change from a delta.
+    """
+    state = (cls.__module__, cls.__qualname__, row, extra)
+    return hashlib.blake2b(pickle.dumps(state, protocol=5), digest_size=16).digest()
+
+
+def _resolve(module: str, qualname: str) -> type:
+    if "<locals>" in qualname:
+        raise TypeError(f"Cannot restore {module}.{qualname}: class is not importable")
+    obj: Any = importlib.import_module(module)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+# --------------------------------------------------------------------- #
+# Save
+# --------------------------------------------------------------------- #
+def save(path: PathLike, incremental: bool = False) -> SnapshotInfo:
+    """Write a full (or incremental) snapshot of the registry to `path`, atomically."""
+    global _baseline
+    if incremental and _baseline is None:
+        raise RuntimeError("No full snapshot saved or restored yet; cannot save incrementally.")
+
+    start = time.perf_counter()
+    previous = _baseline or {}
+    current: Dict[str, bytes] = {}
+    classes: Dict[type, Dict[str, Any]] = {}
+    written = 0
+    for obj in ObjectRegistry.snapshot():
+        cls = type(obj)
+        fields = _fields(cls)
+        row = _row(obj, fields)
+        extra = getattr(obj, "__dict__", None)
+        extra = dict(extra) if extra else None
+        fp = current[obj.id] = _fingerprint(cls, row, extra)
+        if incremental and previous.get(obj.id) == fp:
+            continue
+
+        block = classes.get(cls)
+        if block is None:
+            block = classes[cls] = {
+                "module": cls.__module__,
+                "qualname": cls.__qualname__,
+                "fields": fields,
+                "rows": [],
+                "extra": [],
+            }
+        block["rows"].append(row)
+        block["extra"].append(extra)
+        written += 1
+
+    removed = [i for i in previous if i not in current] if incremental else []
+    payload = {
+        "format": FORMAT,
+        "version": VERSION,
+        "kind": "incremental" if incremental else "full",
+        "created": time.time(),
+        "classes": [_columnar(block) for block in classes.values()],
+        "removed": removed,
+    }
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        pickle.dump(payload, f, protocol=5)
+    os.replace(tmp, path)
+    _baseline = current
+
+    info = SnapshotInfo(
+        path=str(path),
+        kind=payload["kind"],
+        objects=written,
+        removed=len(removed),
+        bytes=path.stat().st_size,
+        seconds=time.perf_counter() - start,
+    )
+    logger.info(
+        f"[registry_persistence] Saved {info.kind} snapshot {info.path}: "
+        f"{info.objects} objects, {info.removed} removed, {info.bytes} bytes"
+    )
+    return info
+
+
+def _columnar(block: Dict[str, Any]) -> Dict[str, Any]:
+    """Rows -> one list per field, which pickles smaller and faster."""
+    extra = block["extra"]
+    return {
+        "module": block["module"],
+        "qualname": block["qualname"],
+        "fields": block["fields"],
+        "count": len(block["rows"]),
+        "columns": [list(column) for column in zip(*block["rows"])],
+        "extra": extra if any(e is not None for e in extra) else None,
+    }
+
+
+# --------------------------------------------------------------------- #
+# Restore
+# --------------------------------------------------------------------- #
+def restore(*paths: PathLike) -> List[BaseModel]:
+    """
+    Rebuild the registry from a full snapshot followed by any incremental
+    ones, in order. The registry is cleared first. Returns the live objects
+    (in weak mode, keep this list to keep them registered).
+    """
+    global _baseline
+    if not paths:
+        raise ValueError("restore() needs at least one snapshot path")
+
+    start = time.perf_counter()
+    ObjectRegistry.clear()
+    restored: Dict[str, BaseModel] = {}
+    fingerprints: Dict[str, bytes] = {}
+    for n, path in enumerate(paths):
+        with open(path, "rb") as f:
+            payload = pickle.load(f)
+        if payload.get("format") != FORMAT or payload.get("version") != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} registry snapshot")
+        if (payload["kind"] == "full") != (n == 0):
+            raise ValueError(f"{path}: expected a {'full' if n == 0 else 'incremental'} snapshot")
+
+        for object_id in payload["removed"]:
+            if restored.pop(object_id, None) is not None:
+                fingerprints.pop(object_id, None)
+                ObjectRegistry.remove(object_id)
+        for block in payload["classes"]:
+            _restore_block(block, restored, fingerprints)
+
+    _baseline = fingerprints
+
+    logger.info(
+        f"[registry_persistence] Restored {len(restored)} objects from {len(paths)} snapshot(s) "
+        f"in {time.perf_counter() - start:.2f} s"
+    )
+    return list(restored.values())
+
+
+def _restore_block(
+    block: Dict[str, Any], restored: Dict[str, BaseModel], fingerprints: Dict[str, bytes]
+) -> None:
+    cls = _resolve(block["module"], block["qualname"])
+    fields = tuple(block["fields"])
+    if fields != _fields(cls):
+        raise ValueError(f"{cls.__qualname__} slots changed since the snapshot was taken")
+
+    # Slot descriptors' __set__ bypasses BaseModel's attribute hook; the
+    # registry indexes each object from its final state when it is added.
+    setters = [getattr(cls, f).__set__ for f in fields]
+    id_at = fields.index("id")
+    extras = block["extra"] or [None] * block["count"]
+    new = cls.__new__
+    add = ObjectRegistry.add
+    for row, extra in zip(zip(*block["columns"]), extras):
+        object_id = row[id_at]
+        obj = restored.get(object_id)
+        if obj is not None:
+            ObjectRegistry.remove(object_id)  # changed: re-register with the new state
+        else:
+            obj = new(cls)
+        for set_, value in zip(setters, row):
+            if value is not _Unset:
+                set_(obj, value)
+        if extra is not None:
+            obj.__dict__.update(extra)
+        add(obj)
+        restored[object_id] = obj
+        # The row read back is exactly what save() hashed: no need to re-read the object.
+        fingerprints[object_id] = _fingerprint(cls, row, extra)
@@ -0,0 +1,158 @@
+"""
+Serialization — generated per-class serializers and NDJSON export
+────────────────────────────────────────────────────────────────────────────
+`to_dict()` rebuilds its dict through up to five `super().to_dict()` +
+`update()` levels. `serializer_for(cls)` replaces that chain with one
+generated function per class that builds the same dict in a single literal:
+the key order is taken from `to_dict()` once (on the first instance seen),
+plain keys read the attribute / property of the same name, and computed
+keys call the method named in the class's `_dict_computed` map (e.g.
+"estimated_range" → `estimate_range()`). The generated function is checked
+against `to_dict()` on that first instance; any class it cannot reproduce
+keeps using its own `to_dict`.
+
+JSON goes through orjson when it is installed (compact output only; the
+pretty format stays on the stdlib for byte-identical output).
+
+Usage:
+    from src.core.serialization import dump_many, dumps, serialize
+    data = serialize(jet)                        # == jet.to_dict()
+    line = dumps(jet)                            # compact JSON
+    with open("registry.ndjson", "wb") as f:
+        dump_many(ObjectRegistry.snapshot(), f)  # one object per line
+"""
+
+from __future__ import annotations
+import io
+import json
+from typing import Any, Callable, Dict, IO, Iterable, Optional
+
+from loguru import logger
+
+try:
+    import orjson
+except ImportError:  # optional fast path; stdlib json otherwise
+    orjson = None
+
+Serializer = Callable[[Any], Dict[str, Any]]
+
+_SERIALIZERS: Dict[type, Serializer] = {}
+# Lines buffered per write() in dump_many.
+BATCH = 1024
+
+
+# --------------------------------------------------------------------- #
+# Generated serializers
+# --------------------------------------------------------------------- #
+def _computed(cls: type) -> Dict[str, str]:
+    merged: Dict[str, str] = {}
+    for klass in reversed(cls.__mro__):
+        merged.update(klass.__dict__.get("_dict_computed", {}))
+    return merged
+
+
+def _generate(cls: type, sample: Any) -> Optional[Serializer]:
+    """Source-generate a one-literal serializer for `cls`, or None if it can't match to_dict()."""
+    expected = sample.to_dict()
+    computed = _computed(cls)
+    items = []
+    for key in expected:
+        if key == "type" and expected[key] == cls.__name__:
+            items.append(f"{key!r}: {cls.__name__!r}")
+        elif key in computed:
+            items.append(f"{key!r}: o.{computed[key]}()")
+        elif key.isidentifier() and hasattr(sample, key):
+            items.append(f"{key!r}: o.{key}")
+        else:
+            return None
+
+    source = f"def serialize(o):\n    return {{{', '.join(items)}}}\n"
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, f"<serializer {cls.__qualname__}>", "exec"), namespace)
+    serialize = namespace["serialize"]
+
+    try:
+        generated = serialize(sample)
+    except Exception:
+        return None
+    if generated != expected or list(generated) != list(expected):
+        return None
+    return serialize
+
+
+def serializer_for(cls: type, sample: Any = None) -> Serializer:
+    """
+    The cached serializer for `cls`. Building one needs an instance
+    (`sample`); until a class has been seen, its own `to_dict` is returned.
+    """
+    serializer = _SERIALIZERS.get(cls)
+    if serializer is None:
+        if sample is None:
+            return cls.to_dict
+        serializer = _generate(cls, sample)
+        if serializer is None:
+            logger.debug(f"[serialization] {cls.__name__}: no generated serializer, using to_dict")
+            serializer = cls.to_dict
+        _SERIALIZERS[cls] = serializer
+    return serializer
+
+
+def serialize(obj: Any, exclude_none: bool = False) -> Dict[str, Any]:
+    """`obj.to_dict()` via the generated serializer; optionally without None values."""
+    cls = type(obj)
+    serializer = _SERIALIZERS.get(cls) or serializer_for(cls, obj)
+    data = serializer(obj)
+    if exclude_none:
+        return {k: v for k, v in data.items() if v is not None}
+    return data
+
+
+# --------------------------------------------------------------------- #
+# JSON
+# --------------------------------------------------------------------- #
+def encode(data: Any, compact: bool = True) -> bytes:
+    """JSON bytes: compact (orjson if available) or the pretty `indent=4, sort_keys` form."""
+    if not compact:
+        return json.dumps(data, indent=4, sort_keys=True).encode()
+    if orjson is not None:
+        try:
+            return orjson.dumps(data)
+        except TypeError:  # e.g. non-str keys, ints beyond 64 bits: stdlib handles those
+            pass
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def dumps(obj: Any, compact: bool = True, exclude_none: bool = False) -> str:
+    """One model as a JSON string."""
+    return encode(serialize(obj, exclude_none), compact).decode()
+
+
+def dump_many(
+    objects: Iterable[Any], fp: IO, exclude_none: bool = False, batch: int = BATCH
+) -> int:
+    """
+    Stream `objects` to `fp` as NDJSON (one compact object per line), in
+    `batch`-line writes. `fp` may be binary or text. Returns the count.
+    """
+    text = isinstance(fp, io.TextIOBase) or "b" not in getattr(fp, "mode", "b")
+    cache = _SERIALIZERS
+    lines = []
+    count = 0
+    for obj in objects:
+        cls = type(obj)
+        data = (cache.get(cls) or serializer_for(cls, obj))(obj)
+        if exclude_none:
+            data = {k: v for k, v in data.items() if v is not None}
+        lines.append(encode(data))
+        count += 1
+        if len(lines) >= batch:
+            _flush(fp, lines, text)
+    if lines:
+        _flush(fp, lines, text)
+    return count
+
+
+def _flush(fp: IO, lines: list, text: bool) -> None:
+    chunk = b"\n".join(lines) + b"\n"
+    fp.write(chunk.decode() if text else chunk)
+    lines.clear()
@@ -0,0 +1,143 @@
+"""
+Telemetry — lazy, level-gated logging for the model classes
+────────────────────────────────────────────────────────────────────────────
+Each model module logs through a named Channel instead of calling loguru
+with an f-string. A channel call takes a `str.format` template plus keyword
+fields: nothing is formatted unless a loguru handler accepts the record, and
+the fields also land in `record["extra"]`, so every message doubles as a
+structured event. When a channel is off (disabled class, global switch,
+below the telemetry level, or skipped by sampling) a call costs one
+attribute check.
+
+Configuration (environment defaults, or at runtime):
+    MODEL_TELEMETRY=off              # global switch ("on" by default)
+    MODEL_TELEMETRY_LEVEL=INFO       # drop model DEBUG records
+    MODEL_TELEMETRY_SAMPLE_EVERY=100 # keep 1 in 100 DEBUG/INFO records
+
+    telemetry.configure(enabled=True, level="INFO", sample_every=10)
+    telemetry.disable(JetPlane)      # or "JetPlane"; enable() undoes it
+
+Channels are named after the class that owns the log call (the "[Airplane]"
+prefix), so disabling Airplane silences Airplane's own methods, including
+when they run on a JetPlane.
+
+Usage (in a model module):
+    _log = telemetry.channel("TransportMode")
+    _log.info("{name} traveled {distance} miles", name=self.name, distance=distance)
+"""
+
+from __future__ import annotations
+import os
+from typing import Any, Dict, Optional, Set, Union
+
+from loguru import logger
+
+_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+# Sampling thins the chatty levels only; warnings and errors are always kept.
+_SAMPLED = ("DEBUG", "INFO")
+
+ENABLED = os.getenv("MODEL_TELEMETRY", "on").lower() not in ("0", "off", "false", "no")
+LEVEL = os.getenv("MODEL_TELEMETRY_LEVEL", "DEBUG").upper()
+SAMPLE_EVERY = int(os.getenv("MODEL_TELEMETRY_SAMPLE_EVERY", "1"))
+if LEVEL not in _LEVELS:
+    raise ValueError(f"MODEL_TELEMETRY_LEVEL must be one of {_LEVELS}, got '{LEVEL}'")
+
+# depth=2 attributes each record (and logger.disable() filtering) to the model
+# method that called the channel. Built once: opt() allocates a new Logger.
+_logger = logger.opt(depth=2)
+
+_config: Dict[str, Any] = {"enabled": ENABLED, "level": LEVEL, "sample_every": max(1, SAMPLE_EVERY)}
+_disabled: Set[str] = set()
+_channels: Dict[str, "Channel"] = {}
+
+
+class Channel:
+    """Per-class log channel; the `_debug`, `_info`, ... flags are the whole fast path."""
+
+    __slots__ = ("name", "prefix", "sample_every", "_count", "_debug", "_info", "_warning", "_error")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.prefix = f"[{name}] "
+        self._count = 0
+        self._apply()
+
+    def _apply(self) -> None:
+        on = _config["enabled"] and self.name not in _disabled
+        floor = _LEVELS.index(_config["level"])
+        self.sample_every = _config["sample_every"]
+        for i, level in enumerate(_LEVELS):
+            setattr(self, f"_{level.lower()}", on and i >= floor)
+
+    def _emit(self, level: str, message: str, fields: Dict[str, Any]) -> None:
+        if self.sample_every > 1 and level in _SAMPLED:
+            self._count += 1
+            if self._count % self.sample_every:
+                return
+        _logger.log(level, self.prefix + message, **fields)
+
+    def debug(self, message: str, **fields: Any) -> None:
+        if self._debug:
+            self._emit("DEBUG", message, fields)
+
+    def info(self, message: str, **fields: Any) -> None:
+        if self._info:
+            self._emit("INFO", message, fields)
+
+    def warning(self, message: str, **fields: Any) -> None:
+        if self._warning:
+            self._emit("WARNING", message, fields)
+
+    def error(self, message: str, **fields: Any) -> None:
+        if self._error:
+            self._emit("ERROR", message, fields)
+
+
+def channel(name: str) -> Channel:
+    """The (shared) channel called `name`."""
+    if name not in _channels:
+        _channels[name] = Channel(name)
+    return _channels[name]
+
+
+def configure(
+    enabled: Optional[bool] = None, level: Optional[str] = None, sample_every: Optional[int] = None
+) -> None:
+    """Change the global switch, minimum level and/or sampling for every channel."""
+    if level is not None:
+        level = level.upper()
+        if level not in _LEVELS:
+            raise ValueError(f"level must be one of {_LEVELS}, got '{level}'")
+        _config["level"] = level
+    if enabled is not None:
+        _config["enabled"] = enabled
+    if sample_every is not None:
+        if sample_every < 1:
+            raise ValueError("sample_every must be >= 1")
+        _config["sample_every"] = sample_every
+    _refresh()
+
+
+def disable(*classes: Union[type, str]) -> None:
+    """Silence the channels of these classes (or class names)."""
+    _disabled.update(_name(c) for c in classes)
+    _refresh()
+
+
+def enable(*classes: Union[type, str]) -> None:
+    """Undo `disable` for these classes (or class names)."""
+    _disabled.difference_update(_name(c) for c in classes)
+    _refresh()
+
+
+def settings() -> Dict[str, Any]:
+    return {**_config, "disabled": sorted(_disabled)}
+
+
+def _name(cls: Union[type, str]) -> str:
+    return cls if isinstance(cls, str) else cls.__name__
+
+
+def _refresh() -> None:
+    for ch in _channels.values():
+        ch._apply()
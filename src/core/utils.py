@@ -3,13 +3,19 @@ from datetime import datetime
 from typing import Any, Dict
 from loguru import logger
 
+from src.core.serialization import encode
 
-def safe_json_dumps(data: Dict[str, Any]) -> str:
+
+def safe_json_dumps(data: Dict[str, Any], compact: bool = False) -> str:
     """
     Safely converts a Python dict into a pretty JSON string.
     Useful for logging, MCP responses, and debugging.
+    compact=True emits single-line JSON instead (orjson when installed),
+    for bulk export; see src/core/serialization.py.
     """
     try:
+        if compact:
+            return encode(data, compact=True).decode()
         return json.dumps(data, indent=4, sort_keys=True)
     except Exception as e:
         logger.error(f"[utils] JSON serialization failed: {e}")
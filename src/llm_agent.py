@@ -1,31 +1,96 @@
+"""
+LLM agent — one warm, shareable MCP agent
+────────────────────────────────────────────────────────────────────────────
+`build_agent()` creates the ChatOpenAI client (on one pooled, keep-alive
+httpx client), loads the tools and calls `initialize_agent` once; the
+returned AgentExecutor holds no per-run state, so it can serve concurrent
+`run()` calls from worker threads. `run_agent()` reuses a process-wide
+agent built on first use.
+
+LangChain and the tools are imported inside `build_agent()`, so the API
+module (src/src/api.py) imports, and can be tested with a stub agent,
+without them.
+
+Configuration:
+    AGENT_MODEL=gpt-4                  # chat model
+    AGENT_HTTP_MAX_CONNECTIONS=16      # pooled connections to the LLM API
+    AGENT_HTTP_TIMEOUT_S=60
+    AGENT_VERBOSE=1                    # print the agent's reasoning trace
+
+Usage:
+    agent = build_agent()
+    agent.run("Train the model and summarize results.")
+"""
+
 import os
-from dotenv import load_dotenv
-from langchain_openai import ChatOpenAI
-from langchain.agents import initialize_agent, AgentType
-from tools.ml_tools import train_model_tool
+import threading
+from typing import Any, Optional
+
+import httpx
+
+try:
+    from dotenv import load_dotenv
+except ImportError:  # optional: plain environment variables still work
+    load_dotenv = None
+
+if load_dotenv is not None:
+    load_dotenv()
+
+MODEL = os.getenv("AGENT_MODEL", "gpt-4")
+HTTP_MAX_CONNECTIONS = int(os.getenv("AGENT_HTTP_MAX_CONNECTIONS", "16"))
+HTTP_TIMEOUT_S = float(os.getenv("AGENT_HTTP_TIMEOUT_S", "60"))
+VERBOSE = os.getenv("AGENT_VERBOSE", "1").lower() not in ("0", "off", "false", "no")
+
+_agent: Optional[Any] = None
+_agent_lock = threading.Lock()
 
-load_dotenv()
 
-def run_agent():
+def build_http_client(max_connections: int = HTTP_MAX_CONNECTIONS) -> httpx.Client:
+    """Keep-alive connection pool for the LLM API; close it on shutdown."""
+    return httpx.Client(
+        limits=httpx.Limits(
+            max_connections=max_connections, max_keepalive_connections=max_connections
+        ),
+        timeout=HTTP_TIMEOUT_S,
+    )
+
+
+def build_agent(http_client: Optional[httpx.Client] = None, verbose: bool = VERBOSE) -> Any:
+    """LLM client + tools + agent, built once and meant to be reused."""
+    from langchain_openai import ChatOpenAI
+    from langchain.agents import initialize_agent, AgentType
+    from tools.ml_tools import train_model_tool
+
     llm = ChatOpenAI(
-        model="gpt-4",
-        temperature=0
+        model=MODEL,
+        temperature=0,
+        http_client=http_client or build_http_client(),
     )
 
     tools = [train_model_tool]
 
-    agent = initialize_agent(
+    return initialize_agent(
         tools=tools,
         llm=llm,
         agent=AgentType.OPENAI_FUNCTIONS,
-        verbose=True
+        verbose=verbose
     )
 
-    response = agent.run(
-        "Train the model and summarize what was done."
-    )
 
-    print(response)
+def get_agent() -> Any:
+    """The process-wide agent, built on first use."""
+    global _agent
+    if _agent is None:
+        with _agent_lock:
+            if _agent is None:
+                _agent = build_agent()
+    return _agent
+
+
+def run_agent(custom_task: str = "Train the model and summarize results.", agent: Any = None):
+    response = (agent or get_agent()).run(custom_task)
+    return response
+
 
 if __name__ == "__main__":
-    run_agent()
\ No newline at end of file
+    print(run_agent("Train the model and summarize what was done."))
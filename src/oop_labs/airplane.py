@@ -1,9 +1,10 @@
 from __future__ import annotations
 from typing import Optional, Dict, Any
-from loguru import logger
 
 from src.oop_labs.transport_mode import TransportMode
-from src.core.object_registry import ObjectRegistry
+from src.core import telemetry
+
+_log = telemetry.channel("Airplane")
 
 
 class Airplane(TransportMode):
@@ -25,6 +26,8 @@ class Airplane(TransportMode):
     - Safe altitude management + structured telemetry logging
     """
 
+    __slots__ = ("wingspan", "max_altitude", "num_passengers", "current_altitude", "in_air")
+
     def __init__(
         self,
         name: str,
@@ -42,11 +45,13 @@ class Airplane(TransportMode):
         self.current_altitude = 0
         self.in_air = False
 
-        ObjectRegistry.add(self)
-
-        logger.info(
-            f"[Airplane] '{self.name}' created (wingspan={wingspan} ft, "
-            f"ceil={max_altitude} ft, pax={num_passengers})"
+        _log.info(
+            "'{name}' created (wingspan={wingspan} ft, "
+            "ceil={max_altitude} ft, pax={num_passengers})",
+            name=self.name,
+            wingspan=wingspan,
+            max_altitude=max_altitude,
+            num_passengers=num_passengers,
         )
 
     # ---------------------------------------------------------
@@ -54,22 +59,24 @@ class Airplane(TransportMode):
     # ---------------------------------------------------------
     def takeoff(self):
         if self.in_air:
-            logger.warning(f"[Airplane] {self.name} is already airborne.")
+            _log.warning("{name} is already airborne.", name=self.name)
             return False
 
         self.in_air = True
         self.current_altitude = 1000  # immediate safe alt
-        logger.info(f"[Airplane] {self.name} successfully took off.")
+        self._touch()
+        _log.info("{name} successfully took off.", name=self.name)
         return True
 
     def land(self):
         if not self.in_air:
-            logger.warning(f"[Airplane] {self.name} is already on the ground.")
+            _log.warning("{name} is already on the ground.", name=self.name)
             return False
 
         self.in_air = False
         self.current_altitude = 0
-        logger.info(f"[Airplane] {self.name} landed successfully.")
+        self._touch()
+        _log.info("{name} landed successfully.", name=self.name)
         return True
 
     # ---------------------------------------------------------
@@ -77,35 +84,44 @@ class Airplane(TransportMode):
     # ---------------------------------------------------------
     def climb(self, feet: float):
         if not self.in_air:
-            logger.error(f"[Airplane] {self.name} cannot climb while on the ground.")
+            _log.error("{name} cannot climb while on the ground.", name=self.name)
             return False
 
         new_alt = self.current_altitude + feet
 
         if self.max_altitude is not None and new_alt > self.max_altitude:
-            logger.error(
-                f"[Airplane] {self.name} cannot exceed max altitude "
-                f"({self.max_altitude} ft). Requested climb to {new_alt} ft."
+            _log.error(
+                "{name} cannot exceed max altitude "
+                "({max_altitude} ft). Requested climb to {new_alt} ft.",
+                name=self.name, max_altitude=self.max_altitude, new_alt=new_alt,
             )
             return False
 
         self.current_altitude = new_alt
-        logger.info(f"[Airplane] {self.name} climbed to {self.current_altitude} ft.")
+        self._touch()
+        _log.info(
+            "{name} climbed to {current_altitude} ft.",
+            name=self.name, current_altitude=self.current_altitude,
+        )
         return True
 
     def descend(self, feet: float):
         if not self.in_air:
-            logger.error(f"[Airplane] {self.name} cannot descend while on the ground.")
+            _log.error("{name} cannot descend while on the ground.", name=self.name)
             return False
 
         new_alt = self.current_altitude - feet
 
         if new_alt <= 0:
-            logger.info(f"[Airplane] {self.name} descending to runway...")
+            _log.info("{name} descending to runway...", name=self.name)
             return self.land()
 
         self.current_altitude = new_alt
-        logger.info(f"[Airplane] {self.name} descended to {self.current_altitude} ft.")
+        self._touch()
+        _log.info(
+            "{name} descended to {current_altitude} ft.",
+            name=self.name, current_altitude=self.current_altitude,
+        )
         return True
 
     # ---------------------------------------------------------
@@ -115,7 +131,7 @@ class Airplane(TransportMode):
         """
         Airplanes still use range calculations from TransportMode but logs differently.
         """
-        logger.info(f"[Airplane] {self.name} preparing to travel {distance} miles.")
+        _log.info("{name} preparing to travel {distance} miles.", name=self.name, distance=distance)
         return super().travel(distance)
 
     # ---------------------------------------------------------
@@ -66,16 +66,14 @@ def create_demo_objects():
 def show_all_registered_objects():
     """Print out everything inside the registry in a clean JSON-table format."""
     logger.info("=== Listing all registered simulation objects ===")
-    all_objects = ObjectRegistry.all()
-
-    if not all_objects:
+    if not ObjectRegistry.count():
         print("No objects registered.")
         return
 
     print("\nRegistered Objects:")
     print("-------------------")
-    for obj_id, obj in all_objects.items():
-        print(f"ID: {obj_id} | Type: {obj.__class__.__name__}")
+    for obj in ObjectRegistry.snapshot():
+        print(f"ID: {obj.id} | Type: {obj.__class__.__name__}")
         pprint(obj.to_dict())
         print()
 
@@ -10,6 +10,8 @@ This script demonstrates how to use the OOP classes in the oop_labs package:
 - JetPlane
 
 Run this demo to see inheritance, polymorphism, logging, and simulation functions.
+The last demo drives the same kind of objects through the discrete-event
+Simulator (src/oop_labs/simulation.py) on a simulated clock.
 """
 
 from loguru import logger
@@ -17,6 +19,8 @@ from loguru import logger
 from src.oop_labs.motorcycle import Motorcycle
 from src.oop_labs.airplane import Airplane
 from src.oop_labs.jet_plane import JetPlane
+from src.oop_labs.motor_vehicle import MotorVehicle
+from src.oop_labs.simulation import Simulator
 
 
 def demo_motorcycle():
@@ -93,6 +97,34 @@ def demo_jetplane():
     jet.land()
 
 
+def demo_scheduled_sim():
+    logger.info("=== Discrete-Event Simulation Demo ===")
+
+    car = MotorVehicle(name="Civic", max_speed=70, horsepower=158, weight_lbs=2900)
+    car.configure_fuel_system(mpg=36, fuel_capacity=12.4)
+    car.add_fuel(5.0)
+
+    jet = JetPlane(name="F-16", max_speed=1300, wingspan=32.7, max_altitude=50000)
+    jet.configure_fuel_system(mpg=1.5, fuel_capacity=1000)
+    jet.add_fuel(800)
+
+    sim = Simulator(step_h=0.5)
+    sim.schedule(0.0, "travel", car, 150)
+    sim.schedule(0.0, "takeoff", jet)
+    sim.schedule(0.1, "climb", jet, 20000)
+    sim.schedule(0.2, "afterburner_on", jet)
+    sim.schedule(0.2, "travel", jet, 900)
+    sim.schedule(0.5, "afterburner_off", jet)
+    sim.schedule(1.5, "descend", jet, 25000)
+
+    stats = sim.run()
+    logger.info(
+        f"Simulated {stats.clock_h:.2f} h: {stats.events} events, "
+        f"{stats.distance_mi:.0f} mi, {stats.fuel_used_gal:.1f} gal, "
+        f"trips completed={stats.trips_completed}, aborted={stats.trips_aborted}"
+    )
+
+
 if __name__ == "__main__":
     logger.info("=== Running OOP Vehicle Simulation Demo ===\n")
 
@@ -103,5 +135,8 @@ if __name__ == "__main__":
     print("\n----------------------------------------\n")
 
     demo_jetplane()
+    print("\n----------------------------------------\n")
+
+    demo_scheduled_sim()
 
     logger.info("=== Demo Complete ===")
@@ -0,0 +1,277 @@
+"""
+Fleet — columnar state for many vehicles
+────────────────────────────────────────────────────────────────────────────
+Stores the travel-relevant state of a fleet as NumPy columns (one float64 /
+bool array per attribute, NaN where the per-object attribute is None) and
+applies `travel`, `add_fuel`, `charge` and the range estimates to every
+vehicle in one vectorized call. Results match the per-object methods of
+TransportMode / MotorVehicle / JetPlane bit for bit: EV power takes priority
+when configured, a trip the tank or battery cannot cover is rejected and
+leaves the vehicle untouched, and vehicles without a power system always
+succeed.
+
+Usage:
+    fleet = Fleet.from_vehicles(vehicles)     # or Fleet(n, mpg=..., ...)
+    ok = fleet.travel(120.0)                  # bool array, one per vehicle
+    fleet.add_fuel(5.0, select=~ok)
+    fleet.write_back()                        # push changed state onto the objects
+"""
+
+from __future__ import annotations
+import math
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+from src.core import telemetry
+from src.oop_labs.jet_plane import JetPlane
+
+_log = telemetry.channel("Fleet")
+
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+Selection = Optional[Union[Sequence[int], np.ndarray]]
+
+# Float columns; NaN stands for an attribute that is None on the object.
+# `mach_speed` is NaN for everything but jets and doubles as the jet mask.
+FLOAT_COLUMNS = (
+    "max_speed",
+    "mpg",
+    "fuel_capacity",
+    "current_fuel",
+    "battery_kwh",
+    "current_charge_kwh",
+    "efficiency_mi_per_kwh",
+    "current_altitude",
+    "max_altitude",
+    "mach_speed",
+)
+BOOL_COLUMNS = ("in_air", "afterburner_on")
+# Columns the engine mutates, i.e. what `write_back` pushes onto the objects.
+STATE_COLUMNS = (
+    "current_fuel",
+    "current_charge_kwh",
+    "current_altitude",
+    "in_air",
+    "mach_speed",
+    "afterburner_on",
+)
+
+
+class Fleet:
+    """
+    Columnar fleet engine.
+
+    Every column is a public 1-D array of length `len(fleet)` and may be read
+    or assigned directly. Methods taking `select` act on that subset only
+    (an index array or a boolean mask) and return arrays aligned with it.
+    """
+
+    def __init__(self, size: int, **columns: ArrayLike):
+        unknown = set(columns) - set(FLOAT_COLUMNS) - set(BOOL_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown fleet columns: {sorted(unknown)}")
+
+        self.size = size
+        self.vehicles: Optional[List[Any]] = None
+        self._synced: Dict[str, np.ndarray] = {}  # STATE_COLUMNS as last seen on the objects
+        for name in FLOAT_COLUMNS:
+            col = np.full(size, np.nan)
+            if name in columns:
+                col[:] = columns[name]
+            setattr(self, name, col)
+        for name in BOOL_COLUMNS:
+            col = np.zeros(size, dtype=bool)
+            if name in columns:
+                col[:] = columns[name]
+            setattr(self, name, col)
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, np.ndarray]) -> "Fleet":
+        """
+        Wrap existing arrays without copying (e.g. views into shared memory).
+        Every column must be present, 1-D, of equal length and of the right
+        dtype (float64, or bool for BOOL_COLUMNS).
+        """
+        fleet = cls.__new__(cls)
+        fleet.size = len(columns[FLOAT_COLUMNS[0]])
+        fleet.vehicles = None
+        fleet._synced = {}
+        for name in FLOAT_COLUMNS + BOOL_COLUMNS:
+            col = columns[name]
+            if col.shape != (fleet.size,):
+                raise ValueError(f"Column '{name}' has shape {col.shape}, expected ({fleet.size},)")
+            setattr(fleet, name, col)
+        return fleet
+
+    @classmethod
+    def from_vehicles(cls, vehicles: Iterable[Any]) -> "Fleet":
+        """Build columns from TransportMode objects; `write_back` updates them later."""
+        vehicles = list(vehicles)
+        columns: Dict[str, Any] = {}
+        for name in FLOAT_COLUMNS:
+            columns[name] = [_float(getattr(v, name, None)) for v in vehicles]
+        for name in BOOL_COLUMNS:
+            columns[name] = [bool(getattr(v, name, False)) for v in vehicles]
+        fleet = cls(len(vehicles), **columns)
+        fleet.vehicles = vehicles
+        fleet._synced = {name: getattr(fleet, name).copy() for name in STATE_COLUMNS}
+        return fleet
+
+    def write_back(self) -> int:
+        """
+        Copy the state columns back onto the objects passed to
+        `from_vehicles`, for the vehicles whose values changed since the last
+        sync only: just the changed attributes are assigned (ints stay ints
+        when the value is still integral) and only those vehicles count as
+        changed (`BaseModel._touch`). Returns the number of vehicles updated.
+        """
+        if self.vehicles is None:
+            raise RuntimeError("Fleet was not built from vehicles.")
+
+        changed: Dict[str, np.ndarray] = {}
+        for name in STATE_COLUMNS:
+            col, synced = getattr(self, name), self._synced[name]
+            diff = col != synced
+            if col.dtype != bool:
+                diff &= ~(np.isnan(col) & np.isnan(synced))  # NaN == NaN here
+            if diff.any():
+                changed[name] = diff
+
+        dirty = np.zeros(self.size, dtype=bool)
+        for diff in changed.values():
+            dirty |= diff
+        updated = 0
+        for i in np.flatnonzero(dirty).tolist():
+            v = self.vehicles[i]
+            wrote = False
+            for name, diff in changed.items():
+                if diff[i] and hasattr(v, name):
+                    setattr(v, name, _restore(getattr(v, name), getattr(self, name)[i].item()))
+                    wrote = True
+            if wrote:
+                v._touch()
+                updated += 1
+
+        for name in changed:
+            self._synced[name][:] = getattr(self, name)
+        _log.debug("Wrote back {updated}/{total} vehicles", updated=updated, total=self.size)
+        return updated
+
+    def __len__(self) -> int:
+        return self.size
+
+    # ---------------------------------------------------------
+    # Selection helpers
+    # ---------------------------------------------------------
+    def _index(self, select: Selection) -> Union[slice, np.ndarray]:
+        if select is None:
+            return slice(None)
+        select = np.asarray(select)
+        return select if select.dtype == bool else select.astype(np.intp)
+
+    # ---------------------------------------------------------
+    # Energy
+    # ---------------------------------------------------------
+    def add_fuel(self, gallons: ArrayLike, select: Selection = None) -> None:
+        """Vectorized TransportMode.add_fuel; non-positive amounts are ignored."""
+        at = self._index(select)
+        fuel = self.current_fuel[at]
+        if np.isnan(fuel).any():
+            raise RuntimeError("Fuel system not configured for every selected vehicle.")
+
+        gallons = np.broadcast_to(np.asarray(gallons, dtype=float), fuel.shape)
+        positive = gallons > 0
+        self.current_fuel[at] = np.where(
+            positive, np.minimum(self.fuel_capacity[at], fuel + gallons), fuel
+        )
+        _log.info(
+            "Fueled {count}/{total} vehicles",
+            count=int(np.count_nonzero(positive)),
+            total=fuel.size,
+        )
+
+    def charge(self, kwh: ArrayLike, select: Selection = None) -> None:
+        """Vectorized MotorVehicle.charge; non-positive amounts are ignored."""
+        at = self._index(select)
+        charge = self.current_charge_kwh[at]
+        if np.isnan(charge).any():
+            raise RuntimeError("EV system not configured for every selected vehicle.")
+
+        kwh = np.broadcast_to(np.asarray(kwh, dtype=float), charge.shape)
+        positive = kwh > 0
+        self.current_charge_kwh[at] = np.where(
+            positive, np.minimum(self.battery_kwh[at], charge + kwh), charge
+        )
+        _log.info(
+            "Charged {count}/{total} vehicles",
+            count=int(np.count_nonzero(positive)),
+            total=charge.size,
+        )
+
+    def estimate_range(self, select: Selection = None) -> np.ndarray:
+        """Fuel range in miles (NaN without a fuel system)."""
+        at = self._index(select)
+        return self.current_fuel[at] * self.mpg[at]
+
+    def remaining_range_ev(self, select: Selection = None) -> np.ndarray:
+        """Battery range in miles (NaN without an EV system)."""
+        at = self._index(select)
+        return self.current_charge_kwh[at] * self.efficiency_mi_per_kwh[at]
+
+    # ---------------------------------------------------------
+    # Travel
+    # ---------------------------------------------------------
+    def travel(self, distance: ArrayLike, select: Selection = None) -> np.ndarray:
+        """
+        Vectorized travel. Returns a bool array: True where the trip was
+        made, False where the distance was not positive or the selected
+        power system could not cover it (that vehicle is left unchanged).
+        """
+        at = self._index(select)
+        efficiency = self.efficiency_mi_per_kwh[at]
+        mpg = self.mpg[at]
+        distance = np.broadcast_to(np.asarray(distance, dtype=float), efficiency.shape)
+
+        # JetPlane.travel updates Mach before attempting the trip.
+        mach = self.mach_speed[at]
+        jets = ~np.isnan(mach)
+        if jets.any():
+            boost = np.where(self.afterburner_on[at], 1.25, 1.0)
+            self.mach_speed[at] = np.where(
+                jets, self.max_speed[at] * boost / JetPlane.SPEED_OF_SOUND_MPH, mach
+            )
+
+        positive = distance > 0
+        ev = ~np.isnan(efficiency)
+        gas = ~ev & ~np.isnan(mpg)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            required_kwh = distance / efficiency
+            required_fuel = distance / mpg
+        charge = self.current_charge_kwh[at]
+        fuel = self.current_fuel[at]
+        ev_ok = positive & ev & (charge >= required_kwh)
+        gas_ok = positive & gas & (fuel >= required_fuel)
+
+        self.current_charge_kwh[at] = np.where(ev_ok, charge - required_kwh, charge)
+        self.current_fuel[at] = np.where(gas_ok, fuel - required_fuel, fuel)
+
+        ok = ev_ok | gas_ok | (positive & ~ev & ~gas)
+        _log.info(
+            "Traveled {count}/{total} vehicles", count=int(np.count_nonzero(ok)), total=ok.size
+        )
+        return ok
+
+
+def _float(value: Optional[float]) -> float:
+    return math.nan if value is None else float(value)
+
+
+def _restore(old: Any, value: Any) -> Any:
+    """A column value in the object's type: NaN → None, integral float → int if it was one."""
+    if isinstance(value, float):
+        if math.isnan(value):
+            return None
+        if isinstance(old, int) and not isinstance(old, bool) and value.is_integer():
+            return int(value)
+    return value
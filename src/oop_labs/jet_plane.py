@@ -1,9 +1,10 @@
 from __future__ import annotations
 from typing import Optional, Dict, Any
-from loguru import logger
 
 from src.oop_labs.airplane import Airplane
-from src.core.object_registry import ObjectRegistry
+from src.core import telemetry
+
+_log = telemetry.channel("JetPlane")
 
 
 class JetPlane(Airplane):
@@ -20,6 +21,8 @@ class JetPlane(Airplane):
     • military/aerobatics-grade safety checks
     """
 
+    __slots__ = ("is_military", "afterburner_on", "autopilot_enabled", "mach_speed")
+
     SPEED_OF_SOUND_MPH = 767  # Mach 1
 
     def __init__(
@@ -44,12 +47,14 @@ class JetPlane(Airplane):
         self.autopilot_enabled = False
         self.mach_speed = 0.0  # current speed divided by speed of sound
 
-        ObjectRegistry.add(self)
-
-        logger.info(
-            f"[JetPlane] '{self.name}' registered "
-            f"(military={self.is_military}, wingspan={wingspan} ft, "
-            f"max_alt={max_altitude} ft)"
+        _log.info(
+            "'{name}' registered "
+            "(military={is_military}, wingspan={wingspan} ft, "
+            "max_alt={max_altitude} ft)",
+            name=self.name,
+            is_military=self.is_military,
+            wingspan=wingspan,
+            max_altitude=max_altitude,
         )
 
     # ---------------------------------------------------------
@@ -58,40 +63,43 @@ class JetPlane(Airplane):
     def enable_afterburner(self):
         """Temporarily increase thrust and fuel/energy consumption."""
         if not self.in_air:
-            logger.error("[JetPlane] Cannot enable afterburners while grounded.")
+            _log.error("Cannot enable afterburners while grounded.")
             return False
 
         self.afterburner_on = True
-        logger.info(f"[JetPlane] {self.name} engaged afterburners! 🔥")
+        self._touch()
+        _log.info("{name} engaged afterburners! 🔥", name=self.name)
         return True
 
     def disable_afterburner(self):
         self.afterburner_on = False
-        logger.info(f"[JetPlane] {self.name} disengaged afterburners.")
+        self._touch()
+        _log.info("{name} disengaged afterburners.", name=self.name)
         return True
 
     def update_mach_speed(self, mph: float):
         """Convert MPH to Mach number for telemetry."""
         self.mach_speed = mph / self.SPEED_OF_SOUND_MPH
-        logger.info(f"[JetPlane] {self.name} Mach={self.mach_speed:.2f}")
+        self._touch()
+        _log.info("{name} Mach={mach_speed:.2f}", name=self.name, mach_speed=self.mach_speed)
 
     # ---------------------------------------------------------
     # Combat / Aerobatic Maneuvers
     # ---------------------------------------------------------
     def barrel_roll(self):
         if not self.in_air:
-            logger.error("[JetPlane] Cannot perform barrel roll on the ground.")
+            _log.error("Cannot perform barrel roll on the ground.")
             return "Jet must be in the air."
 
-        logger.warning(f"[JetPlane] {self.name} performs a BARREL ROLL! 🎯")
+        _log.warning("{name} performs a BARREL ROLL! 🎯", name=self.name)
         return f"{self.name} performs a perfect barrel roll at {self.current_altitude} ft!"
 
     def immelmann(self):
         if not self.in_air:
-            logger.error("[JetPlane] Cannot perform Immelmann while grounded.")
+            _log.error("Cannot perform Immelmann while grounded.")
             return "Jet must be airborne."
 
-        logger.info(f"[JetPlane] {self.name} performs an Immelmann turn.")
+        _log.info("{name} performs an Immelmann turn.", name=self.name)
         return f"{self.name} performs an Immelmann and reverses direction!"
 
     # ---------------------------------------------------------
@@ -99,16 +107,18 @@ class JetPlane(Airplane):
     # ---------------------------------------------------------
     def enable_autopilot(self):
         if not self.in_air:
-            logger.error("[JetPlane] Cannot enable autopilot while grounded.")
+            _log.error("Cannot enable autopilot while grounded.")
             return False
 
         self.autopilot_enabled = True
-        logger.info(f"[JetPlane] Auto-pilot engaged for {self.name}.")
+        self._touch()
+        _log.info("Auto-pilot engaged for {name}.", name=self.name)
         return True
 
     def disable_autopilot(self):
         self.autopilot_enabled = False
-        logger.info(f"[JetPlane] Auto-pilot disengaged for {self.name}.")
+        self._touch()
+        _log.info("Auto-pilot disengaged for {name}.", name=self.name)
         return True
 
     # ---------------------------------------------------------
@@ -116,7 +126,10 @@ class JetPlane(Airplane):
     # ---------------------------------------------------------
     def travel(self, distance: float) -> bool:
         """Override to track Mach speed + afterburner."""
-        logger.info(f"[JetPlane] {self.name} preparing supersonic travel: {distance} miles.")
+        _log.info(
+            "{name} preparing supersonic travel: {distance} miles.",
+            name=self.name, distance=distance,
+        )
 
         # If afterburner is enabled, max speed increases by 25%
         speed_used = self.max_speed * (1.25 if self.afterburner_on else 1.0)
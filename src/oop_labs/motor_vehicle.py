@@ -1,9 +1,10 @@
 from __future__ import annotations
 from typing import Optional, Dict, Any
-from loguru import logger
 
 from src.oop_labs.transport_mode import TransportMode
-from src.core.object_registry import ObjectRegistry
+from src.core import telemetry
+
+_log = telemetry.channel("MotorVehicle")
 
 
 class MotorVehicle(TransportMode):
@@ -19,6 +20,16 @@ class MotorVehicle(TransportMode):
     - Logs all events for ML/AI/MCP and debugging
     """
 
+    __slots__ = (
+        "horsepower",
+        "weight_lbs",
+        "engine_running",
+        "battery_kwh",
+        "current_charge_kwh",
+        "efficiency_mi_per_kwh",
+    )
+    _dict_computed = {"ev_range_estimate": "remaining_range_ev"}
+
     def __init__(
         self,
         name: str,
@@ -40,11 +51,9 @@ class MotorVehicle(TransportMode):
         self.current_charge_kwh: Optional[float] = None
         self.efficiency_mi_per_kwh: Optional[float] = None
 
-        ObjectRegistry.add(self)
-
-        logger.info(
-            f"[MotorVehicle] Registered vehicle '{self.name}' "
-            f"(hp={self.horsepower}, weight={self.weight_lbs} lbs)"
+        _log.info(
+            "Registered vehicle '{name}' (hp={horsepower}, weight={weight_lbs} lbs)",
+            name=self.name, horsepower=self.horsepower, weight_lbs=self.weight_lbs,
         )
 
     # ---------------------------------------------------------
@@ -52,20 +61,22 @@ class MotorVehicle(TransportMode):
     # ---------------------------------------------------------
     def start_engine(self):
         if self.engine_running:
-            logger.warning(f"[MotorVehicle] {self.name} engine already running.")
+            _log.warning("{name} engine already running.", name=self.name)
             return False
 
         self.engine_running = True
-        logger.info(f"[MotorVehicle] {self.name} engine started.")
+        self._touch()
+        _log.info("{name} engine started.", name=self.name)
         return True
 
     def stop_engine(self):
         if not self.engine_running:
-            logger.warning(f"[MotorVehicle] {self.name} engine already off.")
+            _log.warning("{name} engine already off.", name=self.name)
             return False
 
         self.engine_running = False
-        logger.info(f"[MotorVehicle] {self.name} engine stopped.")
+        self._touch()
+        _log.info("{name} engine stopped.", name=self.name)
         return True
 
     # ---------------------------------------------------------
@@ -76,25 +87,28 @@ class MotorVehicle(TransportMode):
         self.battery_kwh = battery_kwh
         self.current_charge_kwh = 0.0
         self.efficiency_mi_per_kwh = efficiency_mi_per_kwh
+        self._touch()
 
-        logger.info(
-            f"[MotorVehicle] {self.name} configured as an EV "
-            f"(battery={battery_kwh} kWh, efficiency={efficiency_mi_per_kwh} mi/kWh)"
+        _log.info(
+            "{name} configured as an EV "
+            "(battery={battery_kwh} kWh, efficiency={efficiency_mi_per_kwh} mi/kWh)",
+            name=self.name, battery_kwh=battery_kwh, efficiency_mi_per_kwh=efficiency_mi_per_kwh,
         )
 
     def charge(self, kwh: float):
         if self.current_charge_kwh is None:
             raise RuntimeError("EV system not configured for this vehicle.")
         if kwh <= 0:
-            logger.warning("[MotorVehicle] Cannot charge with negative or zero kWh.")
+            _log.warning("Cannot charge with negative or zero kWh.")
             return
 
         new_charge = min(self.battery_kwh, self.current_charge_kwh + kwh)
-        logger.info(
-            f"[MotorVehicle] Charging {self.name}: "
-            f"{self.current_charge_kwh} -> {new_charge} kWh"
+        _log.info(
+            "Charging {name}: {current_charge_kwh} -> {new_charge} kWh",
+            name=self.name, current_charge_kwh=self.current_charge_kwh, new_charge=new_charge,
         )
         self.current_charge_kwh = new_charge
+        self._touch()
 
     def remaining_range_ev(self) -> Optional[float]:
         if self.current_charge_kwh is None or self.efficiency_mi_per_kwh is None:
@@ -107,23 +121,29 @@ class MotorVehicle(TransportMode):
     def travel(self, distance: float) -> bool:
         """Simulate travel using the appropriate power system."""
         if distance <= 0:
-            logger.warning("[MotorVehicle] Distance must be positive.")
+            _log.warning("Distance must be positive.")
             return False
 
         # EV takes priority if configured
         if self.efficiency_mi_per_kwh is not None:
             required_kwh = distance / self.efficiency_mi_per_kwh
             if self.current_charge_kwh < required_kwh:
-                logger.error(
-                    f"[MotorVehicle] {self.name} cannot travel {distance} miles (EV). "
-                    f"Required={required_kwh:.2f} kWh, Available={self.current_charge_kwh:.2f} kWh"
+                _log.error(
+                    "{name} cannot travel {distance} miles (EV). "
+                    "Required={required_kwh:.2f} kWh, Available={current_charge_kwh:.2f} kWh",
+                    name=self.name,
+                    distance=distance,
+                    required_kwh=required_kwh,
+                    current_charge_kwh=self.current_charge_kwh,
                 )
                 return False
 
             self.current_charge_kwh -= required_kwh
-            logger.info(
-                f"[MotorVehicle] {self.name} traveled {distance} miles using EV power. "
-                f"Remaining charge={self.current_charge_kwh:.2f} kWh"
+            self._touch()
+            _log.info(
+                "{name} traveled {distance} miles using EV power. "
+                "Remaining charge={current_charge_kwh:.2f} kWh",
+                name=self.name, distance=distance, current_charge_kwh=self.current_charge_kwh,
             )
             return True
 
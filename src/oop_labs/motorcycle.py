@@ -1,9 +1,10 @@
 from __future__ import annotations
 from typing import Optional, Dict, Any
-from loguru import logger
 
 from src.oop_labs.motor_vehicle import MotorVehicle
-from src.core.object_registry import ObjectRegistry
+from src.core import telemetry
+
+_log = telemetry.channel("Motorcycle")
 
 
 class Motorcycle(MotorVehicle):
@@ -23,6 +24,8 @@ class Motorcycle(MotorVehicle):
     - Structured logging for telemetry and debugging
     """
 
+    __slots__ = ("seat_height", "is_offroad_capable", "has_abs")
+
     def __init__(
         self,
         name: str,
@@ -44,11 +47,14 @@ class Motorcycle(MotorVehicle):
         self.is_offroad_capable = is_offroad_capable
         self.has_abs = has_abs
 
-        ObjectRegistry.add(self)
-
-        logger.info(
-            f"[Motorcycle] Created motorcycle '{self.name}' "
-            f"(hp={horsepower}, weight={weight_lbs}, offroad={is_offroad_capable}, abs={has_abs})"
+        _log.info(
+            "Created motorcycle '{name}' "
+            "(hp={horsepower}, weight={weight_lbs}, offroad={is_offroad_capable}, abs={has_abs})",
+            name=self.name,
+            horsepower=horsepower,
+            weight_lbs=weight_lbs,
+            is_offroad_capable=is_offroad_capable,
+            has_abs=has_abs,
         )
 
     # ---------------------------------------------------------
@@ -56,7 +62,7 @@ class Motorcycle(MotorVehicle):
     # ---------------------------------------------------------
     def wheelie(self):
         """Perform a wheelie — purely simulated."""
-        logger.warning(f"[Motorcycle] {self.name} attempted a wheelie! 🤘🏽")
+        _log.warning("{name} attempted a wheelie! 🤘🏽", name=self.name)
         return f"{self.name} lifts the front wheel briefly — dangerous but impressive!"
 
     def lean(self, angle: float):
@@ -68,14 +74,13 @@ class Motorcycle(MotorVehicle):
             return "Lean angle must be positive."
 
         if angle > 50:
-            logger.error(
-                f"[Motorcycle] {self.name} leaned dangerously at {angle}° — unsafe!"
+            _log.error(
+                "{name} leaned dangerously at {angle}° — unsafe!",
+                name=self.name, angle=angle,
             )
             return f"{self.name} leans too far! {angle}° is unsafe!"
         else:
-            logger.info(
-                f"[Motorcycle] {self.name} leans safely at {angle}°."
-            )
+            _log.info("{name} leans safely at {angle}°.", name=self.name, angle=angle)
             return f"{self.name} leans smoothly at {angle}°."
 
     # ---------------------------------------------------------
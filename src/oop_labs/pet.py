@@ -1,9 +1,10 @@
 from __future__ import annotations
 from typing import Dict, Any
-from loguru import logger
 
 from src.core.base_model import BaseModel
-from src.core.object_registry import ObjectRegistry
+from src.core import telemetry
+
+_log = telemetry.channel("Pet")
 
 
 class Pet(BaseModel):
@@ -17,13 +18,17 @@ class Pet(BaseModel):
     - LLM explanation support via BaseModel.explain()
     """
 
+    __slots__ = ("age", "species")
+
     def __init__(self, name: str, age: int, species: str = "Unknown"):
         super().__init__(name=name)
         self.age = age
         self.species = species
 
-        ObjectRegistry.add(self)
-        logger.debug(f"[Pet] Created Pet(name={name}, age={age}, species={species})")
+        _log.debug(
+            "Created Pet(name={name}, age={age}, species={species})",
+            name=name, age=age, species=species,
+        )
 
     # -----------------------------------
     # Core OOP functionality
@@ -31,7 +36,8 @@ class Pet(BaseModel):
     def birthday(self) -> None:
         """Increment the pet's age by 1 year."""
         self.age += 1
-        logger.info(f"[Pet] {self.name} just turned {self.age} years old!")
+        self._touch()
+        _log.info("{name} just turned {age} years old!", name=self.name, age=self.age)
 
     # -----------------------------------
     # Serialization
@@ -0,0 +1,174 @@
+"""
+Discrete-event simulation for oop_labs vehicles
+────────────────────────────────────────────────────────────────────────────
+A heapq-based scheduler with a simulated clock (hours). Events call the
+model methods themselves, so every registry hook, EV-first rule and
+insufficient-fuel rejection applies unchanged:
+
+    takeoff / land / climb(feet) / descend(feet)    Airplane, JetPlane
+    afterburner_on / afterburner_off                 JetPlane
+    travel(miles)                                    any TransportMode
+
+A trip is time-stepped: every `step_h` simulated hours the vehicle covers
+`speed * step_h` miles through `travel()`, burning fuel (or charge) from
+`mpg` (or mi/kWh) as the step begins. Speed is `max_speed`, +25% for a jet
+with afterburners on, re-read each step. A step the tank cannot cover aborts
+the trip; otherwise the trip is counted complete when the last step ends.
+
+Usage:
+    sim = Simulator(step_h=0.25)
+    sim.schedule(0.0, "takeoff", plane)
+    sim.schedule(0.1, "climb", plane, 3000)
+    sim.schedule(0.2, "travel", plane, 400)
+    stats = sim.run()
+    print(stats.events_per_sec, stats.distance_mi)
+"""
+
+from __future__ import annotations
+import heapq
+import itertools
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.core import telemetry
+from src.oop_labs.transport_mode import TransportMode
+
+_log = telemetry.channel("Simulator")
+
+# (time, seq, kind, vehicle, arg); seq keeps same-time events FIFO and
+# means vehicles are never compared.
+Event = Tuple[float, int, str, TransportMode, Any]
+
+EVENTS = (
+    "takeoff", "land", "climb", "descend", "afterburner_on", "afterburner_off", "travel",
+)
+
+
+@dataclass
+class SimulationStats:
+    events: int = 0
+    failed: int = 0               # events whose model method returned False
+    trips_completed: int = 0
+    trips_aborted: int = 0        # out of fuel / charge, or no speed
+    distance_mi: float = 0.0
+    fuel_used_gal: float = 0.0
+    charge_used_kwh: float = 0.0
+    clock_h: float = 0.0
+    wall_s: float = 0.0
+
+    @property
+    def events_per_sec(self) -> float:
+        return self.events / self.wall_s if self.wall_s else 0.0
+
+
+class Simulator:
+    """Priority-queue event scheduler driving TransportMode objects."""
+
+    def __init__(self, step_h: float = 0.25, start_h: float = 0.0):
+        if step_h <= 0:
+            raise ValueError("step_h must be positive")
+        self.step_h = step_h
+        self.now = start_h
+        self.stats = SimulationStats(clock_h=start_h)
+        self._queue: List[Event] = []
+        self._seq = itertools.count()
+        self._handlers: Dict[str, Callable[[TransportMode, Any], Optional[bool]]] = {
+            "takeoff": lambda v, _: v.takeoff(),
+            "land": lambda v, _: v.land(),
+            "climb": lambda v, feet: v.climb(feet),
+            "descend": lambda v, feet: v.descend(feet),
+            "afterburner_on": lambda v, _: v.enable_afterburner(),
+            "afterburner_off": lambda v, _: v.disable_afterburner(),
+            "travel": self._leg,
+            "arrive": self._arrive,  # internal: end of a trip's last step
+        }
+
+    def __len__(self) -> int:
+        """Pending events."""
+        return len(self._queue)
+
+    # ---------------------------------------------------------
+    # Scheduling
+    # ---------------------------------------------------------
+    def schedule(self, at_h: float, kind: str, vehicle: TransportMode, arg: Any = None) -> None:
+        """Queue `kind` for `vehicle` at simulated time `at_h` (not before now)."""
+        if kind not in EVENTS:
+            raise ValueError(f"Unknown event '{kind}' (expected one of {EVENTS})")
+        if at_h < self.now:
+            raise ValueError(f"Cannot schedule at {at_h} h, clock is already at {self.now} h")
+        heapq.heappush(self._queue, (at_h, next(self._seq), kind, vehicle, arg))
+
+    def schedule_many(self, events: List[Tuple[float, str, TransportMode, Any]]) -> None:
+        """Bulk `schedule` for large initial loads: one heapify instead of N pushes."""
+        for at_h, kind, _, _ in events:
+            if kind not in EVENTS:
+                raise ValueError(f"Unknown event '{kind}' (expected one of {EVENTS})")
+            if at_h < self.now:
+                raise ValueError(f"Cannot schedule at {at_h} h, clock is already at {self.now} h")
+        seq = self._seq
+        self._queue.extend((at_h, next(seq), kind, v, arg) for at_h, kind, v, arg in events)
+        heapq.heapify(self._queue)
+
+    # ---------------------------------------------------------
+    # Event loop
+    # ---------------------------------------------------------
+    def run(self, until_h: Optional[float] = None) -> SimulationStats:
+        """Process events in time order up to `until_h` (or until none are left)."""
+        queue, handlers, stats = self._queue, self._handlers, self.stats
+        pop = heapq.heappop
+        events = failed = 0
+        start = time.perf_counter()
+        while queue and (until_h is None or queue[0][0] <= until_h):
+            at_h, _, kind, vehicle, arg = pop(queue)
+            self.now = at_h
+            if handlers[kind](vehicle, arg) is False:
+                failed += 1
+            events += 1
+        if until_h is not None and until_h > self.now:
+            self.now = until_h
+
+        stats.events += events
+        stats.failed += failed
+        stats.clock_h = self.now
+        stats.wall_s += time.perf_counter() - start
+        _log.info(
+            "{events} events to t={clock_h:.2f} h ({rate:,.0f} events/s, {pending} pending)",
+            events=events, clock_h=self.now, rate=stats.events_per_sec, pending=len(queue),
+        )
+        return stats
+
+    # ---------------------------------------------------------
+    # Time-stepped travel
+    # ---------------------------------------------------------
+    def _leg(self, vehicle: TransportMode, remaining: float) -> bool:
+        """Cover one step of a trip and queue the next step (or the arrival)."""
+        stats = self.stats
+        speed = vehicle.max_speed
+        if getattr(vehicle, "afterburner_on", False):  # JetPlane only; cheaper than isinstance
+            speed *= 1.25
+        if not speed or speed <= 0 or remaining <= 0:
+            stats.trips_aborted += 1
+            return False
+
+        miles = min(remaining, speed * self.step_h)
+        fuel = vehicle.current_fuel
+        charge = getattr(vehicle, "current_charge_kwh", None)
+        if not vehicle.travel(miles):
+            stats.trips_aborted += 1
+            return False
+
+        stats.distance_mi += miles
+        if fuel is not None:
+            stats.fuel_used_gal += fuel - vehicle.current_fuel
+        if charge is not None:
+            stats.charge_used_kwh += charge - vehicle.current_charge_kwh
+
+        remaining -= miles
+        kind = "travel" if remaining > 0 else "arrive"
+        heapq.heappush(self._queue, (self.now + miles / speed, next(self._seq), kind, vehicle, remaining))
+        return True
+
+    def _arrive(self, vehicle: TransportMode, _: Any) -> bool:
+        self.stats.trips_completed += 1
+        return True
@@ -1,9 +1,10 @@
 from __future__ import annotations
 from typing import Dict, Any
-from loguru import logger
 
 from src.core.base_model import BaseModel
-from src.core.object_registry import ObjectRegistry
+from src.core import explanations, telemetry
+
+_log = telemetry.channel("Team")
 
 
 class Team(BaseModel):
@@ -18,13 +19,17 @@ class Team(BaseModel):
     - Automatically registers itself into ObjectRegistry
     """
 
+    __slots__ = ("wins", "losses")
+
     def __init__(self, name: str, wins: int = 0, losses: int = 0):
         super().__init__(name=name)
         self.wins = wins
         self.losses = losses
 
-        ObjectRegistry.add(self)
-        logger.debug(f"[Team] Created Team(name={name}, wins={wins}, losses={losses})")
+        _log.debug(
+            "Created Team(name={name}, wins={wins}, losses={losses})",
+            name=name, wins=wins, losses=losses,
+        )
 
     # ---------------------------------------------------------
     # Core Team Logic
@@ -32,12 +37,17 @@ class Team(BaseModel):
     def record_win(self) -> None:
         """Increment the team's win count."""
         self.wins += 1
-        logger.info(f"[Team] {self.name} recorded a win! Total wins: {self.wins}")
+        self._touch()
+        _log.info("{name} recorded a win! Total wins: {wins}", name=self.name, wins=self.wins)
 
     def record_loss(self) -> None:
         """Increment the team's loss count."""
         self.losses += 1
-        logger.info(f"[Team] {self.name} recorded a loss. Total losses: {self.losses}")
+        self._touch()
+        _log.info(
+            "{name} recorded a loss. Total losses: {losses}",
+            name=self.name, losses=self.losses,
+        )
 
     @property
     def total_games(self) -> int:
@@ -56,13 +66,13 @@ class Team(BaseModel):
     # ---------------------------------------------------------
     async def summarize(self) -> str:
         """
-        Uses the LLM to summarize team performance.
+        Uses the LLM to summarize team performance (batched and cached like
+        BaseModel.explain).
         """
         try:
-            from src.ai.llama_client import llama_summarize_team
-            return await llama_summarize_team(self.to_dict())
+            return await explanations.get_service().summarize(self)
         except Exception as e:
-            logger.error(f"[Team] LLM summary failed: {e}")
+            _log.error("LLM summary failed: {error}", error=e)
             return "Summary unavailable."
 
     # ---------------------------------------------------------
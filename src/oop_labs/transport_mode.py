@@ -1,9 +1,10 @@
 from __future__ import annotations
 from typing import Optional, Dict, Any
-from loguru import logger
 
 from src.core.base_model import BaseModel
-from src.core.object_registry import ObjectRegistry
+from src.core import telemetry
+
+_log = telemetry.channel("TransportMode")
 
 
 class TransportMode(BaseModel):
@@ -19,6 +20,9 @@ class TransportMode(BaseModel):
     - LLM/MCP explain() support via BaseModel
     """
 
+    __slots__ = ("max_speed", "fuel_capacity", "current_fuel", "mpg")
+    _dict_computed = {"estimated_range": "estimate_range"}
+
     def __init__(self, name: str, max_speed: float):
         super().__init__(name=name)
         self.max_speed = max_speed  # mph
@@ -26,11 +30,9 @@ class TransportMode(BaseModel):
         self.current_fuel: Optional[float] = None   # gallons (optional)
         self.mpg: Optional[float] = None            # miles per gallon (optional)
 
-        ObjectRegistry.add(self)
-
-        logger.debug(
-            f"[TransportMode] Created {self.name} "
-            f"with max_speed={self.max_speed} mph"
+        _log.debug(
+            "Created {name} with max_speed={max_speed} mph",
+            name=self.name, max_speed=self.max_speed,
         )
 
     # ---------------------------------------------------------
@@ -41,10 +43,11 @@ class TransportMode(BaseModel):
         self.mpg = mpg
         self.fuel_capacity = fuel_capacity
         self.current_fuel = 0.0
+        self._touch()
 
-        logger.info(
-            f"[TransportMode] {self.name} fuel system configured: "
-            f"mpg={mpg}, capacity={fuel_capacity} gal"
+        _log.info(
+            "{name} fuel system configured: mpg={mpg}, capacity={fuel_capacity} gal",
+            name=self.name, mpg=mpg, fuel_capacity=fuel_capacity,
         )
 
     def add_fuel(self, gallons: float):
@@ -53,16 +56,17 @@ class TransportMode(BaseModel):
             raise RuntimeError("Fuel system not configured for this vehicle.")
 
         if gallons <= 0:
-            logger.warning("[TransportMode] Cannot add non-positive fuel amount.")
+            _log.warning("Cannot add non-positive fuel amount.")
             return
 
         new_level = min(self.fuel_capacity, self.current_fuel + gallons)
-        logger.info(
-            f"[TransportMode] Adding {gallons} gal to {self.name}. "
-            f"Fuel: {self.current_fuel} -> {new_level}"
+        _log.info(
+            "Adding {gallons} gal to {name}. Fuel: {current_fuel} -> {new_level}",
+            gallons=gallons, name=self.name, current_fuel=self.current_fuel, new_level=new_level,
         )
 
         self.current_fuel = new_level
+        self._touch()
 
     def estimate_range(self) -> Optional[float]:
         """Return estimated remaining range in miles based on fuel and mpg."""
@@ -79,31 +83,36 @@ class TransportMode(BaseModel):
         Vehicles without fuel systems always succeed.
         """
         if distance <= 0:
-            logger.warning("[TransportMode] Travel distance must be positive.")
+            _log.warning("Travel distance must be positive.")
             return False
 
         # If no fuel system = treat as always successful (e.g., bikes/boats/EVs)
         if self.mpg is None:
-            logger.info(
-                f"[TransportMode] {self.name} traveled {distance} miles "
-                "(no fuel system)."
+            _log.info(
+                "{name} traveled {distance} miles (no fuel system).",
+                name=self.name, distance=distance,
             )
             return True
 
         required_fuel = distance / self.mpg
 
         if self.current_fuel < required_fuel:
-            logger.warning(
-                f"[TransportMode] {self.name} cannot travel {distance} miles. "
-                f"Required={required_fuel:.2f} gal, Available={self.current_fuel:.2f} gal"
+            _log.warning(
+                "{name} cannot travel {distance} miles. "
+                "Required={required_fuel:.2f} gal, Available={current_fuel:.2f} gal",
+                name=self.name,
+                distance=distance,
+                required_fuel=required_fuel,
+                current_fuel=self.current_fuel,
             )
             return False
 
         self.current_fuel -= required_fuel
+        self._touch()
 
-        logger.info(
-            f"[TransportMode] {self.name} traveled {distance} miles. "
-            f"Fuel remaining={self.current_fuel:.2f} gal"
+        _log.info(
+            "{name} traveled {distance} miles. Fuel remaining={current_fuel:.2f} gal",
+            name=self.name, distance=distance, current_fuel=self.current_fuel,
         )
         return True
 
@@ -1,9 +1,10 @@
 from __future__ import annotations
 from typing import Dict, Any
-from loguru import logger
 
 from src.core.base_model import BaseModel
-from src.core.object_registry import ObjectRegistry
+from src.core import telemetry
+
+_log = telemetry.channel("VendingMachine")
 
 
 class VendingMachine(BaseModel):
@@ -20,12 +21,13 @@ class VendingMachine(BaseModel):
     - AI hooks via BaseModel.explain()
     """
 
+    __slots__ = ("inventory",)
+
     def __init__(self, name: str, initial_inventory: int = 0):
         super().__init__(name=name)
         self.inventory = initial_inventory
 
-        ObjectRegistry.add(self)
-        logger.debug(f"[VendingMachine] Created with inventory={self.inventory}")
+        _log.debug("Created with inventory={inventory}", inventory=self.inventory)
 
     # ---------------------------------------------------------
     # Core Behavior
@@ -36,28 +38,36 @@ class VendingMachine(BaseModel):
         Returns True if successful, False otherwise.
         """
         if quantity <= 0:
-            logger.warning("[VendingMachine] Cannot purchase non-positive quantity.")
+            _log.warning("Cannot purchase non-positive quantity.")
             return False
 
         if self.inventory < quantity:
-            logger.warning(
-                f"[VendingMachine] Purchase failed. "
-                f"Requested={quantity}, Available={self.inventory}"
+            _log.warning(
+                "Purchase failed. Requested={quantity}, Available={inventory}",
+                quantity=quantity, inventory=self.inventory,
             )
             return False
 
         self.inventory -= quantity
-        logger.info(f"[VendingMachine] Purchased {quantity}. Remaining={self.inventory}")
+        self._touch()
+        _log.info(
+            "Purchased {quantity}. Remaining={inventory}",
+            quantity=quantity, inventory=self.inventory,
+        )
         return True
 
     def restock(self, quantity: int) -> None:
         """Add items to the machine inventory."""
         if quantity <= 0:
-            logger.warning("[VendingMachine] Cannot restock with non-positive quantity.")
+            _log.warning("Cannot restock with non-positive quantity.")
             return
 
         self.inventory += quantity
-        logger.info(f"[VendingMachine] Restocked {quantity}. Total={self.inventory}")
+        self._touch()
+        _log.info(
+            "Restocked {quantity}. Total={inventory}",
+            quantity=quantity, inventory=self.inventory,
+        )
 
     # ---------------------------------------------------------
     # Serialization & Representation
@@ -1,23 +1,50 @@
-from fastapi import FastAPI
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
 from pydantic import BaseModel
-from src.llm_agent import run_agent
+from src.llm_agent import build_agent, build_http_client
+
+# Agent runs are blocking (LLM calls, tool execution): they run on this many
+# threads so the event loop keeps serving other requests meanwhile.
+AGENT_WORKERS = int(os.getenv("AGENT_WORKERS", "8"))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build the HTTP pool, LLM client and agent once; share them across requests."""
+    app.state.http_client = build_http_client(max_connections=AGENT_WORKERS)
+    app.state.agent = build_agent(http_client=app.state.http_client)
+    app.state.executor = ThreadPoolExecutor(max_workers=AGENT_WORKERS, thread_name_prefix="agent")
+    try:
+        yield
+    finally:
+        app.state.executor.shutdown(wait=True)
+        app.state.http_client.close()
+
 
 app = FastAPI(
     title="Software3-Lab AI Control Plane",
     description="LLM-powered Model Control Plane (MCP) for orchestrating ML workflows",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
 class AgentRequest(BaseModel):
     task: str
 
 @app.post("/agent/run")
-def run_mcp_agent(request: AgentRequest):
+async def run_mcp_agent(request: AgentRequest, http_request: Request):
     """
-    Executes the LLM-powered MCP agent.
+    Executes the LLM-powered MCP agent (the warm, shared one) on the agent
+    thread pool.
     """
-    result = run_agent(custom_task=request.task)
+    state = http_request.app.state
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(state.executor, state.agent.run, request.task)
     return {
         "status": "success",
         "agent_output": result
-    }
\ No newline at end of file
+    }
@@ -1,25 +1 @@
-import os
-from dotenv import load_dotenv
-from langchain_openai import ChatOpenAI
-from langchain.agents import initialize_agent, AgentType
-from tools.ml_tools import train_model_tool
-
-load_dotenv()
-
-def run_agent(custom_task: str = "Train the model and summarize results."):
-    llm = ChatOpenAI(
-        model="gpt-4",
-        temperature=0
-    )
-
-    tools = [train_model_tool]
-
-    agent = initialize_agent(
-        tools=tools,
-        llm=llm,
-        agent=AgentType.OPENAI_FUNCTIONS,
-        verbose=True
-    )
-
-    response = agent.run(custom_task)
-    return response
\ No newline at end of file
+from src.llm_agent import build_agent, build_http_client, get_agent, run_agent  # noqa: F401
@@ -0,0 +1,49 @@
+import threading
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")  # fastapi.testclient needs it
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from src.src import api  # noqa: E402
+
+
+class StubAgent:
+    """Stands in for the LangChain agent; records which thread ran each task."""
+
+    def __init__(self):
+        self.threads = set()
+
+    def run(self, task: str) -> str:
+        self.threads.add(threading.current_thread().name)
+        return f"done: {task}"
+
+
+def test_agent_is_built_once_at_startup_and_runs_on_the_agent_pool(monkeypatch):
+    built = []
+
+    def build_agent(http_client=None, verbose=False):
+        built.append(StubAgent())
+        return built[-1]
+
+    monkeypatch.setattr(api, "build_agent", build_agent)
+    with TestClient(api.app) as client:
+        for i in range(3):
+            response = client.post("/agent/run", json={"task": f"task {i}"})
+            assert response.json() == {"status": "success", "agent_output": f"done: task {i}"}
+
+    assert len(built) == 1
+    assert built[0].threads and all(name.startswith("agent") for name in built[0].threads)
+
+
+def test_run_agent_reuses_one_process_wide_agent(monkeypatch):
+    from src import llm_agent
+
+    built = []
+    monkeypatch.setattr(llm_agent, "_agent", None)
+    monkeypatch.setattr(llm_agent, "build_agent", lambda: built.append(StubAgent()) or built[-1])
+    assert llm_agent.run_agent("a") == "done: a"
+    assert llm_agent.run_agent("b") == "done: b"
+    assert len(built) == 1
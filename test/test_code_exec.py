@@ -0,0 +1,42 @@
+from math import comb
+
+import pytest
+
+from pipelines import code_exec
+
+TESTS = ["assert add(1, 2) == 3", "assert add(-1, 1) == 0"]
+
+
+@pytest.mark.parametrize("n,c,k", [(3, 0, 3), (3, 1, 3), (10, 3, 1), (10, 3, 5), (5, 5, 2)])
+def test_estimate_pass_at_k_is_unbiased_estimator(n, c, k):
+    expected = 1 - comb(n - c, k) / comb(n, k)
+    assert code_exec.estimate_pass_at_k(n, c, k) == pytest.approx(expected)
+
+
+def test_execute_samples_pass_fail_and_timeout():
+    completions = [
+        "```python\ndef add(a, b):\n    return a + b\n```",
+        "def add(a, b):\n    return a - b",
+        "def add(a, b):\n    while True:\n        pass",
+    ]
+
+    results = code_exec.execute_samples(completions, TESTS, timeout_s=1)
+
+    assert [r.passed for r in results] == [True, False, False]
+    assert [r.timed_out for r in results] == [False, False, True]
+
+
+def test_timeout_tolerates_child_exiting_before_the_kill(monkeypatch):
+    def already_gone(pgid, sig):
+        raise ProcessLookupError(pgid)
+
+    monkeypatch.setattr(code_exec.os, "killpg", already_gone)
+    spin = "def add(a, b):\n    while True:\n        pass"
+
+    # The CPU rlimit ends the child instead; the timeout is still reported.
+    assert code_exec.run_sample(spin, TESTS, timeout_s=0.2).timed_out
+
+
+def test_run_sample_enforces_memory_limit():
+    hog = "def add(a, b):\n    blob = bytearray(1 << 30)\n    return a + b"
+    assert not code_exec.run_sample(hog, TESTS, memory_mb=128).passed
@@ -0,0 +1,44 @@
+import json
+import threading
+
+from pipelines import collect_feedback
+
+
+def _lines(directory):
+    return [json.loads(l) for f in directory.glob("*.jsonl") for l in f.read_text().splitlines()]
+
+
+def test_feedback_writer_buffers_until_size_threshold(tmp_path, monkeypatch):
+    monkeypatch.setattr(collect_feedback, "DATA_DIR", tmp_path)
+
+    writer = collect_feedback.FeedbackWriter(max_buffer=3, flush_interval_s=0)
+    writer.write("p1", "r", 5)
+    writer.write("p2", "r", 4)
+    assert _lines(tmp_path) == []
+
+    writer.write("p3", "r", 3)
+    assert [r["prompt"] for r in _lines(tmp_path)] == ["p1", "p2", "p3"]
+
+    writer.write("p4", "r", 2, comments="late")
+    writer.close()
+    assert _lines(tmp_path)[-1]["comments"] == "late"
+    assert writer.records_written == 4
+
+
+def test_feedback_writer_is_thread_safe(tmp_path, monkeypatch):
+    monkeypatch.setattr(collect_feedback, "DATA_DIR", tmp_path)
+
+    with collect_feedback.FeedbackWriter(max_buffer=7, flush_interval_s=0.01) as writer:
+        threads = [
+            threading.Thread(
+                target=lambda t=t: [writer.write(f"{t}-{i}", "r", 5) for i in range(200)]
+            )
+            for t in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    prompts = [r["prompt"] for r in _lines(tmp_path)]
+    assert len(prompts) == len(set(prompts)) == 1600
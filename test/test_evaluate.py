@@ -0,0 +1,296 @@
+import asyncio
+import json
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from pipelines import code_exec, evaluate
+from pipelines.response_cache import ResponseCache
+
+
+class RateLimitError(Exception):
+    pass
+
+
+def test_import_defers_heavy_dependencies():
+    probe = (
+        "import sys\n"
+        "import pipelines.evaluate\n"
+        "print(*[m for m in ('nltk', 'openai', 'rouge_score') if m in sys.modules])\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, check=True
+    ).stdout.split()
+
+    assert out == []
+
+
+def test_predict_all_preserves_order_and_limit():
+    in_flight, peak = 0, 0
+
+    async def fake_call(model, prompt):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01 * (int(prompt) % 3))
+        in_flight -= 1
+        return f"{model}:{prompt}"
+
+    prompts = [str(i) for i in range(20)]
+    preds = asyncio.run(
+        evaluate._predict_all("m", prompts, call=fake_call, max_in_flight=4)
+    )
+
+    assert preds == [f"m:{p}" for p in prompts]
+    assert peak == 4
+
+
+def test_predict_all_runs_blocking_calls_concurrently():
+    # Every call blocks until all 16 are in flight at once; run one at a
+    # time (or a few) and the barrier times out instead.
+    barrier = threading.Barrier(16, timeout=10)
+    lock, in_flight, peak = threading.Lock(), 0, 0
+
+    def blocking_call(model, prompt):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        barrier.wait()
+        with lock:
+            in_flight -= 1
+        return prompt
+
+    preds = asyncio.run(
+        evaluate._predict_all("m", ["a"] * 16, call=blocking_call, max_in_flight=16)
+    )
+
+    assert preds == ["a"] * 16
+    assert peak == 16
+
+
+def test_predict_all_retries_rate_limits(monkeypatch):
+    monkeypatch.setattr(evaluate, "_backoff_delay", lambda attempt: 0)
+    attempts = {"n": 0}
+
+    def flaky_call(model, prompt):
+        attempts["n"] += 1
+        if attempts["n"] < 3:
+            raise RateLimitError("slow down")
+        return "ok"
+
+    preds = asyncio.run(evaluate._predict_all("m", ["p"], call=flaky_call))
+
+    assert preds == ["ok"]
+    assert attempts["n"] == 3
+
+
+def test_predict_all_does_not_retry_other_errors():
+    def broken_call(model, prompt):
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        asyncio.run(evaluate._predict_all("m", ["p"], call=broken_call))
+
+
+def test_response_cache_hits_and_lru_eviction(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite", max_bytes=10)
+    k1 = ResponseCache.key("m", [{"role": "user", "content": "a"}], {"temperature": 0.0})
+    k2 = ResponseCache.key("m", [{"role": "user", "content": "b"}], {"temperature": 0.0})
+    assert k1 != ResponseCache.key("m", [{"role": "user", "content": "a"}], {"temperature": 1.0})
+
+    assert cache.get(k1) is None
+    cache.put(k1, "12345")
+    cache.put(k2, "67890")
+    assert cache.get(k1) == "12345"   # k1 is now most recently used
+
+    cache.put(k2 + "x", "abcde")      # over budget → evicts k2
+    assert cache.get(k2) is None
+    assert cache.get(k1) == "12345"
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (2, 2, 1)
+    cache.close()
+
+
+def test_predict_all_serves_reruns_from_cache(tmp_path):
+    calls = []
+
+    def fake_call(model, prompt):
+        calls.append(prompt)
+        return prompt.upper()
+
+    cache = ResponseCache(tmp_path / "cache.sqlite")
+    for _ in range(2):
+        preds = asyncio.run(
+            evaluate._predict_all("m", ["a", "b"], call=fake_call, cache=cache)
+        )
+        assert preds == ["A", "B"]
+
+    assert sorted(calls) == ["a", "b"]
+    assert cache.stats()["hits"] == 2
+    cache.close()
+
+
+@pytest.fixture
+def eval_env(tmp_path, monkeypatch):
+    """Point evaluate.py at a throwaway registry/benchmark with 5 code items."""
+    registry = tmp_path / "registry.json"
+    registry.write_text(json.dumps([{"result_model": "ft:m"}]))
+    benchmark = tmp_path / "benchmark.jsonl"
+    with benchmark.open("w") as f:
+        for i in range(5):
+            f.write(json.dumps({"prompt": f"p{i}", "expected": "x", "type": "code"}) + "\n")
+
+    monkeypatch.setattr(evaluate, "REGISTRY_PATH", registry)
+    monkeypatch.setattr(evaluate, "BENCHMARK_PATH", benchmark)
+    monkeypatch.setattr(evaluate, "RESULTS_DIR", tmp_path)
+    monkeypatch.setattr(evaluate, "CHECKPOINT_DIR", tmp_path / "checkpoints")
+    return tmp_path
+
+
+def test_run_eval_streams_and_writes_partial_results(eval_env, monkeypatch):
+    monkeypatch.setattr(evaluate, "PARTIAL_RESULTS_EVERY", 2)
+    partials = []
+    real_write = evaluate._write_results
+    monkeypatch.setattr(
+        evaluate,
+        "_write_results",
+        lambda path, metrics: (partials.append(metrics), real_write(path, metrics)),
+    )
+
+    metrics = evaluate.run_eval(call_model=lambda m, p: "x", use_cache=False)
+
+    assert metrics["num_samples"] == 5
+    assert metrics["pass@3"] == 1.0
+    assert [m["num_samples"] for m in partials if m.get("partial")] == [2, 4]
+    assert json.loads((eval_env / "eval-ft_m.json").read_text()) == metrics
+
+
+def test_run_eval_resume_skips_checkpointed_items(eval_env):
+    calls = []
+
+    def dies_at_p3(model, prompt):
+        if prompt == "p3":
+            raise ConnectionError("pod evicted")
+        calls.append(prompt)
+        return "x" if prompt != "p1" else "wrong"
+
+    with pytest.raises(ConnectionError):
+        evaluate.run_eval(call_model=dies_at_p3, max_in_flight=1, use_cache=False)
+    assert calls[:3] == ["p0", "p1", "p2"]
+
+    # Simulate a torn write at the moment of the crash.
+    with (eval_env / "checkpoints" / "eval-ft_m.jsonl").open("a") as f:
+        f.write('{"id": "line-4", "ty')
+
+    calls.clear()
+    metrics = evaluate.run_eval(
+        call_model=lambda m, p: calls.append(p) or "x", use_cache=False, resume=True
+    )
+
+    assert calls == ["p3", "p4"]
+    assert metrics["resumed_items"] == 3
+    assert metrics["num_samples"] == 5
+    assert metrics["pass@3"] == 4 / 5
+
+
+def test_run_eval_samples_and_executes_code_items(eval_env):
+    with (eval_env / "benchmark.jsonl").open("w") as f:
+        f.write(json.dumps({
+            "prompt": "write add",
+            "expected": "",
+            "type": "code",
+            "tests": ["assert add(2, 2) == 4"],
+        }) + "\n")
+    draws = iter(["def add(a, b): return a + b", "def add(a, b): return 0", "oops("])
+
+    def sampler(model, prompt, temperature=None):
+        assert temperature == evaluate.PASS_K_TEMPERATURE
+        return next(draws)
+
+    metrics = evaluate.run_eval(call_model=sampler, max_in_flight=1, use_cache=False)
+
+    assert metrics["pass@3"] == 1.0
+    assert metrics["code_exec"]["samples"] == 3
+    assert metrics["code_exec"]["passed"] == 1
+    assert metrics["code_exec"]["tests_per_sec"] > 0
+
+
+def test_run_eval_executes_samples_of_different_items_side_by_side(eval_env, monkeypatch):
+    with (eval_env / "benchmark.jsonl").open("w") as f:
+        for i in range(2):
+            f.write(json.dumps({
+                "prompt": f"write add {i}", "expected": "", "type": "code", "tests": ["assert 1"],
+            }) + "\n")
+    # Both items' samples must be running at once to get past the barrier,
+    # which only happens if they share the run's sandbox pool.
+    barrier = threading.Barrier(2 * evaluate.PASS_K_SAMPLES, timeout=10)
+
+    def run_sample(code, tests, timeout_s, memory_mb):
+        barrier.wait()
+        return code_exec.SampleResult(passed=True, timed_out=False, duration_s=0.0)
+
+    monkeypatch.setattr(code_exec, "MAX_WORKERS", 2 * evaluate.PASS_K_SAMPLES)
+    monkeypatch.setattr(code_exec, "run_sample", run_sample)
+
+    metrics = evaluate.run_eval(
+        call_model=lambda m, p, temperature=None: "def add(a, b): return a + b",
+        use_cache=False,
+    )
+
+    assert metrics["num_samples"] == 2
+    assert metrics["code_exec"]["passed"] == 2 * evaluate.PASS_K_SAMPLES
+
+
+def test_run_eval_bounds_code_items_awaiting_the_sandbox(eval_env, monkeypatch):
+    with (eval_env / "benchmark.jsonl").open("w") as f:
+        for i in range(12):
+            f.write(json.dumps({
+                "prompt": f"write add {i}", "expected": "", "type": "code", "tests": ["assert 1"],
+            }) + "\n")
+    lock, outstanding, peak = threading.Lock(), 0, 0
+    real_submit = code_exec.submit_samples
+
+    def submit_samples(pool, completions, tests, *args):
+        nonlocal outstanding, peak
+        with lock:
+            outstanding += 1
+            peak = max(peak, outstanding)
+        futures = real_submit(pool, completions, tests, *args)
+        remaining = [len(futures)]
+
+        def finished(_):
+            nonlocal outstanding
+            with lock:
+                remaining[0] -= 1
+                if remaining[0] == 0:
+                    outstanding -= 1
+
+        for future in futures:
+            future.add_done_callback(finished)
+        return futures
+
+    def run_sample(code, tests, timeout_s, memory_mb):
+        time.sleep(0.01)  # the sandbox is the bottleneck; the model answers at once
+        return code_exec.SampleResult(passed=True, timed_out=False, duration_s=0.01)
+
+    monkeypatch.setattr(code_exec, "MAX_WORKERS", 2)
+    monkeypatch.setattr(code_exec, "submit_samples", submit_samples)
+    monkeypatch.setattr(code_exec, "run_sample", run_sample)
+
+    metrics = evaluate.run_eval(call_model=lambda m, p, temperature=None: "x", use_cache=False)
+
+    assert metrics["num_samples"] == 12
+    assert 1 < peak <= 2 * code_exec.MAX_WORKERS
+
+
+def test_backoff_delay_is_full_jitter(monkeypatch):
+    monkeypatch.setattr(evaluate.random, "uniform", lambda lo, hi: (lo, hi))
+
+    assert evaluate._backoff_delay(0) == (0, evaluate.BACKOFF_BASE_S)
+    assert evaluate._backoff_delay(3) == (0, evaluate.BACKOFF_BASE_S * 8)
+    assert evaluate._backoff_delay(30) == (0, evaluate.BACKOFF_MAX_S)
@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+from loguru import logger
+
+from src.core import explanations
+from src.core.explanations import ExplanationService
+from src.core.object_registry import ObjectRegistry
+from src.oop_labs.team import Team
+from src.oop_labs.vending_machine import VendingMachine
+
+
+class FakeBackend:
+    """Records every batch; answers "<kind>:<name>:<inventory or wins>" after `delay`."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.batches = []
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, kind, items):
+        self.batches.append((kind, [item["name"] for item in items]))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail:
+                raise ConnectionError("backend down")
+            return [f"{kind}:{item['name']}:{item.get('inventory', item.get('wins'))}" for item in items]
+        finally:
+            self.active -= 1
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    logger.disable("src")
+    ObjectRegistry.clear()
+    yield
+    ObjectRegistry.clear()
+    explanations._service = None
+    logger.enable("src")
+
+
+def test_concurrent_explains_are_batched_capped_and_memoized():
+    backend = FakeBackend(delay=0.01)
+    service = explanations.configure(backend=backend, batch_size=10, max_concurrency=2)
+    machines = [VendingMachine(f"vm{i}", initial_inventory=i) for i in range(45)]
+
+    async def run():
+        return await asyncio.gather(*(vm.explain() for vm in machines))
+
+    texts = asyncio.run(run())
+    assert texts == [f"explain:vm{i}:{i}" for i in range(45)]
+    assert [len(names) for _, names in backend.batches] == [10, 10, 10, 10, 5]
+    assert backend.peak == 2
+
+    # Unchanged objects come from the cache; a changed one goes back to the model.
+    machines[3].restock(1)
+    texts = asyncio.run(run())
+    assert texts[3] == "explain:vm3:4" and texts[4] == "explain:vm4:4"
+    assert backend.batches[-1] == ("explain", ["vm3"])
+    info = service.info()
+    assert (info["requests"], info["cache_hits"], info["items_sent"]) == (90, 44, 46)
+
+
+def test_identical_requests_in_flight_share_one_call_and_summaries_batch_separately():
+    backend = FakeBackend(delay=0.01)
+    explanations.configure(backend=backend, batch_size=8)
+    team = Team("lab", wins=3)
+    vm = VendingMachine("vm", initial_inventory=1)
+
+    async def run():
+        return await asyncio.gather(team.summarize(), team.summarize(), team.explain(), vm.explain())
+
+    assert asyncio.run(run()) == [
+        "team_summary:lab:3", "team_summary:lab:3", "explain:lab:3", "explain:vm:1",
+    ]
+    assert sorted(backend.batches) == [("explain", ["lab", "vm"]), ("team_summary", ["lab"])]
+
+
+def test_failures_fall_back_and_are_not_cached():
+    backend = FakeBackend(fail=True)
+    explanations.configure(backend=backend)
+    vm = VendingMachine("vm", initial_inventory=1)
+
+    assert asyncio.run(vm.explain()) == "LLM explanation unavailable."
+    backend.fail = False
+    assert asyncio.run(vm.explain()) == "explain:vm:1"
+    assert len(backend.batches) == 2
+
+
+def test_missing_llama_client_is_not_reimported(monkeypatch):
+    service = ExplanationService()
+    imports = []
+    real_import = explanations.importlib.import_module
+
+    def import_module(name):
+        imports.append(name)
+        return real_import(name)
+
+    monkeypatch.setattr(explanations.importlib, "import_module", import_module)
+    explanations._service = service
+    vms = [VendingMachine(f"vm{i}") for i in range(5)]
+
+    async def run():
+        return await asyncio.gather(*(vm.explain() for vm in vms))
+
+    assert asyncio.run(run()) == ["LLM explanation unavailable."] * 5
+    asyncio.run(run())
+    assert imports == ["src.ai.llama_client"]
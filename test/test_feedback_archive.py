@@ -0,0 +1,132 @@
+import json
+import os
+
+import pytest
+
+from pipelines import feedback_archive
+
+
+def _write_day(directory, day, n):
+    path = directory / f"{day}.jsonl"
+    with path.open("w") as f:
+        for i in range(n):
+            f.write(json.dumps({
+                "timestamp": f"{day}T00:00:{i:02d}Z",
+                "prompt": "p" * 200,
+                "response": "r" * 500,
+                "rating": i % 5 + 1,
+                "comments": "",
+            }) + "\n")
+    return path
+
+
+def test_archive_round_trips_and_reads_mixed_formats(tmp_path):
+    old = _write_day(tmp_path, "2025-01-01", 300)  # enough rows to amortize Parquet's footer
+    original = old.read_text()
+    _write_day(tmp_path, "2025-01-02", 5)
+
+    archived = feedback_archive.archive_day(old)
+
+    assert not old.exists()
+    assert archived.stat().st_size < len(original) / 5
+    assert [json.dumps(r) + "\n" for r in feedback_archive.iter_records(archived)] == \
+        original.splitlines(keepends=True)
+
+    ratings = feedback_archive.scan_column("rating", tmp_path)
+    assert ratings == [i % 5 + 1 for i in range(300)] + [1, 2, 3, 4, 5]
+    assert len(list(feedback_archive.iter_feedback(tmp_path))) == 305
+
+
+def test_fcol_column_scan_skips_other_blocks(tmp_path, monkeypatch):
+    archived = feedback_archive.archive_day(_write_day(tmp_path, "2025-01-01", 10))
+    if archived.suffix != ".fcol":
+        pytest.skip("pyarrow installed; day archived as Parquet")
+
+    decoded = []
+    real = feedback_archive._decompress
+    monkeypatch.setattr(
+        feedback_archive, "_decompress", lambda c, d: decoded.append(d) or real(c, d)
+    )
+    feedback_archive.read_columns(archived, ["rating"])
+    assert len(decoded) == 1
+
+
+def test_archive_closed_days_leaves_today_alone(tmp_path):
+    written_at = 1735779600  # 2025-01-02T01:00:00Z
+    for day in ("2025-01-01", "2025-01-02"):
+        os.utime(_write_day(tmp_path, day, 3), (written_at, written_at))
+
+    archived = feedback_archive.archive_closed_days(
+        tmp_path, now=written_at + feedback_archive.ARCHIVE_GRACE_S
+    )
+
+    assert [p.stem for p in archived] == ["2025-01-01"]
+    assert (tmp_path / "2025-01-02.jsonl").exists()
+
+
+def test_rearchiving_a_day_merges_instead_of_overwriting(tmp_path):
+    day = "2025-01-01"
+    first = feedback_archive.archive_day(_write_day(tmp_path, day, 4))
+    late = tmp_path / f"{day}.jsonl"
+    late.write_text(json.dumps({"timestamp": f"{day}T23:59:59Z", "rating": 5}) + "\n")
+
+    assert feedback_archive.day_files(tmp_path) == [first, late]
+    archived = feedback_archive.archive_day(late)
+
+    records = list(feedback_archive.iter_records(archived))
+    assert [r["rating"] for r in records] == [1, 2, 3, 4, 5]
+    assert list(feedback_archive.iter_records(archived, start=4)) == [
+        {"timestamp": f"{day}T23:59:59Z", "rating": 5}
+    ]
+    assert feedback_archive.day_files(tmp_path) == [archived]
+
+
+def test_leftover_jsonl_already_archived_is_not_read_twice(tmp_path):
+    day_file = _write_day(tmp_path, "2025-01-01", 3)
+    original = day_file.read_bytes()
+    archived = feedback_archive.archive_day(day_file)
+    day_file.write_bytes(original)  # as if archiving crashed before the unlink
+
+    assert feedback_archive.day_files(tmp_path) == [archived]
+    assert feedback_archive.archive_day(day_file) == archived
+    assert not day_file.exists()
+    assert feedback_archive.archive_rows(archived) == 3
+
+
+def test_absent_keys_are_not_filled_with_none(tmp_path):
+    path = tmp_path / "2025-01-01.jsonl"
+    rows = [{"prompt": "a", "rating": 1}, {"prompt": "b", "comments": None}]
+    path.write_text("".join(json.dumps(r) + "\n" for r in rows))
+
+    archived = feedback_archive.archive_day(path)
+
+    assert list(feedback_archive.iter_records(archived)) == rows
+
+
+def test_parquet_archive_without_pyarrow_raises_clearly(tmp_path, monkeypatch):
+    monkeypatch.setattr(feedback_archive, "_pyarrow", lambda: None)
+    archived = tmp_path / "2025-01-01.parquet"
+    archived.write_bytes(b"PAR1")
+
+    with pytest.raises(RuntimeError, match="install `pyarrow`"):
+        feedback_archive.archive_rows(archived)
+    with pytest.raises(RuntimeError, match="install `pyarrow`"):
+        feedback_archive.read_columns(archived, ["rating"])
+
+
+def test_parquet_archive_keeps_late_keys_and_mixed_types(tmp_path):
+    pytest.importorskip("pyarrow")
+    uniform = tmp_path / "2025-01-01.jsonl"
+    rows = [{"prompt": "a", "rating": 1}, {"prompt": "b", "rating": 2, "comments": "late key"}]
+    uniform.write_text("".join(json.dumps(r) + "\n" for r in rows))
+    mixed = tmp_path / "2025-01-02.jsonl"
+    mixed_rows = [{"prompt": "c", "rating": 3}, {"prompt": "d", "rating": "5"}]
+    mixed.write_text("".join(json.dumps(r) + "\n" for r in mixed_rows))
+
+    archived = feedback_archive.archive_day(uniform)
+    fallback = feedback_archive.archive_day(mixed)
+
+    assert archived.suffix == ".parquet"
+    assert list(feedback_archive.iter_records(archived)) == rows
+    assert fallback.suffix == ".fcol"  # int and str ratings cannot share a Parquet column
+    assert list(feedback_archive.iter_records(fallback)) == mixed_rows
@@ -0,0 +1,99 @@
+import hashlib
+import json
+
+import pytest
+
+from pipelines import fine_tune
+
+
+@pytest.fixture
+def dirs(tmp_path, monkeypatch):
+    feedback = tmp_path / "feedback"
+    feedback.mkdir()
+    monkeypatch.setattr(fine_tune, "FEEDBACK_DIR", feedback)
+    monkeypatch.setattr(fine_tune, "DATASET_PATH", tmp_path / "dataset.jsonl")
+    monkeypatch.setattr(fine_tune, "MANIFEST_PATH", tmp_path / "manifest.sqlite")
+    return feedback
+
+
+def _append(path, *records, raw=""):
+    with path.open("a") as f:
+        for r in records:
+            f.write(json.dumps(r) + "\n")
+        f.write(raw)
+
+
+def _rec(prompt, ts="2025-01-01T00:00:00Z"):
+    return {"timestamp": ts, "prompt": prompt, "response": "r", "rating": 5, "comments": ""}
+
+
+def test_merge_reads_only_new_bytes_and_dedups(dirs):
+    day = dirs / "2025-01-01.jsonl"
+    _append(day, _rec("a"), _rec("b"), raw='{"prompt": "half')
+
+    path, stats = fine_tune._merge_feedback()
+    assert (stats["records_added"], stats["total_records"]) == (2, 2)
+
+    # Re-submitted "a" (new timestamp) is a duplicate; the torn line is skipped.
+    day.write_text(day.read_text().rsplit("\n", 1)[0] + "\n")
+    _append(day, _rec("a", ts="2025-01-01T09:00:00Z"), _rec("c"))
+    bytes_before = day.stat().st_size
+
+    _, stats = fine_tune._merge_feedback()
+    assert stats["records_added"] == 1
+    assert stats["duplicates"] == 1
+    assert stats["bytes_read"] < bytes_before
+    assert [json.loads(l)["prompt"] for l in path.read_text().splitlines()] == ["a", "b", "c"]
+
+    _, stats = fine_tune._merge_feedback()
+    assert (stats["files_changed"], stats["bytes_read"], stats["total_records"]) == (0, 0, 3)
+
+
+def test_merge_rereads_rewritten_files(dirs):
+    day = dirs / "2025-01-02.jsonl"
+    _append(day, _rec("x"), _rec("y"))
+    fine_tune._merge_feedback()
+
+    day.write_text(json.dumps(_rec("z")) + "\n")
+    _, stats = fine_tune._merge_feedback()
+
+    assert stats["files_reset"] == 1
+    assert stats["records_added"] == 1
+
+
+def test_merge_reads_archived_days_once(dirs):
+    from pipelines import feedback_archive
+
+    day = dirs / "2025-01-03.jsonl"
+    _append(day, _rec("m"), _rec("n"))
+    fine_tune._merge_feedback()
+
+    feedback_archive.archive_day(day)
+    _, stats = fine_tune._merge_feedback()
+    assert (stats["records_read"], stats["records_added"]) == (2, 0)
+
+    _, stats = fine_tune._merge_feedback()
+    assert (stats["files_changed"], stats["records_read"]) == (0, 0)
+
+
+def test_registry_pins_the_dataset_each_job_trained_on(dirs, tmp_path, monkeypatch):
+    registry = tmp_path / "registry.json"
+    monkeypatch.setattr(fine_tune, "REGISTRY_PATH", registry)
+    monkeypatch.setattr(
+        fine_tune, "_openai_fine_tune", lambda path: {"id": "ft-job", "status": "pending"}
+    )
+    day = dirs / "2025-01-01.jsonl"
+
+    _append(day, _rec("a"), _rec("b"))
+    fine_tune.run_fine_tune()
+    first = fine_tune.DATASET_PATH.read_bytes()
+    _append(day, _rec("c"))
+    fine_tune.run_fine_tune()
+
+    second = fine_tune.DATASET_PATH.read_bytes()
+    entries = json.loads(registry.read_text())
+    assert [e["dataset_bytes"] for e in entries] == [len(first), len(second)]
+    assert [e["dataset_sha256"] for e in entries] == [
+        hashlib.sha256(first).hexdigest(),
+        hashlib.sha256(second).hexdigest(),
+    ]
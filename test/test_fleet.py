@@ -0,0 +1,109 @@
+import random
+
+import numpy as np
+import pytest
+from loguru import logger
+
+from src.core.object_registry import ObjectRegistry
+from src.oop_labs import Airplane, JetPlane, MotorVehicle, Motorcycle, TransportMode
+from src.oop_labs.fleet import Fleet
+
+
+@pytest.fixture(autouse=True)
+def quiet():
+    logger.disable("src")
+    yield
+    logger.enable("src")
+    ObjectRegistry.clear()
+
+
+def _mixed_fleet(n: int, rng: random.Random):
+    vehicles = []
+    for i in range(n):
+        kind = i % 6
+        if kind == 0:
+            v = TransportMode(f"boat{i}", max_speed=40)
+        elif kind == 1:
+            v = TransportMode(f"ferry{i}", max_speed=30)
+            v.configure_fuel_system(mpg=rng.uniform(2, 8), fuel_capacity=200)
+        elif kind == 2:
+            v = MotorVehicle(f"ev{i}", max_speed=120, horsepower=300)
+            v.configure_ev_system(battery_kwh=75, efficiency_mi_per_kwh=rng.uniform(3, 4.5))
+            v.configure_fuel_system(mpg=30, fuel_capacity=10)  # hybrid: EV wins
+        elif kind == 3:
+            v = Motorcycle(f"bike{i}", 110, horsepower=53, weight_lbs=514)
+            v.configure_fuel_system(mpg=rng.uniform(40, 60), fuel_capacity=rng.uniform(3, 5))
+        elif kind == 4:
+            v = Airplane(f"cessna{i}", max_speed=188, wingspan=36)
+            v.configure_fuel_system(mpg=rng.uniform(10, 15), fuel_capacity=56)
+        else:
+            v = JetPlane(f"jet{i}", 1500, wingspan=44, max_altitude=65_000)
+            v.configure_fuel_system(mpg=rng.uniform(0.5, 1), fuel_capacity=3000)
+            v.takeoff()
+            if i % 4 == 1:
+                v.enable_afterburner()
+        vehicles.append(v)
+    return vehicles
+
+
+def test_vectorized_ops_match_per_object_semantics():
+    rng = random.Random(7)
+    objects = _mixed_fleet(120, rng)
+    mirror = _mixed_fleet(120, random.Random(7))
+    fleet = Fleet.from_vehicles(mirror)
+    fueled = [i for i, v in enumerate(objects) if v.current_fuel is not None]
+    evs = [i for i, v in enumerate(objects) if getattr(v, "current_charge_kwh", None) is not None]
+
+    for step in range(20):
+        amounts = [rng.uniform(-1, 40) for _ in fueled]
+        kwh = [rng.uniform(-1, 30) for _ in evs]
+        distances = [rng.uniform(-10, 150) for _ in objects]
+        for i, g in zip(fueled, amounts):
+            objects[i].add_fuel(g)
+        for i, k in zip(evs, kwh):
+            objects[i].charge(k)
+        expected = [v.travel(d) for v, d in zip(objects, distances)]
+
+        fleet.add_fuel(amounts, select=fueled)
+        fleet.charge(kwh, select=evs)
+        ok = fleet.travel(distances)
+        assert ok.tolist() == expected
+
+    fleet.write_back()
+    for obj, twin in zip(objects, mirror):
+        assert {**obj.to_dict(), "id": None, "name": None} == {**twin.to_dict(), "id": None, "name": None}
+    assert 0 < sum(expected) < len(expected)  # both outcomes exercised
+
+
+def test_ranges_and_unconfigured_systems():
+    fleet = Fleet(3, mpg=[25.0, np.nan, 40.0], current_fuel=[2.0, np.nan, 1.0], fuel_capacity=10.0)
+    np.testing.assert_array_equal(fleet.estimate_range(), [50.0, np.nan, 40.0])
+    assert np.isnan(fleet.remaining_range_ev()).all()
+
+    with pytest.raises(RuntimeError):
+        fleet.add_fuel(1.0)
+    with pytest.raises(RuntimeError):
+        fleet.charge(1.0, select=[0])
+    fleet.add_fuel(1.0, select=np.array([True, False, True]))
+    np.testing.assert_array_equal(fleet.current_fuel, [3.0, np.nan, 2.0])
+    assert fleet.travel(60.0).tolist() == [True, True, True]
+    assert fleet.travel(20.0, select=[0, 2]).tolist() == [False, True]  # exactly enough
+
+
+def test_write_back_only_updates_changed_vehicles_and_keeps_types():
+    plane = Airplane("cessna", max_speed=188, wingspan=36)
+    bike = Motorcycle("bike", 110, horsepower=53, weight_lbs=514)
+    bike.configure_fuel_system(mpg=50, fuel_capacity=4)
+    boat = TransportMode("boat", max_speed=40)
+    fleet = Fleet.from_vehicles([plane, bike, boat])
+    versions = [v.version for v in (plane, bike, boat)]
+
+    fleet.add_fuel(4.0, select=[1])
+    fleet.travel(50.0, select=[1, 2])
+    fleet.current_altitude[0] = 2000.0
+    assert fleet.write_back() == 2
+
+    assert plane.current_altitude == 2000 and type(plane.current_altitude) is int
+    assert bike.current_fuel == 3.0
+    assert [v.version for v in (plane, bike, boat)] == [versions[0] + 1, versions[1] + 1, versions[2]]
+    assert fleet.write_back() == 0
@@ -0,0 +1,49 @@
+import random
+
+from nltk.translate.bleu_score import corpus_bleu, sentence_bleu
+from rouge_score import rouge_scorer
+
+from pipelines import metrics
+
+VOCAB = "the cat sat on a mat dog runs fast over fence and".split()
+
+
+def _random_pairs(n, seed=0):
+    rng = random.Random(seed)
+    return [
+        (
+            " ".join(rng.choices(VOCAB, k=rng.randint(0, 15))),
+            " ".join(rng.choices(VOCAB, k=rng.randint(0, 15))),
+        )
+        for _ in range(n)
+    ]
+
+
+def test_rouge_l_matches_rouge_score():
+    scorer = rouge_scorer.RougeScorer(["rougeL"], use_stemmer=True)
+    for ref, hyp in _random_pairs(200):
+        expected = scorer.score(ref, hyp)["rougeL"].fmeasure
+        assert abs(metrics.rouge_l(ref, hyp) - expected) < 1e-12
+
+
+def test_bleu_matches_nltk_sentence_and_corpus():
+    pairs = [(tuple(r.split()), tuple(h.split())) for r, h in _random_pairs(200, seed=1)]
+    total = metrics.BleuStats()
+    for ref, hyp in pairs:
+        stats = metrics.bleu_stats_tokens(ref, hyp)
+        assert abs(stats.score() - sentence_bleu([list(ref)], list(hyp))) < 1e-12
+        total += stats
+
+    expected = corpus_bleu([[list(r)] for r, _ in pairs], [list(h) for _, h in pairs])
+    assert abs(total.score() - expected) < 1e-12
+
+
+def test_score_corpus_process_pool_matches_serial(monkeypatch):
+    monkeypatch.setattr(metrics, "bleu_tokens", lambda text: tuple(text.lower().split()))
+    refs, hyps = zip(*_random_pairs(300, seed=2))
+
+    serial = metrics.score_corpus(refs, hyps)
+    parallel = metrics.score_corpus(refs, hyps, workers=2, chunk_size=64)
+
+    assert parallel.rouge_l == serial.rouge_l
+    assert parallel.corpus_bleu4 == serial.corpus_bleu4
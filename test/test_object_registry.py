@@ -0,0 +1,307 @@
+import gc
+import threading
+
+import pytest
+from loguru import logger
+
+from src.core.base_model import BaseModel
+from src.core import object_registry
+from src.core.object_registry import ObjectRegistry
+from src.oop_labs import Airplane, JetPlane, MotorVehicle
+
+
+class Widget(BaseModel):
+    """Minimal BaseModel (auto-registered on construction), for bulk tests."""
+
+    def __init__(self, name: str, level: float = 0.0):
+        super().__init__(name=name)
+        self.level = level
+
+    def to_dict(self):
+        return {**super().to_dict(), "level": self.level}
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    ObjectRegistry.clear()
+    yield
+    for attr in list(ObjectRegistry.indexes()):
+        ObjectRegistry.drop_index(attr)
+    ObjectRegistry.clear()
+    ObjectRegistry.configure(
+        shards=ObjectRegistry.DEFAULT_SHARDS, stats=False, mode="strong", ttl_s=None, max_size=None
+    )
+
+
+def test_query_by_type_includes_subclasses_and_name():
+    jet = JetPlane("F-16", max_speed=1500, wingspan=32, max_altitude=50_000)
+    prop = Airplane("Cessna", max_speed=140)
+    car = MotorVehicle("Civic", max_speed=120)
+
+    assert set(ObjectRegistry.query(Airplane)) == {jet, prop}
+    assert ObjectRegistry.query(JetPlane) == [jet]
+    assert ObjectRegistry.query(name="Civic") == [car]
+    assert ObjectRegistry.query(Airplane, name="Civic") == []
+    assert len(ObjectRegistry.all()) == 3
+
+
+def test_attribute_index_tracks_state_changes():
+    ObjectRegistry.create_index("in_air")
+    jets = [JetPlane(f"jet-{i}", 1500, wingspan=32, max_altitude=50_000) for i in range(3)]
+
+    jets[1].takeoff()
+    assert ObjectRegistry.query(JetPlane, in_air=True) == [jets[1]]
+
+    jets[1].land()
+    jets[2].takeoff()
+    assert ObjectRegistry.query(JetPlane, in_air=True) == [jets[2]]
+
+    jets[2].name = "renamed"
+    assert ObjectRegistry.query(name="renamed") == [jets[2]]
+    assert ObjectRegistry.query(name="jet-2") == []
+
+
+def test_ordered_index_range_and_operators():
+    ObjectRegistry.create_index("level", ordered=True)
+    widgets = [Widget(f"w{i}", level=float(i)) for i in range(10)]
+    widgets[9].level = None  # non-numeric values never match ranges
+
+    assert {w.level for w in ObjectRegistry.query(level__lt=3)} == {0, 1, 2}
+    assert {w.level for w in ObjectRegistry.query(level__ge=7)} == {7, 8}
+    assert {w.level for w in ObjectRegistry.query(level__in=[1, 5, 42])} == {1, 5}
+    assert len(ObjectRegistry.query(level__ne=0)) == 9
+    assert ObjectRegistry.query(level__gt=2, where=lambda w: w.name == "w4") == [widgets[4]]
+    assert len(ObjectRegistry.query(Widget, limit=3)) == 3
+
+    with pytest.raises(ValueError):
+        ObjectRegistry.query(level__between=(1, 2))
+
+
+def test_remove_and_reindex_keep_indexes_consistent():
+    widgets = [Widget("w", level=i) for i in range(3)]
+    ObjectRegistry.create_index("level", ordered=True)  # built over existing objects
+
+    assert ObjectRegistry.remove(widgets[0].id)
+    assert set(ObjectRegistry.query(Widget)) == set(widgets[1:])
+    assert ObjectRegistry.query(level__le=0) == []
+
+    ObjectRegistry.remove(widgets[1].id)
+    widgets[1].level = 0  # unregistered objects are no longer tracked
+    assert ObjectRegistry.query(level__le=1) == []
+
+
+def test_indexed_lookup_only_visits_index_candidates(monkeypatch):
+    logger.disable("src.core.object_registry")
+    ObjectRegistry.create_index("level", ordered=True)
+    for i in range(20_000):
+        obj = object.__new__(Widget)
+        object.__setattr__(obj, "id", str(i))
+        object.__setattr__(obj, "name", f"w{i}")
+        object.__setattr__(obj, "level", i)
+        ObjectRegistry.add(obj)
+    logger.enable("src.core.object_registry")
+
+    # Every candidate a plan yields goes through _matches (remaining
+    # conditions) or `where`; a full shard scan would visit 20,000.
+    checked, visited = [], []
+    real = object_registry._matches
+    monkeypatch.setattr(
+        object_registry, "_matches", lambda v, op, x: checked.append(v) or real(v, op, x)
+    )
+    visit = lambda obj: visited.append(obj) or True  # noqa: E731
+
+    hits = ObjectRegistry.query(Widget, name="w12345", level__lt=10, where=visit)
+    exact = ObjectRegistry.query(level=19_999, where=visit)
+    low = ObjectRegistry.query(level__lt=10, where=visit)
+
+    assert hits == [] and len(exact) == 1 and len(low) == 10
+    assert len(checked) <= 1 + 10 and len(visited) == 1 + 10
+
+
+def test_all_is_a_read_only_live_view():
+    view = ObjectRegistry.all()
+    widget = Widget("w")
+
+    assert view[widget.id] is widget
+    with pytest.raises(TypeError):
+        view["x"] = widget
+
+    detached = dict(ObjectRegistry.all())
+    later = Widget("later")
+    assert later.id in view and later.id not in detached
+
+
+def test_snapshot_tolerates_mutation_during_iteration():
+    widgets = [Widget(f"w{i}") for i in range(6)]
+    snap = ObjectRegistry.snapshot()
+
+    seen = []
+    for obj in snap:
+        seen.append(obj)
+        if obj is widgets[0]:
+            ObjectRegistry.remove(widgets[3].id)
+            Widget("late")
+
+    assert seen == [w for w in widgets if w is not widgets[3]]
+    assert snap.stale
+    assert not ObjectRegistry.snapshot().stale
+
+
+def test_page_cursors_survive_removal_and_compaction(monkeypatch):
+    monkeypatch.setattr(ObjectRegistry, "COMPACT_MIN_TOMBSTONES", 0)
+    ObjectRegistry.configure(shards=1)
+    widgets = [Widget(f"w{i}") for i in range(10)]
+
+    first = ObjectRegistry.page(limit=4)
+    assert first.items == widgets[:4]
+
+    for w in widgets[3:9]:
+        ObjectRegistry.remove(w.id)  # crosses the compaction threshold
+    assert len(ObjectRegistry._shards[0].log) < 10
+
+    second = ObjectRegistry.page(first.next_cursor, limit=4)
+    assert second.items == widgets[9:]
+    assert second.next_cursor is None
+
+
+def test_concurrent_writers_keep_shards_and_indexes_consistent():
+    logger.disable("src.core")
+    ObjectRegistry.create_index("level", ordered=True)
+    kept, errors = [], []
+
+    def worker(tid):
+        try:
+            mine = [Widget(f"t{tid}", level=i) for i in range(300)]
+            for w in mine[::2]:
+                ObjectRegistry.remove(w.id)
+            for w in mine[1::2]:
+                w.level += 1000
+            kept.extend(mine[1::2])
+            list(ObjectRegistry.snapshot())
+            ObjectRegistry.query(Widget, level__ge=1000)
+        except Exception as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker, args=(t,)) for t in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    logger.enable("src.core")
+
+    assert errors == []
+    assert ObjectRegistry.count() == len(kept) == 8 * 150
+    assert set(ObjectRegistry.query(level__ge=1000)) == set(kept)
+    assert set(ObjectRegistry.all()) == {w.id for w in kept}
+
+
+def test_shard_stats_are_opt_in():
+    widget = Widget("w")
+    assert sum(s["adds"] for s in ObjectRegistry.shard_stats()) == 0
+
+    ObjectRegistry.configure(stats=True)
+    ObjectRegistry.get(widget.id)
+    ObjectRegistry.get("missing")
+    Widget("v")
+    stats = ObjectRegistry.shard_stats()
+
+    assert len(stats) == ObjectRegistry.DEFAULT_SHARDS
+    assert sum(s["size"] for s in stats) == 2
+    assert sum(s["adds"] for s in stats) == 1
+    assert (sum(s["hits"] for s in stats), sum(s["misses"] for s in stats)) == (1, 1)
+
+    with pytest.raises(ValueError):
+        ObjectRegistry.configure(shards=3)
+    with pytest.raises(RuntimeError):
+        ObjectRegistry.configure(shards=4)
+
+
+def test_weak_mode_prunes_collected_objects():
+    ObjectRegistry.configure(mode="weak")
+    ObjectRegistry.create_index("level", ordered=True)
+    keep = Widget("keep", level=1)
+    Widget("drop", level=2)  # no strong reference left
+    gc.collect()
+
+    assert ObjectRegistry.count() == 1
+    assert list(ObjectRegistry.snapshot()) == [keep]
+    assert ObjectRegistry.query(level__ge=0) == [keep]
+    assert ObjectRegistry.memory_stats()["collected"] == 1
+
+    keep.level = 5
+    assert ObjectRegistry.query(level=5) == [keep]
+    with pytest.raises(RuntimeError):
+        ObjectRegistry.configure(mode="strong")
+
+
+def test_ttl_and_max_size_evict_oldest_first(monkeypatch):
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(object_registry.time, "monotonic", lambda: clock["now"])
+    ObjectRegistry.configure(shards=1, max_size=3)
+
+    widgets = [Widget(f"w{i}") for i in range(5)]
+    assert list(ObjectRegistry.snapshot()) == widgets[2:]
+
+    ObjectRegistry.configure(ttl_s=10)
+    clock["now"] += 5
+    fresh = Widget("fresh")
+    clock["now"] += 6
+    assert ObjectRegistry.evict_expired() == 2
+    assert list(ObjectRegistry.snapshot()) == [fresh]
+
+    stats = ObjectRegistry.memory_stats()
+    assert (stats["live"], stats["evicted"], stats["mode"]) == (1, 5, "strong")
+
+
+def test_objects_register_exactly_once_after_construction(monkeypatch):
+    calls = []
+    monkeypatch.setattr(BaseModel, "_on_created", lambda obj: calls.append(obj) or ObjectRegistry.add(obj))
+
+    jet = JetPlane("F-22", 1500, wingspan=44, max_altitude=65_000)
+    assert calls == [jet]
+    assert ObjectRegistry.get(jet.id) is jet
+
+    class Broken(Widget):
+        def __init__(self):
+            super().__init__("broken")
+            raise RuntimeError("half-built")
+
+    with pytest.raises(RuntimeError):
+        Broken()
+    assert ObjectRegistry.query(name="broken") == []
+
+
+def test_change_feed_returns_only_what_changed_since_the_cursor():
+    widgets = [Widget(f"w{i}") for i in range(50)]
+    first = ObjectRegistry.changes()
+    assert first.changed == widgets and first.removed == [] and not first.resync
+    assert ObjectRegistry.changes(first.cursor).changed == []
+
+    widgets[7]._touch()
+    widgets[3]._touch()
+    widgets[7]._touch()
+    ObjectRegistry.remove(widgets[9].id)
+    fresh = Widget("fresh")
+    feed = ObjectRegistry.changes(first.cursor)
+    assert sorted(o.name for o in feed.changed) == ["fresh", "w3", "w7"]
+    assert feed.removed == [widgets[9].id]
+    assert ObjectRegistry.changes(feed.cursor).changed == []
+
+    jet = JetPlane("F-22", 1500, wingspan=44, max_altitude=65_000)
+    cursor = ObjectRegistry.changes(feed.cursor).cursor
+    jet.takeoff()
+    assert ObjectRegistry.changes(cursor).changed == [jet]
+
+    ObjectRegistry.clear()
+    assert ObjectRegistry.changes(cursor).resync
+
+
+def test_change_feed_trims_old_removals(monkeypatch):
+    monkeypatch.setattr(ObjectRegistry, "CHANGE_FEED_MAX_REMOVED", 4)
+    ObjectRegistry.configure(shards=1)
+    cursor = ObjectRegistry.changes().cursor
+    for i in range(6):
+        ObjectRegistry.remove(Widget(f"w{i}").id)
+    feed = ObjectRegistry.changes(cursor)
+    assert feed.resync and len(feed.removed) == 4  # the two oldest were trimmed
+    assert not ObjectRegistry.changes(feed.cursor).resync
@@ -0,0 +1,77 @@
+import weakref
+
+import pytest
+
+from src.core.base_model import BaseModel
+from src.core.object_registry import ObjectRegistry
+from src.oop_labs import Airplane, JetPlane, MotorVehicle, Motorcycle, TransportMode
+from src.oop_labs.pet import Pet
+from src.oop_labs.team import Team
+from src.oop_labs.vending_machine import VendingMachine
+
+MODELS = [
+    lambda: TransportMode("boat", max_speed=40),
+    lambda: MotorVehicle("car", max_speed=120, horsepower=150),
+    lambda: Motorcycle("bike", 110, horsepower=53, weight_lbs=514),
+    lambda: Airplane("cessna", max_speed=188, wingspan=36),
+    lambda: JetPlane("F-22", 1500, wingspan=44, max_altitude=65_000),
+    lambda: Pet("rex", age=3),
+    lambda: Team("lab"),
+    lambda: VendingMachine("vm", initial_inventory=5),
+]
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    ObjectRegistry.clear()
+    yield
+    ObjectRegistry.clear()
+    BaseModel.set_id_format("uuid")
+
+
+@pytest.mark.parametrize("make", MODELS)
+def test_models_are_slotted_and_keep_their_attributes(make):
+    obj = make()
+    assert not hasattr(obj, "__dict__")
+    data = obj.to_dict()
+    assert data["id"] == obj.id and data["name"] == obj.name
+    assert weakref.ref(obj)() is obj
+    with pytest.raises(AttributeError):
+        obj.not_an_attribute = 1
+
+
+def test_slotted_state_changes_still_reach_the_registry():
+    ObjectRegistry.create_index("in_air")
+    try:
+        jet = JetPlane("F-35", 1200, wingspan=35, max_altitude=50_000)
+        jet.takeoff()
+        assert ObjectRegistry.query(JetPlane, in_air=True) == [jet]
+    finally:
+        ObjectRegistry.drop_index("in_air")
+
+
+def test_short_id_format():
+    BaseModel.set_id_format("short")
+    pets = [Pet(f"p{i}", age=i) for i in range(100)]
+    assert all(len(p.id) == 22 for p in pets)
+    assert len({p.id for p in pets}) == 100
+    assert ObjectRegistry.get(pets[0].id) is pets[0]
+    with pytest.raises(ValueError):
+        BaseModel.set_id_format("int")
+
+
+def test_state_changing_methods_bump_the_version():
+    vm = VendingMachine("vm", initial_inventory=5)
+    team = Team("lab")
+    jet = JetPlane("F-22", 1500, wingspan=44, max_altitude=65_000)
+    assert (vm.version, team.version, jet.version) == (0, 0, 0)
+
+    assert not vm.purchase(10)  # rejected: no change
+    assert vm.version == 0
+    vm.purchase(2)
+    vm.restock(1)
+    team.record_win()
+    team.name = "lab 2"
+    jet.takeoff()
+    jet.climb(5_000)
+    assert (vm.version, team.version, jet.version) == (2, 2, 2)
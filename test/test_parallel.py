@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+from loguru import logger
+
+from src.core.object_registry import ObjectRegistry
+from src.oop_labs import MotorVehicle, TransportMode
+from src.oop_labs.fleet import Fleet
+from src.oop_labs.parallel import ShardStats, run_sharded
+
+
+@pytest.fixture(autouse=True)
+def quiet():
+    logger.disable("src")
+    yield
+    logger.enable("src")
+    ObjectRegistry.clear()
+
+
+def _fleet(n: int) -> Fleet:
+    rng = np.random.default_rng(3)
+    ev = np.arange(n) % 3 == 0
+    return Fleet(
+        n,
+        max_speed=rng.uniform(40, 90, n),
+        mpg=np.where(ev, np.nan, rng.uniform(15, 45, n)),
+        fuel_capacity=15.0,
+        current_fuel=np.where(ev, np.nan, rng.uniform(0, 15, n)),
+        battery_kwh=np.where(ev, 75.0, np.nan),
+        current_charge_kwh=np.where(ev, rng.uniform(0, 75, n), np.nan),
+        efficiency_mi_per_kwh=np.where(ev, 3.5, np.nan),
+    )
+
+
+def test_sharded_run_matches_single_process():
+    single, sharded = _fleet(1000), _fleet(1000)
+    expected = run_sharded(single, hours=6, step_h=0.5, workers=1)
+    stats = run_sharded(sharded, hours=6, step_h=0.5, workers=2, shards=3)
+
+    assert stats.vehicles == 1000 and stats.steps == expected.steps == 12
+    assert stats.failures == expected.failures > 0
+    assert stats.distance_mi == pytest.approx(expected.distance_mi)
+    assert stats.fuel_used_gal == pytest.approx(expected.fuel_used_gal)
+    assert stats.charge_used_kwh == pytest.approx(expected.charge_used_kwh)
+    np.testing.assert_array_equal(sharded.current_fuel, single.current_fuel)
+    np.testing.assert_array_equal(sharded.current_charge_kwh, single.current_charge_kwh)
+
+
+def test_objects_are_updated_after_a_sharded_run():
+    car = MotorVehicle("car", max_speed=60, horsepower=150)
+    car.configure_fuel_system(mpg=30, fuel_capacity=10)
+    car.add_fuel(5)
+    boat = TransportMode("boat", max_speed=20)
+
+    stats = run_sharded([car, boat], hours=2, step_h=1, workers=2)
+    assert car.current_fuel == pytest.approx(1.0) and boat.current_fuel is None
+    assert (stats.distance_mi, stats.fuel_used_gal, stats.failures) == (160, pytest.approx(4.0), 0)
+    assert ShardStats(steps=2, failures=1).merge(ShardStats(steps=5, failures=2)) == ShardStats(steps=5, failures=3)
@@ -0,0 +1,96 @@
+import pytest
+from loguru import logger
+
+from src.core import registry_persistence
+from src.core.base_model import BaseModel
+from src.core.object_registry import ObjectRegistry
+from src.oop_labs import JetPlane, MotorVehicle
+from src.oop_labs.team import Team
+from src.oop_labs.vending_machine import VendingMachine
+
+
+class Gadget(BaseModel):
+    """Unslotted model: state lives in __dict__."""
+
+    def __init__(self, name: str, parts):
+        super().__init__(name=name)
+        self.parts = parts
+
+    def to_dict(self):
+        return {**super().to_dict(), "parts": self.parts}
+
+
+@pytest.fixture(autouse=True)
+def clean_registry(monkeypatch):
+    logger.disable("src")
+    monkeypatch.setattr(registry_persistence, "_baseline", None)
+    ObjectRegistry.clear()
+    yield
+    ObjectRegistry.clear()
+    logger.enable("src")
+
+
+def _population():
+    car = MotorVehicle("car", max_speed=120, horsepower=150)
+    car.configure_fuel_system(mpg=30, fuel_capacity=12)
+    car.add_fuel(10)
+    jet = JetPlane("F-22", 1500, wingspan=44, max_altitude=65_000)
+    jet.takeoff()
+    return [car, jet, Team("lab", wins=2), VendingMachine("vm", 5), Gadget("g", ["a", "b"])]
+
+
+def test_full_snapshot_restores_state_without_constructors(tmp_path, monkeypatch):
+    objects = _population()
+    expected = {o.id: o.to_dict() for o in objects}
+    info = ObjectRegistry.save(tmp_path / "full.snap")
+    assert (info.kind, info.objects) == ("full", 5)
+    ObjectRegistry.clear()
+
+    def no_init(self, *args, **kwargs):
+        raise AssertionError("__init__ must not run on restore")
+
+    for cls in (BaseModel, MotorVehicle, JetPlane, Team, VendingMachine, Gadget):
+        monkeypatch.setattr(cls, "__init__", no_init)
+    restored = ObjectRegistry.restore(tmp_path / "full.snap")
+
+    assert {o.id: o.to_dict() for o in restored} == expected
+    assert ObjectRegistry.count() == 5
+    jet = ObjectRegistry.get(objects[1].id)
+    assert jet is not objects[1] and ObjectRegistry.query(JetPlane, name="F-22") == [jet]
+
+
+def test_incremental_snapshots_hold_only_changes(tmp_path):
+    car, jet, team, vm, gadget = _population()
+    ObjectRegistry.save(tmp_path / "0.snap")
+    assert ObjectRegistry.save(tmp_path / "empty.snap", incremental=True).objects == 0
+
+    car.travel(30)
+    team.record_win()
+    ObjectRegistry.remove(vm.id)
+    extra = Team("new")
+    info = ObjectRegistry.save(tmp_path / "1.snap", incremental=True)
+    assert (info.objects, info.removed) == (3, 1)
+
+    jet.land()
+    ObjectRegistry.save(tmp_path / "2.snap", incremental=True)
+    expected = {o.id: o.to_dict() for o in (car, jet, team, gadget, extra)}
+
+    restored = ObjectRegistry.restore(tmp_path / "0.snap", tmp_path / "1.snap", tmp_path / "2.snap")
+    assert {o.id: o.to_dict() for o in restored} == expected
+    assert ObjectRegistry.get(vm.id) is None
+    # The restored state is the new baseline for further deltas.
+    assert ObjectRegistry.save(tmp_path / "3.snap", incremental=True).objects == 0
+
+    with pytest.raises(ValueError):
+        ObjectRegistry.restore(tmp_path / "1.snap")
+
+
+def test_incremental_snapshot_sees_changes_between_hash_colliding_values(tmp_path):
+    assert hash(-1) == hash(-2)
+    vm = VendingMachine("vm", -1)
+    ObjectRegistry.save(tmp_path / "0.snap")
+    vm.inventory = -2
+    assert ObjectRegistry.save(tmp_path / "1.snap", incremental=True).objects == 1
+
+    ObjectRegistry.restore(tmp_path / "0.snap", tmp_path / "1.snap")
+    assert ObjectRegistry.get(vm.id).inventory == -2
@@ -0,0 +1,79 @@
+import io
+import json
+
+import pytest
+from loguru import logger
+
+from src.core import serialization
+from src.core.base_model import BaseModel
+from src.core.object_registry import ObjectRegistry
+from src.core.serialization import dump_many, dumps, serialize, serializer_for
+from src.core.utils import safe_json_dumps
+from src.oop_labs import Airplane, JetPlane, MotorVehicle, Motorcycle, TransportMode
+from src.oop_labs.pet import Pet
+from src.oop_labs.team import Team
+from src.oop_labs.vending_machine import VendingMachine
+
+
+@pytest.fixture(autouse=True)
+def quiet():
+    logger.disable("src")
+    yield
+    logger.enable("src")
+    ObjectRegistry.clear()
+
+
+def _models():
+    car = MotorVehicle("car", max_speed=120, horsepower=150)
+    car.configure_ev_system(battery_kwh=75, efficiency_mi_per_kwh=3.5)
+    car.charge(40)
+    boat = TransportMode("boat", max_speed=40)
+    boat.configure_fuel_system(mpg=4, fuel_capacity=100)
+    boat.add_fuel(30)
+    team = Team("lab", wins=3, losses=1)
+    return [
+        car, boat, team,
+        Motorcycle("bike", 110, horsepower=53, weight_lbs=514),
+        Airplane("cessna", max_speed=188, wingspan=36),
+        JetPlane("F-22", 1500, wingspan=44, max_altitude=65_000),
+        Pet("rex", age=3),
+        VendingMachine("vm", initial_inventory=5),
+    ]
+
+
+def test_generated_serializers_match_to_dict():
+    models = _models()
+    for obj in models:
+        assert list(serialize(obj).items()) == list(obj.to_dict().items())
+        assert serializer_for(type(obj)) is not type(obj).to_dict  # generated, not the fallback
+    models[0].charge(10)
+    models[2].record_win()
+    assert serialize(models[0])["ev_range_estimate"] == models[0].remaining_range_ev()
+    assert serialize(models[2])["win_percentage"] == models[2].win_percentage
+
+
+def test_classes_it_cannot_reproduce_fall_back_to_to_dict():
+    class Odd(BaseModel):
+        def to_dict(self):
+            return {**super().to_dict(), "answer": 42}
+
+    odd = Odd("odd")
+    assert serialize(odd) == odd.to_dict() and serializer_for(Odd) is Odd.to_dict
+
+
+@pytest.mark.parametrize("backend", ["orjson", "stdlib"])
+def test_dump_many_streams_ndjson(monkeypatch, backend):
+    if backend == "stdlib":
+        monkeypatch.setattr(serialization, "orjson", None)
+    models = _models()
+
+    binary, text = io.BytesIO(), io.StringIO()
+    assert dump_many(models, binary, batch=3) == len(models)
+    dump_many(models, text, exclude_none=True)
+    rows = [json.loads(line) for line in binary.getvalue().decode().splitlines()]
+    assert rows == [json.loads(json.dumps(m.to_dict())) for m in models]
+    assert all(None not in row.values() for row in map(json.loads, text.getvalue().splitlines()))
+
+    assert json.loads(dumps(models[5])) == rows[5]
+    assert "\n" not in safe_json_dumps(models[5].to_dict(), compact=True)
+    assert safe_json_dumps({"b": 1, "a": 2}) == '{\n    "a": 2,\n    "b": 1\n}'
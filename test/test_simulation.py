@@ -0,0 +1,65 @@
+import pytest
+from loguru import logger
+
+from src.core.object_registry import ObjectRegistry
+from src.oop_labs import Airplane, JetPlane, MotorVehicle
+from src.oop_labs.simulation import Simulator
+
+
+@pytest.fixture(autouse=True)
+def quiet():
+    logger.disable("src")
+    yield
+    logger.enable("src")
+    ObjectRegistry.clear()
+
+
+def test_time_stepped_travel_burns_fuel_and_aborts_when_empty():
+    car = MotorVehicle("car", max_speed=60, horsepower=150)
+    car.configure_fuel_system(mpg=30, fuel_capacity=10)
+    car.add_fuel(4)
+    ev = MotorVehicle("ev", max_speed=60, horsepower=300)
+    ev.configure_ev_system(battery_kwh=10, efficiency_mi_per_kwh=4)
+    ev.charge(10)
+
+    sim = Simulator(step_h=0.5)
+    sim.schedule(0.0, "travel", car, 90)
+    sim.schedule(0.0, "travel", ev, 100)  # 40 mi of charge: aborts on the 2nd step
+    sim.run(until_h=0.75)  # steps burn fuel as they begin: at 0.0 and 0.5
+    assert sim.now == 0.75 and car.current_fuel == pytest.approx(2.0)
+
+    stats = sim.run()
+    assert sim.now == 1.5  # third 30 mi step ends at 1.5 h
+    assert car.current_fuel == pytest.approx(1.0)
+    assert (stats.trips_completed, stats.trips_aborted) == (1, 1)
+    assert stats.distance_mi == pytest.approx(120)
+    assert stats.fuel_used_gal == pytest.approx(3.0)
+    assert stats.charge_used_kwh == pytest.approx(7.5)
+
+
+def test_flight_events_run_in_time_order():
+    plane = Airplane("cessna", max_speed=120, wingspan=36, max_altitude=13_000)
+    jet = JetPlane("F-22", 1000, wingspan=44, max_altitude=65_000)
+    jet.configure_fuel_system(mpg=2, fuel_capacity=1000)
+    jet.add_fuel(1000)
+
+    sim = Simulator(step_h=1.0)
+    sim.schedule(2.0, "land", plane)
+    sim.schedule(1.0, "climb", plane, 5000)
+    sim.schedule(0.0, "takeoff", plane)
+    sim.schedule(1.5, "climb", plane, 20_000)  # above the ceiling: fails
+    sim.schedule(0.0, "takeoff", jet)
+    sim.schedule(0.0, "afterburner_on", jet)
+    sim.schedule(0.0, "travel", jet, 1250)
+    sim.run(until_h=1.5)
+    assert plane.in_air and plane.current_altitude == 6000
+
+    stats = sim.run()
+    assert not plane.in_air and stats.failed == 1
+    assert jet.mach_speed == pytest.approx(1250 / 767)
+    assert jet.current_fuel == pytest.approx(1000 - 1250 / 2)  # one 1250 mi step
+
+    with pytest.raises(ValueError):
+        sim.schedule(0.5, "land", plane)
+    with pytest.raises(ValueError):
+        sim.schedule(3.0, "arrive", plane)
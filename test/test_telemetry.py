@@ -0,0 +1,66 @@
+import pytest
+from loguru import logger
+
+from src.core import telemetry
+from src.core.object_registry import ObjectRegistry
+from src.oop_labs import Airplane, JetPlane, MotorVehicle
+
+
+@pytest.fixture
+def records():
+    seen = []
+    handler = logger.add(lambda m: seen.append(m.record), level="DEBUG")
+    yield seen
+    logger.remove(handler)
+    telemetry.configure(enabled=True, level="DEBUG", sample_every=1)
+    telemetry.enable(*telemetry.settings()["disabled"])
+    ObjectRegistry.clear()
+
+
+def _car():
+    car = MotorVehicle("car", max_speed=100, horsepower=150)
+    car.configure_fuel_system(mpg=30, fuel_capacity=10)
+    car.add_fuel(10)
+    return car
+
+
+def test_records_are_structured_and_attributed_to_the_model(records):
+    car = _car()
+    records.clear()
+    car.travel(30)
+    (rec,) = records
+    assert rec["message"] == "[TransportMode] car traveled 30 miles. Fuel remaining=9.00 gal"
+    assert rec["extra"] == {"name": "car", "distance": 30, "current_fuel": 9.0}
+    assert (rec["name"], rec["function"]) == ("src.oop_labs.transport_mode", "travel")
+
+
+def test_disable_per_class_globally_and_by_level(records):
+    jet = JetPlane("F-22", 1500, wingspan=44, max_altitude=65_000)
+    telemetry.disable(Airplane)
+    records.clear()
+    jet.takeoff()  # Airplane's method: silenced even on a JetPlane
+    jet.enable_afterburner()
+    assert [r["message"] for r in records] == ["[JetPlane] F-22 engaged afterburners! 🔥"]
+
+    telemetry.configure(level="WARNING")
+    records.clear()
+    jet.barrel_roll()  # WARNING
+    jet.immelmann()    # INFO
+    assert [r["level"].name for r in records] == ["WARNING"]
+
+    telemetry.configure(enabled=False)
+    records.clear()
+    jet.barrel_roll()
+    _car()
+    assert records == []
+
+
+def test_sampling_thins_info_but_keeps_warnings(records):
+    car = _car()
+    telemetry.configure(sample_every=10)
+    records.clear()
+    for _ in range(100):
+        car.travel(1)
+    car.travel(-1)
+    assert len([r for r in records if r["level"].name == "INFO"]) == 10
+    assert [r["level"].name for r in records].count("WARNING") == 1